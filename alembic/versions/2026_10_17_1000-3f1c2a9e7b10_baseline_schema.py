@@ -0,0 +1,45 @@
+"""baseline schema
+
+Revision ID: 3f1c2a9e7b10
+Revises:
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a9e7b10'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Таблицу tasks исходно создавал create_all при старте приложения: в такой базе
+    # ревизия ничего не делает, а пустую базу доводит до той же исходной схемы
+    if sa.inspect(op.get_bind()).has_table('tasks'):
+        return
+
+    op.create_table(
+        'tasks',
+        sa.Column('id', postgresql.UUID(as_uuid=True), primary_key=True, nullable=False),
+        sa.Column('title', sa.String(200), nullable=False),
+        sa.Column('description', sa.Text(), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+    )
+    op.create_index('idx_tasks_status', 'tasks', ['status'])
+    op.create_index('idx_tasks_created_at', 'tasks', ['created_at'])
+    op.create_index('idx_tasks_updated_at', 'tasks', ['updated_at'])
+    op.create_index('idx_tasks_title', 'tasks', ['title'])
+
+
+def downgrade() -> None:
+    # Не знаем, создала ли таблицу эта ревизия или create_all: данные не трогаем
+    pass
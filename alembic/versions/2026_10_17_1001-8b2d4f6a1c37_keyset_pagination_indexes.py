@@ -0,0 +1,51 @@
+"""keyset pagination indexes
+
+Revision ID: 8b2d4f6a1c37
+Revises: 3f1c2a9e7b10
+Create Date: 2026-10-17 10:01:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b2d4f6a1c37'
+down_revision: Union[str, None] = '3f1c2a9e7b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Составные индексы под каждое сочетание фильтра по статусу и сортировки списка
+KEYSET_INDEXES = {
+    'idx_tasks_created_at_id': '(created_at, id)',
+    'idx_tasks_updated_at_id': '(updated_at, id)',
+    'idx_tasks_status_created_at_id': '(status, created_at, id)',
+    'idx_tasks_status_updated_at_id': '(status, updated_at, id)',
+}
+
+# Одноколоночные индексы исходной схемы покрываются составными
+LEGACY_INDEXES = {
+    'idx_tasks_status': '(status)',
+    'idx_tasks_created_at': '(created_at)',
+    'idx_tasks_updated_at': '(updated_at)',
+}
+
+
+def upgrade() -> None:
+    # CONCURRENTLY не блокирует запись в tasks, но не работает внутри транзакции.
+    # Если построение прервалось, остается невалидный индекс, который IF NOT EXISTS
+    # пропустит: его нужно удалить и повторить миграцию
+    with op.get_context().autocommit_block():
+        for name, columns in KEYSET_INDEXES.items():
+            op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON tasks {columns}')
+        for name in LEGACY_INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in LEGACY_INDEXES.items():
+            op.execute(f'CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON tasks {columns}')
+        for name in KEYSET_INDEXES:
+            op.execute(f'DROP INDEX CONCURRENTLY IF EXISTS {name}')
@@ -0,0 +1,43 @@
+"""task search vector
+
+Revision ID: c57e9a3d2f84
+Revises: 8b2d4f6a1c37
+Create Date: 2026-10-17 10:02:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c57e9a3d2f84'
+down_revision: Union[str, None] = '8b2d4f6a1c37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('russian'::regconfig, title), 'A') || "
+    "setweight(to_tsvector('russian'::regconfig, description), 'B') || "
+    "setweight(to_tsvector('simple'::regconfig, title), 'C') || "
+    "setweight(to_tsvector('simple'::regconfig, description), 'D')"
+)
+
+
+def upgrade() -> None:
+    # Хранимая вычисляемая колонка переписывает таблицу под эксклюзивной блокировкой
+    op.execute(
+        'ALTER TABLE tasks ADD COLUMN IF NOT EXISTS search_vector tsvector '
+        f'GENERATED ALWAYS AS ({SEARCH_VECTOR_EXPRESSION}) STORED'
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tasks_search_vector '
+            'ON tasks USING gin (search_vector)'
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_tasks_search_vector')
+    op.execute('ALTER TABLE tasks DROP COLUMN IF EXISTS search_vector')
@@ -0,0 +1,33 @@
+"""task title trigram index
+
+Revision ID: 1d8f3b6c9e52
+Revises: c57e9a3d2f84
+Create Date: 2026-10-17 10:03:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1d8f3b6c9e52'
+down_revision: Union[str, None] = 'c57e9a3d2f84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Подсказки названий: word_similarity и оператор <% из pg_trgm
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    with op.get_context().autocommit_block():
+        op.execute(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tasks_title_trgm '
+            'ON tasks USING gin (title gin_trgm_ops)'
+        )
+
+
+def downgrade() -> None:
+    # Расширение оставляем: им могут пользоваться не только задачи
+    with op.get_context().autocommit_block():
+        op.execute('DROP INDEX CONCURRENTLY IF EXISTS idx_tasks_title_trgm')
@@ -0,0 +1,86 @@
+"""task counters
+
+Revision ID: 6a4e0c2d8b19
+Revises: 1d8f3b6c9e52
+Create Date: 2026-10-17 10:04:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6a4e0c2d8b19'
+down_revision: Union[str, None] = '1d8f3b6c9e52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TASK_COUNTER_SHARDS = 16
+
+COUNTER_DELTAS = {
+    'insert': 'SELECT status, 1 AS delta FROM new_rows',
+    'delete': 'SELECT status, -1 AS delta FROM old_rows',
+    'update': 'SELECT status, 1 AS delta FROM new_rows UNION ALL SELECT status, -1 AS delta FROM old_rows',
+}
+
+COUNTER_TRANSITIONS = {
+    'insert': 'REFERENCING NEW TABLE AS new_rows',
+    'delete': 'REFERENCING OLD TABLE AS old_rows',
+    'update': 'REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows',
+}
+
+
+def upgrade() -> None:
+    op.execute("""
+CREATE TABLE IF NOT EXISTS task_counters (
+    status VARCHAR(20) NOT NULL,
+    shard SMALLINT NOT NULL,
+    count BIGINT NOT NULL,
+    PRIMARY KEY (status, shard)
+)""")
+
+    for operation, deltas in COUNTER_DELTAS.items():
+        op.execute(f"""
+CREATE OR REPLACE FUNCTION task_counters_on_{operation}() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO task_counters (status, shard, count)
+    SELECT deltas.status, pg_backend_pid() % {TASK_COUNTER_SHARDS}, sum(deltas.delta)
+    FROM ({deltas}) AS deltas
+    GROUP BY deltas.status
+    HAVING sum(deltas.delta) <> 0
+    ORDER BY deltas.status
+    ON CONFLICT (status, shard) DO UPDATE SET count = task_counters.count + EXCLUDED.count;
+    RETURN NULL;
+END
+$$""")
+
+    op.execute("""
+CREATE OR REPLACE FUNCTION task_counters_on_truncate() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    DELETE FROM task_counters;
+    RETURN NULL;
+END
+$$""")
+
+    # Запись в tasks блокируется до конца миграции: триггеры и начальные значения
+    # счетчиков видят один и тот же снимок таблицы
+    op.execute('LOCK TABLE tasks IN SHARE ROW EXCLUSIVE MODE')
+    for operation in COUNTER_DELTAS:
+        op.execute(f"""
+CREATE OR REPLACE TRIGGER task_counters_{operation} AFTER {operation.upper()} ON tasks
+{COUNTER_TRANSITIONS[operation]}
+FOR EACH STATEMENT EXECUTE FUNCTION task_counters_on_{operation}()""")
+    op.execute("""
+CREATE OR REPLACE TRIGGER task_counters_truncate AFTER TRUNCATE ON tasks
+FOR EACH STATEMENT EXECUTE FUNCTION task_counters_on_truncate()""")
+
+    op.execute('DELETE FROM task_counters')
+    op.execute('INSERT INTO task_counters (status, shard, count) SELECT status, 0, count(*) FROM tasks GROUP BY status')
+
+
+def downgrade() -> None:
+    for operation in (*COUNTER_DELTAS, 'truncate'):
+        op.execute(f'DROP TRIGGER IF EXISTS task_counters_{operation} ON tasks')
+        op.execute(f'DROP FUNCTION IF EXISTS task_counters_on_{operation}()')
+    op.execute('DROP TABLE IF EXISTS task_counters')
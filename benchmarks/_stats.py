@@ -0,0 +1,23 @@
+"""Общие для бенчмарков расчеты: все отчеты считают перцентили одинаково."""
+import subprocess
+from typing import Optional, Sequence
+
+# Пишется в отчеты: результаты, посчитанные другим способом, сравнивать нельзя
+PERCENTILE_METHOD = "nearest-rank"
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Перцентиль по ближайшему рангу: всегда одно из измеренных значений"""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def git_commit() -> Optional[str]:
+    """Короткий хеш текущего коммита, чтобы прогоны можно было сравнивать между коммитами"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
@@ -0,0 +1,65 @@
+"""Задержка POST /api/tasks на работающем приложении.
+
+    python benchmarks/create_latency.py --base-url http://localhost:8000 --requests 2000 --concurrency 8
+
+Печатает JSON с p50/p95/p99 и пропускной способностью.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+
+import httpx
+
+from _stats import percentile
+
+
+async def run(base_url: str, total: int, concurrency: int, warmup: int) -> dict:
+    latencies = []
+    errors = 0
+    counter = iter(range(total + warmup))
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=30) as client:
+        async def worker():
+            nonlocal errors
+            for number in counter:
+                started = time.perf_counter()
+                response = await client.post("/api/tasks", json={"title": f"Бенчмарк {number}"})
+                elapsed = time.perf_counter() - started
+                if number < warmup:
+                    continue
+                if response.status_code != 201:
+                    errors += 1
+                latencies.append(elapsed * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        duration = time.perf_counter() - started
+
+    return {
+        "requests": len(latencies),
+        "concurrency": concurrency,
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / duration, 1),
+        "mean_ms": round(statistics.fmean(latencies), 3),
+        "p50_ms": round(percentile(latencies, 50), 3),
+        "p95_ms": round(percentile(latencies, 95), 3),
+        "p99_ms": round(percentile(latencies, 99), 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--warmup", type=int, default=100)
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args.base_url, args.requests, args.concurrency, args.warmup))
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,382 @@
+"""Микробенчмарки кода, который выполняется на каждом запросе: домен, сериализация, репозиторий.
+
+    python benchmarks/hot_paths.py                                   # все случаи, размеры 1, 100, 10k, 100k
+    python benchmarks/hot_paths.py --no-db --sizes 1,100 -k task.    # только домен, без БД
+    python benchmarks/hot_paths.py --save hot_paths                  # записать baseline
+    python benchmarks/hot_paths.py --compare hot_paths               # сравнить с baseline
+
+Каждый случай регистрируется через @benchmark и параметризуется размером — числом задач,
+которые он обрабатывает за вызов. Время — как у pytest-benchmark: несколько раундов, в раунде
+столько итераций, чтобы он длился не меньше --min-round-ms; в отчете min/median/mean/stddev
+на вызов и нс на задачу по медиане. Память — отдельный вызов под tracemalloc: пик и сколько
+осталось занято, пока жив результат, в байтах на задачу.
+
+Случаи repository.* идут в локальную БД на одном соединении внутри транзакции, которая
+в конце откатывается: перед каждым размером tasks очищается (TRUNCATE, таблица заблокирована
+до конца прогона), так что в ней ровно size строк. --no-db их пропускает.
+
+Baseline хранится в benchmarks/baselines/<имя>.json вместе с коммитом, машиной (python,
+CPU, память) и способом расчета перцентилей. При --compare к каждому случаю добавляется
+отношение медианы и пика памяти к baseline; если медиана хоть одного случая хуже больше
+чем на --fail-threshold, скрипт завершается с кодом 1. Baseline с другим способом расчета
+не сравнивается. Сравнение осмысленно только на той же машине: baseline в репозитории
+записан на 1 CPU.
+"""
+import argparse
+import asyncio
+import gc
+import inspect
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
+
+from _stats import PERCENTILE_METHOD, git_commit, percentile  # noqa: E402
+from src.core.database.config import engine, init_database  # noqa: E402
+from src.task.api.models import TaskListResponse, TaskResponse  # noqa: E402
+from src.task.domain.entities import Task, TaskStatus  # noqa: E402
+from src.task.domain.queries import TaskListQuery, TaskSearchQuery  # noqa: E402
+from src.task.infrastructure.db.repository import DatabaseTaskRepository  # noqa: E402
+
+BASELINES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines")
+DEFAULT_SIZES = (1, 100, 10_000, 100_000)
+PAGE_LIMIT = 100
+MAX_LOOKUPS = 1000
+
+
+@dataclass
+class Bench:
+    """Подготовленный случай: fn вызывается на каждой итерации, setup — перед каждым раундом.
+
+    Если setup задан, в раунде одна итерация и fn получает результат setup;
+    items — сколько задач обрабатывает один вызов fn.
+    """
+    fn: Callable
+    items: int
+    setup: Optional[Callable] = None
+    teardown: Optional[Callable] = None
+
+
+BENCHMARKS: Dict[str, Callable] = {}
+DB_BENCHMARKS = set()
+
+
+def benchmark(name: str, db: bool = False):
+    def register(factory):
+        BENCHMARKS[name] = factory
+        if db:
+            DB_BENCHMARKS.add(name)
+        return factory
+    return register
+
+
+def timing_summary(samples: List[float]) -> dict:
+    return {
+        "min_us": round(min(samples) * 1e6, 3),
+        "median_us": round(percentile(samples, 50) * 1e6, 3),
+        "mean_us": round(statistics.fmean(samples) * 1e6, 3),
+        "stddev_us": round(statistics.stdev(samples) * 1e6, 3) if len(samples) > 1 else 0.0,
+    }
+
+
+def build_rows(count: int) -> list:
+    started = datetime(2024, 1, 1)
+    statuses = [status.value for status in TaskStatus]
+    return [
+        (
+            str(uuid.uuid4()),
+            f"Задача номер {number}",
+            "Описание задачи " * (number % 20),
+            statuses[number % len(statuses)],
+            started + timedelta(seconds=number),
+            started + timedelta(seconds=number, minutes=5),
+        )
+        for number in range(count)
+    ]
+
+
+def build_tasks(count: int) -> List[Task]:
+    return [
+        Task.from_trusted(id, title, description, TaskStatus(status), created_at, updated_at)
+        for id, title, description, status, created_at, updated_at in build_rows(count)
+    ]
+
+
+# Домен и сериализация: БД не нужна
+
+@benchmark("task.validate")
+def task_validate(size: int) -> Bench:
+    rows = [
+        (id, title, description, TaskStatus(status), created_at, updated_at)
+        for id, title, description, status, created_at, updated_at in build_rows(size)
+    ]
+    return Bench(lambda: [Task(*row) for row in rows], size)
+
+
+@benchmark("task.create")
+def task_create(size: int) -> Bench:
+    titles = [f"  Задача номер {number}  " for number in range(size)]
+    return Bench(lambda: [Task.create(title, "Описание задачи") for title in titles], size)
+
+
+@benchmark("repository._rows_to_domain")
+def rows_to_domain(size: int) -> Bench:
+    repository = DatabaseTaskRepository(session=None)
+    rows = [(uuid.UUID(row[0]),) + row[1:] for row in build_rows(size)]
+    return Bench(lambda: repository._rows_to_domain(rows), size)
+
+
+@benchmark("TaskResponse.from_domain")
+def task_response_from_domain(size: int) -> Bench:
+    tasks = build_tasks(size)
+    return Bench(lambda: [TaskResponse.from_domain(task) for task in tasks], size)
+
+
+@benchmark("TaskListResponse.from_domain_list")
+def task_list_response_from_domain_list(size: int) -> Bench:
+    tasks = build_tasks(size)
+    return Bench(lambda: TaskListResponse.from_domain_list(tasks), size)
+
+
+# Репозиторий: локальная БД, в tasks ровно size строк
+
+@benchmark("repository.create_many", db=True)
+def repository_create_many(size: int, session: AsyncSession) -> Bench:
+    repository = DatabaseTaskRepository(session)
+    return Bench(repository.create_many, size, setup=lambda: build_tasks(size), teardown=lambda: truncate(session))
+
+
+@benchmark("repository.get_all", db=True)
+def repository_get_all(size: int, session: AsyncSession) -> Bench:
+    return Bench(DatabaseTaskRepository(session).get_all, size)
+
+
+@benchmark("repository.get_page", db=True)
+def repository_get_page(size: int, session: AsyncSession) -> Bench:
+    """Проход по всем страницам по курсору"""
+    repository = DatabaseTaskRepository(session)
+
+    async def walk():
+        page = await repository.get_page(TaskListQuery(limit=PAGE_LIMIT))
+        while page.next_cursor is not None:
+            page = await repository.get_page(TaskListQuery(limit=PAGE_LIMIT, cursor=page.next_cursor))
+
+    return Bench(walk, size)
+
+
+@benchmark("repository.get_by_id", db=True)
+def repository_get_by_id(size: int, session: AsyncSession) -> Bench:
+    repository = DatabaseTaskRepository(session)
+
+    async def lookups(ids):
+        for task_id in ids:
+            await repository.get_by_id(task_id)
+
+    async def pick_ids():
+        result = await session.execute(text("SELECT id::text FROM tasks LIMIT :limit"), {"limit": MAX_LOOKUPS})
+        return result.scalars().all()
+
+    return Bench(lookups, min(size, MAX_LOOKUPS), setup=pick_ids)
+
+
+@benchmark("repository.search", db=True)
+def repository_search(size: int, session: AsyncSession) -> Bench:
+    repository = DatabaseTaskRepository(session)
+    return Bench(lambda: repository.search(TaskSearchQuery(text="описание задачи", limit=PAGE_LIMIT)), 1)
+
+
+@benchmark("repository.get_statistics", db=True)
+def repository_get_statistics(size: int, session: AsyncSession) -> Bench:
+    return Bench(DatabaseTaskRepository(session).get_statistics, 1)
+
+
+async def call(fn: Callable, *args) -> Any:
+    result = fn(*args)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def truncate(session: AsyncSession) -> None:
+    await session.execute(text("TRUNCATE tasks, task_counters"))
+
+
+async def measure(bench: Bench, min_rounds: int, max_seconds: float, min_round_seconds: float) -> dict:
+    iterations = 1
+    if bench.setup is None:
+        started = time.perf_counter()
+        await call(bench.fn)
+        single = time.perf_counter() - started
+        iterations = max(1, int(min_round_seconds / single)) if single > 0 else 1
+
+    gc.collect()
+    samples = []
+    budget_ends = time.perf_counter() + max_seconds
+    while len(samples) < min_rounds or time.perf_counter() < budget_ends:
+        argument = () if bench.setup is None else (await call(bench.setup),)
+        started = time.perf_counter()
+        for _ in range(iterations):
+            await call(bench.fn, *argument)
+        samples.append((time.perf_counter() - started) / iterations)
+        if bench.teardown is not None:
+            await call(bench.teardown)
+
+    result = {"rounds": len(samples), "iterations": iterations, **timing_summary(samples)}
+    result["ns_per_item"] = round(percentile(samples, 50) * 1e9 / bench.items, 1)
+    return result
+
+
+async def measure_memory(bench: Bench) -> dict:
+    argument = () if bench.setup is None else (await call(bench.setup),)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = await call(bench.fn, *argument)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    if bench.teardown is not None:
+        await call(bench.teardown)
+    return {
+        "peak_kib": round((peak - before) / 1024, 1),
+        "retained_bytes_per_item": round((current - before) / bench.items, 1),
+    }
+
+
+async def run_case(name: str, bench: Bench, args) -> dict:
+    timing = await measure(bench, args.min_rounds, args.max_seconds, args.min_round_ms / 1000)
+    return {"name": name, "items": bench.items, **timing, **await measure_memory(bench)}
+
+
+async def run(args) -> Dict[str, dict]:
+    names = [name for name in BENCHMARKS if any(pattern in name for pattern in args.k)]
+    results = {}
+    for name in names:
+        if name in DB_BENCHMARKS:
+            continue
+        for size in args.sizes:
+            results[f"{name}[{size}]"] = await run_case(name, BENCHMARKS[name](size), args)
+
+    db_names = [name for name in names if name in DB_BENCHMARKS]
+    if db_names and not args.no_db:
+        await init_database()
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            session = AsyncSession(bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False)
+            try:
+                for size in args.sizes:
+                    await truncate(session)
+                    for name in db_names:
+                        if name == "repository.create_many":
+                            results[f"{name}[{size}]"] = await run_case(name, BENCHMARKS[name](size, session), args)
+                    await DatabaseTaskRepository(session).create_many(build_tasks(size))
+                    await session.execute(text("ANALYZE tasks"))
+                    for name in db_names:
+                        if name != "repository.create_many":
+                            results[f"{name}[{size}]"] = await run_case(name, BENCHMARKS[name](size, session), args)
+            finally:
+                await session.close()
+                await transaction.rollback()
+        await engine.dispose()
+    return results
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[str]:
+    regressions = []
+    for key, result in results.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        result["median_vs_baseline"] = round(result["median_us"] / reference["median_us"], 3)
+        if reference["peak_kib"] > 0:
+            result["peak_vs_baseline"] = round(result["peak_kib"] / reference["peak_kib"], 3)
+        if result["median_vs_baseline"] > 1 + threshold:
+            regressions.append(key)
+    return regressions
+
+
+def machine_info() -> Dict[str, Any]:
+    cpu_model = platform.processor() or None
+    if os.path.exists("/proc/cpuinfo"):
+        with open("/proc/cpuinfo", encoding="utf-8") as file:
+            models = [line.split(":", 1)[1].strip() for line in file if line.startswith("model name")]
+        cpu_model = models[0] if models else cpu_model
+    try:
+        memory_gib = round(os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") / 2 ** 30, 1)
+    except (ValueError, OSError, AttributeError):
+        memory_gib = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_model": cpu_model,
+        "cpus": os.cpu_count(),
+        "memory_gib": memory_gib,
+    }
+
+
+def baseline_path(name: str) -> str:
+    return os.path.join(BASELINES_DIR, f"{name}.json")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        type=lambda value: [int(size) for size in value.split(",")])
+    parser.add_argument("-k", action="append", default=None, help="подстрока имени случая, можно несколько")
+    parser.add_argument("--no-db", action="store_true", help="пропустить случаи repository.* с БД")
+    parser.add_argument("--min-rounds", type=int, default=5)
+    parser.add_argument("--max-seconds", type=float, default=1.0, help="время на случай сверх --min-rounds")
+    parser.add_argument("--min-round-ms", type=float, default=5.0)
+    parser.add_argument("--save", metavar="NAME", help="записать результат как baseline NAME")
+    parser.add_argument("--compare", metavar="NAME", help="сравнить с baseline NAME")
+    parser.add_argument("--fail-threshold", type=float, default=0.2, help="допустимое ухудшение медианы, доля")
+    args = parser.parse_args()
+    args.k = args.k or [""]
+
+    results = asyncio.run(run(args))
+    report = {
+        "commit": git_commit(),
+        "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "percentile_method": PERCENTILE_METHOD,
+        "machine": machine_info(),
+        "benchmarks": results,
+    }
+
+    regressions = []
+    if args.compare:
+        with open(baseline_path(args.compare), encoding="utf-8") as file:
+            baseline = json.load(file)
+        report["baseline"] = {
+            "name": args.compare, "commit": baseline.get("commit"), "machine": baseline.get("machine")
+        }
+        if baseline.get("percentile_method") != PERCENTILE_METHOD:
+            sys.exit(f"baseline {args.compare} посчитан другим способом ({baseline.get('percentile_method')}), "
+                     f"перезапишите его через --save")
+        regressions = compare(results, baseline["benchmarks"], args.fail_threshold)
+        report["regressions"] = regressions
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.save:
+        os.makedirs(BASELINES_DIR, exist_ok=True)
+        with open(baseline_path(args.save), "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    print(output)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Сериализация страницы задач: TaskListResponse (Pydantic) против TaskListJSONResponse.
+
+    python benchmarks/list_serialization.py --tasks 500 --repeat 200
+
+Замеряет два уровня:
+  serialize — только построение тела ответа из TaskPage;
+  endpoint  — GET /api/tasks целиком через ASGI, репозиторий подменен и отдает готовую страницу.
+Печатает JSON с p50/p95 по каждому варианту и ускорением по p50.
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import time
+from unittest.mock import AsyncMock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import httpx  # noqa: E402
+
+from _stats import percentile  # noqa: E402
+
+import src.task.api.rest as rest  # noqa: E402
+from main import app  # noqa: E402
+from src.task.api.dependencies import get_task_repository  # noqa: E402
+from src.task.api.models import TaskListResponse  # noqa: E402
+from src.task.api.responses import TaskListJSONResponse  # noqa: E402
+from src.task.domain.entities import Task  # noqa: E402
+from src.task.domain.queries import (  # noqa: E402
+    SortDirection, TaskCount, TaskCountMode, TaskCursor, TaskPage, TaskSortField
+)
+
+
+def summary(samples):
+    return {
+        "p50_ms": round(percentile(samples, 50), 3),
+        "p95_ms": round(percentile(samples, 95), 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+    }
+
+
+def build_page(size: int) -> TaskPage:
+    tasks = [
+        Task.create(title=f"Задача номер {number}", description="Описание задачи " * 8)
+        for number in range(size)
+    ]
+    return TaskPage(
+        tasks=tasks,
+        next_cursor=TaskCursor.from_task(tasks[-1], TaskSortField.CREATED_AT, SortDirection.DESC),
+        total=TaskCount(value=size * 10, mode=TaskCountMode.EXACT)
+    )
+
+
+def time_serialize(page: TaskPage, repeat: int) -> dict:
+    variants = {
+        "pydantic": lambda: TaskListResponse.from_domain_page(page).model_dump_json(),
+        "fast": lambda: TaskListJSONResponse(page).body,
+    }
+    report = {}
+    for name, serialize in variants.items():
+        serialize()
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            serialize()
+            samples.append((time.perf_counter() - started) * 1000)
+        report[name] = summary(samples)
+    return report
+
+
+async def time_endpoint(page: TaskPage, repeat: int) -> dict:
+    repository = AsyncMock()
+    repository.get_page.return_value = page
+    app.dependency_overrides[get_task_repository] = lambda: repository
+
+    report = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name, enabled in (("pydantic", False), ("fast", True)):
+            rest.FAST_JSON_ENABLED = enabled
+            await client.get("/api/tasks", params={"count": "none"})
+            samples = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                response = await client.get("/api/tasks", params={"count": "none"})
+                samples.append((time.perf_counter() - started) * 1000)
+                response.raise_for_status()
+            report[name] = summary(samples)
+
+    app.dependency_overrides.clear()
+    return report
+
+
+def with_speedup(report: dict) -> dict:
+    report["speedup_p50"] = round(report["pydantic"]["p50_ms"] / report["fast"]["p50_ms"], 2)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    page = build_page(args.tasks)
+    result = {
+        "tasks": args.tasks,
+        "repeat": args.repeat,
+        "serialize": with_speedup(time_serialize(page, args.repeat)),
+        "endpoint": with_speedup(asyncio.run(time_endpoint(page, args.repeat))),
+    }
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
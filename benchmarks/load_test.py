@@ -0,0 +1,284 @@
+"""Нагрузочный тест работающего приложения смешанными профилями запросов.
+
+    python benchmarks/load_test.py --profile read-heavy --rate 200 --duration 30
+    python benchmarks/load_test.py --profile write-heavy --concurrency 16 --duration 30 --output write.json
+
+Профили задают доли операций (см. PROFILES): read-heavy — в основном GET задачи,
+write-heavy — создание, обновление и удаление, list-heavy — страницы списка, переходы
+по курсору, поиск и статистика. Перед замером через /api/tasks/bulk создаются --seed задач,
+по которым ходят чтения; тест пишет в базу и созданное не удаляет.
+
+Режимы:
+  --rate R         открытый цикл: запросы приходят с частотой R в секунду (пуассоновский поток,
+                   --uniform — равномерный) независимо от того, ответил ли сервер. Задержка
+                   считается от запланированного момента отправки, поэтому очередь на стороне
+                   клиента при перегрузке сервера входит в замер;
+  --concurrency N  закрытый цикл: N воркеров, каждый шлет следующий запрос после ответа.
+
+Печатает JSON с p50/p95/p99, пропускной способностью и долей ошибок — всего и по операциям —
+и коммитом, на котором запущен тест, чтобы прогоны можно было сравнивать между коммитами.
+"""
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from typing import Dict, List
+
+import httpx
+
+from _stats import git_commit, percentile
+
+PROFILES: Dict[str, Dict[str, int]] = {
+    "read-heavy": {"get": 70, "list": 15, "search": 5, "create": 5, "update": 5},
+    "write-heavy": {"create": 40, "update": 35, "get": 15, "delete": 10},
+    "list-heavy": {"list": 50, "list_next": 15, "search": 20, "stats": 10, "get": 5},
+}
+
+STATUSES = ("создано", "в работе", "завершено")
+WORDS = ("отчет", "встреча", "релиз", "бюджет", "клиент", "договор", "дизайн", "тестирование")
+SEED_CHUNK = 1000
+MAX_CURSORS = 100
+
+
+def summary(latencies: List[float], errors: int, statuses: Counter, duration: float) -> dict:
+    result = {
+        "requests": len(latencies),
+        "errors": errors,
+        "error_rate": round(errors / len(latencies), 4) if latencies else 0.0,
+        "throughput_rps": round(len(latencies) / duration, 1),
+        "statuses": dict(sorted(statuses.items())),
+    }
+    if latencies:
+        result.update({
+            "mean_ms": round(statistics.fmean(latencies), 3),
+            "p50_ms": round(percentile(latencies, 50), 3),
+            "p95_ms": round(percentile(latencies, 95), 3),
+            "p99_ms": round(percentile(latencies, 99), 3),
+            "max_ms": round(max(latencies), 3),
+        })
+    return result
+
+
+def task_payload(rng: random.Random, number: int) -> dict:
+    return {
+        "title": f"{rng.choice(WORDS)} {rng.choice(WORDS)} №{number}",
+        "description": " ".join(rng.choice(WORDS) for _ in range(12)),
+    }
+
+
+class Workload:
+    """Операции профиля и общее между ними состояние: известные задачи и курсоры страниц"""
+
+    def __init__(self, client: httpx.AsyncClient, profile: Dict[str, int], rng: random.Random):
+        self.client = client
+        self.rng = rng
+        self.operations = list(profile)
+        self.weights = list(profile.values())
+        self.task_ids: List[str] = []
+        self.created_ids: List[str] = []
+        # Курсор действителен только с фильтром и размером страницы, с которыми выдан
+        self.cursors: List[dict] = []
+        self.counter = 0
+
+    async def seed(self, count: int) -> None:
+        for start in range(0, count, SEED_CHUNK):
+            tasks = [task_payload(self.rng, number) for number in range(start, min(start + SEED_CHUNK, count))]
+            response = await self.client.post("/api/tasks/bulk", json={"tasks": tasks})
+            response.raise_for_status()
+            self.task_ids.extend(item["task"]["id"] for item in response.json()["results"] if item["success"])
+        if not self.task_ids:
+            response = await self.client.get("/api/tasks", params={"limit": 100})
+            response.raise_for_status()
+            self.task_ids.extend(task["id"] for task in response.json()["tasks"])
+
+    def choose(self) -> str:
+        return self.rng.choices(self.operations, self.weights)[0]
+
+    async def call(self, operation: str) -> httpx.Response:
+        return await getattr(self, f"op_{operation}")()
+
+    async def op_get(self) -> httpx.Response:
+        if not self.task_ids:
+            return await self.op_create()
+        return await self.client.get(f"/api/tasks/{self.rng.choice(self.task_ids)}")
+
+    async def op_list(self) -> httpx.Response:
+        params = {"limit": self.rng.choice((20, 50, 100))}
+        if self.rng.random() < 0.3:
+            params["status"] = self.rng.choice(STATUSES)
+        response = await self.client.get("/api/tasks", params=params)
+        if response.status_code == 200:
+            cursor = response.json().get("next_cursor")
+            if cursor and len(self.cursors) < MAX_CURSORS:
+                self.cursors.append({**params, "cursor": cursor})
+        return response
+
+    async def op_list_next(self) -> httpx.Response:
+        if not self.cursors:
+            return await self.op_list()
+        params = self.cursors.pop(self.rng.randrange(len(self.cursors)))
+        return await self.client.get("/api/tasks", params=params)
+
+    async def op_search(self) -> httpx.Response:
+        return await self.client.get("/api/tasks/search", params={"q": self.rng.choice(WORDS)})
+
+    async def op_stats(self) -> httpx.Response:
+        return await self.client.get("/api/tasks/stats")
+
+    async def op_create(self) -> httpx.Response:
+        self.counter += 1
+        response = await self.client.post("/api/tasks", json=task_payload(self.rng, self.counter))
+        if response.status_code == 201:
+            task_id = response.json()["id"]
+            self.task_ids.append(task_id)
+            self.created_ids.append(task_id)
+        return response
+
+    async def op_update(self) -> httpx.Response:
+        if not self.task_ids:
+            return await self.op_create()
+        self.counter += 1
+        task_id = self.rng.choice(self.task_ids)
+        return await self.client.put(f"/api/tasks/{task_id}", json=task_payload(self.rng, self.counter))
+
+    async def op_delete(self) -> httpx.Response:
+        # Удаляются только созданные в ходе теста задачи, засеянные остаются для чтений
+        if not self.created_ids:
+            return await self.op_create()
+        task_id = self.created_ids.pop(self.rng.randrange(len(self.created_ids)))
+        self.task_ids.remove(task_id)
+        return await self.client.delete(f"/api/tasks/{task_id}")
+
+
+class Recorder:
+    def __init__(self, measure_from: float):
+        self.measure_from = measure_from
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Counter = Counter()
+        self.statuses: Dict[str, Counter] = defaultdict(Counter)
+        self.send_lag: List[float] = []
+
+    async def issue(self, workload: Workload, operation: str, scheduled: float) -> None:
+        sent = time.perf_counter()
+        try:
+            response = await workload.call(operation)
+            status = str(response.status_code)
+            failed = response.status_code >= 400
+        except httpx.HTTPError as e:
+            status = type(e).__name__
+            failed = True
+        finished = time.perf_counter()
+        if scheduled < self.measure_from:
+            return
+        self.latencies[operation].append((finished - scheduled) * 1000)
+        self.send_lag.append((sent - scheduled) * 1000)
+        self.statuses[operation][status] += 1
+        if failed:
+            self.errors[operation] += 1
+
+    def result(self, duration: float) -> dict:
+        all_latencies = [value for values in self.latencies.values() for value in values]
+        all_statuses = sum(self.statuses.values(), Counter())
+        return {
+            "total": summary(all_latencies, sum(self.errors.values()), all_statuses, duration),
+            "operations": {
+                operation: summary(self.latencies[operation], self.errors[operation], self.statuses[operation], duration)
+                for operation in sorted(self.latencies)
+            },
+            "client_send_lag_p99_ms": round(percentile(self.send_lag, 99), 3) if self.send_lag else None,
+        }
+
+
+async def open_loop(workload: Workload, recorder: Recorder, rate: float, until: float,
+                    uniform: bool, max_in_flight: int) -> int:
+    in_flight = set()
+    skipped = 0
+    scheduled = time.perf_counter()
+    while scheduled < until:
+        delay = scheduled - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if len(in_flight) >= max_in_flight:
+            skipped += 1
+        else:
+            task = asyncio.create_task(recorder.issue(workload, workload.choose(), scheduled))
+            in_flight.add(task)
+            task.add_done_callback(in_flight.discard)
+        scheduled += 1 / rate if uniform else workload.rng.expovariate(rate)
+    await asyncio.gather(*in_flight)
+    return skipped
+
+
+async def closed_loop(workload: Workload, recorder: Recorder, concurrency: int, until: float) -> None:
+    async def worker():
+        while time.perf_counter() < until:
+            await recorder.issue(workload, workload.choose(), time.perf_counter())
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+
+async def run(args) -> dict:
+    limits = httpx.Limits(max_connections=args.max_in_flight, max_keepalive_connections=args.max_in_flight)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        workload = Workload(client, PROFILES[args.profile], random.Random(args.random_seed))
+        await workload.seed(args.seed)
+
+        started = time.perf_counter()
+        recorder = Recorder(measure_from=started + args.warmup)
+        until = started + args.warmup + args.duration
+        skipped = 0
+        if args.rate:
+            skipped = await open_loop(workload, recorder, args.rate, until, args.uniform, args.max_in_flight)
+        else:
+            await closed_loop(workload, recorder, args.concurrency, until)
+        duration = min(time.perf_counter(), until) - recorder.measure_from
+
+    result = {
+        "commit": git_commit(),
+        "started_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "base_url": args.base_url,
+        "profile": args.profile,
+        "mix": PROFILES[args.profile],
+        "mode": "open" if args.rate else "closed",
+        "offered_rps": args.rate,
+        "concurrency": None if args.rate else args.concurrency,
+        "duration_s": round(duration, 3),
+        "seeded_tasks": len(workload.task_ids) - len(workload.created_ids),
+    }
+    if args.rate:
+        result["skipped_max_in_flight"] = skipped
+    result.update(recorder.result(duration))
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--profile", choices=sorted(PROFILES), default="read-heavy")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--rate", type=float, help="открытый цикл: запросов в секунду")
+    mode.add_argument("--concurrency", type=int, default=8, help="закрытый цикл: число воркеров")
+    parser.add_argument("--uniform", action="store_true", help="равномерные интервалы вместо пуассоновских")
+    parser.add_argument("--duration", type=float, default=30, help="секунд замера")
+    parser.add_argument("--warmup", type=float, default=5, help="секунд прогрева, не входят в замер")
+    parser.add_argument("--seed", type=int, default=1000, help="задач, создаваемых перед замером")
+    parser.add_argument("--max-in-flight", type=int, default=256, help="предел одновременных запросов")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--random-seed", type=int, default=0)
+    parser.add_argument("--output", help="файл, куда дополнительно записать JSON")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    output = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
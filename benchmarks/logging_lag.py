@@ -0,0 +1,125 @@
+"""Задержка event loop при логгировании: обработчики в потоке запроса против QueueHandler/QueueListener.
+
+    python benchmarks/logging_lag.py --records 20000 --sink-delay-ms 0.2
+
+В event loop работают монитор (спит по 1 мс и меряет, насколько проспал) и нагрузка,
+которая пишет записи в логгер пачками с уступкой управления между пачками. Обработчики —
+как у приложения: RotatingFileHandler с detailed-форматом во временном каталоге;
+--sink-delay-ms добавляет к каждой записи паузу медленного диска.
+Варианты: direct — обработчики на логгере; queue-drop и queue-block — через BoundedQueueHandler.
+Печатает JSON с p50/p99/max задержки цикла, стоимостью вызова логгера и числом потерянных записей.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import queue
+import sys
+import tempfile
+import time
+from logging.handlers import RotatingFileHandler
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _stats import percentile  # noqa: E402
+from src.core.logging.queue import BoundedQueueHandler, DrainingQueueListener  # noqa: E402
+
+DETAILED_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s"
+
+
+class SlowDiskHandler(RotatingFileHandler):
+    def __init__(self, filename: str, delay: float):
+        super().__init__(filename, maxBytes=10 * 1024 * 1024, backupCount=2, encoding="utf-8")
+        self.delay = delay
+
+    def emit(self, record):
+        if self.delay:
+            time.sleep(self.delay)
+        super().emit(record)
+
+
+async def monitor_lag(stop: asyncio.Event, samples: list) -> None:
+    interval = 0.001
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append((time.perf_counter() - started - interval) * 1000)
+
+
+async def produce(logger: logging.Logger, records: int, batch: int, call_ns: list) -> None:
+    for start in range(0, records, batch):
+        started = time.perf_counter_ns()
+        for number in range(start, min(start + batch, records)):
+            logger.info("Задача %s обновлена: статус %s", number, "in_progress")
+        call_ns.append((time.perf_counter_ns() - started) / min(batch, records - start))
+        await asyncio.sleep(0)
+
+
+async def run_variant(name: str, args, directory: str) -> dict:
+    sink = SlowDiskHandler(os.path.join(directory, f"{name}.log"), args.sink_delay_ms / 1000)
+    sink.setFormatter(logging.Formatter(DETAILED_FORMAT))
+
+    logger = logging.getLogger(f"benchmarks.logging_lag.{name}")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+
+    listener = None
+    handler = sink
+    if name != "direct":
+        log_queue = queue.Queue(maxsize=args.queue_size)
+        handler = BoundedQueueHandler(log_queue, policy=name.split("-")[1], block_timeout=args.block_timeout)
+        listener = DrainingQueueListener(log_queue, sink, respect_handler_level=True)
+        listener.start()
+    logger.handlers = [handler]
+
+    lag_ms, call_ns = [], []
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(monitor_lag(stop, lag_ms))
+    started = time.perf_counter()
+    await produce(logger, args.records, args.batch, call_ns)
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await monitor
+
+    drain_started = time.perf_counter()
+    if listener is not None:
+        listener.stop()
+    sink.close()
+
+    return {
+        "loop_lag_p50_ms": round(percentile(lag_ms, 50), 3),
+        "loop_lag_p99_ms": round(percentile(lag_ms, 99), 3),
+        "loop_lag_max_ms": round(max(lag_ms), 3),
+        "log_call_p50_us": round(percentile(call_ns, 50) / 1000, 2),
+        "produce_seconds": round(elapsed, 3),
+        "drain_seconds": round(time.perf_counter() - drain_started, 3),
+        "dropped": getattr(handler, "dropped", 0),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--batch", type=int, default=20, help="записей между уступками управления")
+    parser.add_argument("--sink-delay-ms", type=float, default=0.0)
+    parser.add_argument("--queue-size", type=int, default=10000)
+    parser.add_argument("--block-timeout", type=float, default=1.0)
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name in ("direct", "queue-drop", "queue-block"):
+            results[name] = await run_variant(name, args, directory)
+
+    print(json.dumps({
+        "records": args.records,
+        "batch": args.batch,
+        "sink_delay_ms": args.sink_delay_ms,
+        "queue_size": args.queue_size,
+        "results": results,
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+"""Чтение задач: ORM-сущности DBTask против Core select(колонки) с маппингом Row в Task.
+
+    python benchmarks/read_paths.py --rows 100000 --repeat 5
+
+Заполняет таблицу tasks до --rows строк (если их меньше) и для каждого пути
+читает все строки в доменные Task:
+  orm  — select(DBTask), scalars() и Task.from_trusted по атрибутам: identity map и состояние на каждую строку;
+  core — DatabaseTaskRepository.get_all: select(*колонки) и _rows_to_domain по позиции.
+Печатает JSON со строками в секунду и p50 по проходам. Сессия новая на каждый проход,
+чтобы identity map ORM не переиспользовался между ними.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func, select, text  # noqa: E402
+
+from _stats import percentile  # noqa: E402
+from src.core.database.config import async_session_maker, engine, init_database  # noqa: E402
+from src.task.domain.entities import Task, TaskStatus  # noqa: E402
+from src.task.infrastructure.db.models import Task as DBTask  # noqa: E402
+from src.task.infrastructure.db.repository import DatabaseTaskRepository  # noqa: E402
+
+SEED_BATCH = 10000
+STATUS_BY_VALUE = {status.value: status for status in TaskStatus}
+
+
+async def seed(rows: int) -> int:
+    async with async_session_maker() as session:
+        existing = await session.scalar(select(func.count()).select_from(DBTask))
+    if existing >= rows:
+        return existing
+
+    remaining = rows - existing
+    while remaining > 0:
+        batch = min(SEED_BATCH, remaining)
+        tasks = [Task.create(title=f"Задача {number}", description="Описание задачи " * 4) for number in range(batch)]
+        async with async_session_maker() as session:
+            await DatabaseTaskRepository(session).create_many(tasks)
+        remaining -= batch
+
+    async with engine.begin() as conn:
+        await conn.execute(text("ANALYZE tasks"))
+    return rows
+
+
+async def read_orm() -> int:
+    async with async_session_maker() as session:
+        result = await session.execute(select(DBTask).order_by(DBTask.created_at.desc()))
+        tasks = [
+            Task.from_trusted(
+                str(db_task.id), db_task.title, db_task.description, STATUS_BY_VALUE[db_task.status],
+                db_task.created_at, db_task.updated_at
+            )
+            for db_task in result.scalars().all()
+        ]
+    return len(tasks)
+
+
+async def read_core() -> int:
+    async with async_session_maker() as session:
+        tasks = await DatabaseTaskRepository(session).get_all()
+    return len(tasks)
+
+
+async def measure(read, repeat: int) -> dict:
+    await read()
+    durations = []
+    count = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        count = await read()
+        durations.append(time.perf_counter() - started)
+
+    p50 = percentile(durations, 50)
+    return {
+        "rows": count,
+        "p50_ms": round(p50 * 1000, 1),
+        "rows_per_sec": round(count / p50),
+    }
+
+
+async def run(rows: int, repeat: int) -> dict:
+    await init_database()
+    total = await seed(rows)
+
+    report = {
+        "table_rows": total,
+        "repeat": repeat,
+        "orm": await measure(read_orm, repeat),
+        "core": await measure(read_core, repeat),
+    }
+    report["speedup"] = round(report["core"]["rows_per_sec"] / report["orm"]["rows_per_sec"], 2)
+    await engine.dispose()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args.rows, args.repeat))
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
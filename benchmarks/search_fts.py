@@ -0,0 +1,193 @@
+"""Полнотекстовый поиск против ILIKE на большой таблице задач.
+
+    python benchmarks/search_fts.py --rows 1000000 --repeat 20
+
+Заполняет таблицу tasks синтетическими задачами (через COPY, пачками), затем для каждого
+запроса замеряет:
+  search — DatabaseTaskRepository.search, первая страница по релевантности;
+  match  — отбор всех совпадений по GIN-индексу (count(*)), без ранжирования;
+  ilike  — отбор всех совпадений через ILIKE '%слово%' по title и description.
+Слова берутся из словаря с распределением Ципфа, как в живом тексте: запросы покрывают
+и частые слова (десятки тысяч совпадений, которые надо ранжировать), и редкие.
+Печатает JSON с числом совпадений и p50/p95 по каждому запросу и план поиска из EXPLAIN ANALYZE.
+Если в таблице уже есть --rows строк, заполнение пропускается; --reset очищает таблицу.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import func, or_, select, text  # noqa: E402
+
+from _stats import percentile  # noqa: E402
+
+from src.core.database.config import async_session_maker, engine, init_database  # noqa: E402
+from src.task.domain.entities import Task  # noqa: E402
+from src.task.domain.queries import TaskSearchQuery  # noqa: E402
+from src.task.infrastructure.db.models import Task as DBTask  # noqa: E402
+from src.task.infrastructure.db.repository import DatabaseTaskRepository  # noqa: E402
+
+SEED_BATCH = 10000
+
+VOCABULARY_SIZE = 20000
+
+DOMAIN_WORDS = (
+    "исправить проверить подготовить сервер отчет ошибка клиент релиз обновить договор "
+    "встреча настроить миграция счет база данных документация бюджет макет тест "
+    "nginx postgres redis docker kubernetes"
+).split()
+
+SYLLABLES = "ка ро ми на те ло ви за бе ду пра сто гре шу ль ва ни ко ре та".split()
+
+QUERIES = (
+    "отчеты",
+    "миграция",
+    "клиент договор",
+    "nginx",
+    "\"база данных\"",
+    "миграция -релиз",
+    "микотаро",
+    "грегр стошукобе",
+)
+
+
+def summary(samples):
+    return {
+        "p50_ms": round(percentile(samples, 50), 3),
+        "p95_ms": round(percentile(samples, 95), 3),
+        "mean_ms": round(statistics.fmean(samples), 3),
+    }
+
+
+def build_vocabulary(rnd: random.Random) -> list:
+    words = list(DOMAIN_WORDS)
+    seen = set(words)
+    while len(words) < VOCABULARY_SIZE:
+        word = "".join(rnd.choices(SYLLABLES, k=rnd.randint(2, 4)))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+def random_task(rnd: random.Random, vocabulary: list, weights: list) -> Task:
+    title = " ".join(rnd.choices(vocabulary, cum_weights=weights, k=rnd.randint(2, 6)))
+    description = " ".join(rnd.choices(vocabulary, cum_weights=weights, k=rnd.randint(0, 30)))
+    return Task.create(title=title.capitalize(), description=description)
+
+
+async def seed(rows: int, reset: bool) -> int:
+    if reset:
+        async with engine.begin() as conn:
+            await conn.execute(text("TRUNCATE tasks"))
+
+    async with async_session_maker() as session:
+        existing = await session.scalar(select(func.count()).select_from(DBTask))
+    if existing >= rows:
+        return existing
+
+    rnd = random.Random(42)
+    vocabulary = build_vocabulary(rnd)
+    weights = list(itertools.accumulate(1 / rank ** 1.1 for rank in range(1, len(vocabulary) + 1)))
+
+    remaining = rows - existing
+    while remaining > 0:
+        batch = min(SEED_BATCH, remaining)
+        tasks = [random_task(rnd, vocabulary, weights) for _ in range(batch)]
+        async with async_session_maker() as session:
+            await DatabaseTaskRepository(session).create_many(tasks)
+        remaining -= batch
+
+    async with engine.begin() as conn:
+        await conn.execute(text("ANALYZE tasks"))
+    return rows
+
+
+async def time_scalar(stmt, repeat: int) -> tuple:
+    samples = []
+    async with async_session_maker() as session:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            value = await session.scalar(stmt)
+            samples.append((time.perf_counter() - started) * 1000)
+    return value, samples
+
+
+def match_count_query(query_text: str):
+    stmt = DatabaseTaskRepository(None)._build_search_query(TaskSearchQuery(text=query_text, limit=1))
+    matches = stmt.get_final_froms()[0]
+    return select(func.count()).select_from(matches)
+
+
+def ilike_count_query(query_text: str):
+    pattern = f"%{query_text.strip(chr(34)).split()[0]}%"
+    return (
+        select(func.count())
+        .select_from(DBTask)
+        .where(or_(DBTask.title.ilike(pattern), DBTask.description.ilike(pattern)))
+    )
+
+
+async def time_search(query_text: str, limit: int, repeat: int) -> list:
+    samples = []
+    async with async_session_maker() as session:
+        repository = DatabaseTaskRepository(session)
+        for _ in range(repeat):
+            started = time.perf_counter()
+            await repository.search(TaskSearchQuery(text=query_text, limit=limit))
+            samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+async def explain(query_text: str, limit: int) -> list:
+    async with async_session_maker() as session:
+        stmt = DatabaseTaskRepository(session)._build_search_query(TaskSearchQuery(text=query_text, limit=limit))
+        compiled = stmt.compile(engine.sync_engine, compile_kwargs={"literal_binds": True})
+        result = await session.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {compiled}"))
+        return [line for (line,) in result]
+
+
+async def run(rows: int, limit: int, repeat: int, with_ilike: bool, reset: bool) -> dict:
+    await init_database()
+    total = await seed(rows, reset)
+
+    report = {"rows": total, "limit": limit, "repeat": repeat, "queries": {}}
+    for query_text in QUERIES:
+        matches, match_samples = await time_scalar(match_count_query(query_text), repeat)
+        entry = {
+            "matches": matches,
+            "search": summary(await time_search(query_text, limit, repeat)),
+            "match": summary(match_samples),
+        }
+        if with_ilike:
+            _, ilike_samples = await time_scalar(ilike_count_query(query_text), max(1, repeat // 5))
+            entry["ilike"] = summary(ilike_samples)
+        report["queries"][query_text] = entry
+
+    report["plan"] = await explain(QUERIES[0], limit)
+    await engine.dispose()
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--reset", action="store_true", help="очистить таблицу перед заполнением")
+    parser.add_argument("--no-ilike", action="store_true", help="не замерять ILIKE (полный проход по таблице)")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args.rows, args.limit, args.repeat, not args.no_ilike, args.reset))
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
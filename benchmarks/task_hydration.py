@@ -0,0 +1,125 @@
+"""Стоимость сборки доменных Task из строк БД: с валидацией и без.
+
+    python benchmarks/task_hydration.py --rows 100000 --repeat 5
+
+Строки готовятся заранее (кортежи, как их отдает драйвер), БД не нужна. Варианты:
+  legacy    — прежний Task: frozen dataclass без __slots__, валидация в __post_init__, TaskStatus(value);
+  validated — текущий Task через __init__: __slots__, валидация в __post_init__;
+  trusted   — Task.from_trusted и статус из словаря, как в DatabaseTaskRepository.
+Печатает JSON с временем на строку (лучший из --repeat проходов) и памятью на задачу
+по tracemalloc: только сами объекты Task, строки и даты общие для всех вариантов.
+"""
+import argparse
+import dataclasses
+import json
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.task.domain.entities import Task, TaskStatus  # noqa: E402
+
+STATUS_BY_VALUE = {status.value: status for status in TaskStatus}
+
+# Раскладка Task до перехода на __slots__: те же поля, __dict__ на каждый экземпляр
+LegacyTask = dataclasses.make_dataclass(
+    "LegacyTask",
+    [(field.name, field.type) for field in dataclasses.fields(Task)],
+    frozen=True,
+    namespace={
+        "__post_init__": Task._validate,
+        "validate_title": staticmethod(Task.validate_title),
+        "validate_description": staticmethod(Task.validate_description),
+    },
+)
+
+
+def build_rows(count: int) -> list:
+    started = datetime(2024, 1, 1)
+    statuses = [status.value for status in TaskStatus]
+    return [
+        (
+            str(uuid.uuid4()),
+            f"Задача номер {number}",
+            "Описание задачи " * (number % 20),
+            statuses[number % len(statuses)],
+            started + timedelta(seconds=number),
+            started + timedelta(seconds=number, minutes=5),
+        )
+        for number in range(count)
+    ]
+
+
+def hydrate_legacy(rows: list) -> list:
+    return [
+        LegacyTask(
+            id=id, title=title, description=description, status=TaskStatus(status),
+            created_at=created_at, updated_at=updated_at
+        )
+        for id, title, description, status, created_at, updated_at in rows
+    ]
+
+
+def hydrate_validated(rows: list) -> list:
+    return [
+        Task(
+            id=id, title=title, description=description, status=TaskStatus(status),
+            created_at=created_at, updated_at=updated_at
+        )
+        for id, title, description, status, created_at, updated_at in rows
+    ]
+
+
+def hydrate_trusted(rows: list) -> list:
+    return [
+        Task.from_trusted(id, title, description, STATUS_BY_VALUE[status], created_at, updated_at)
+        for id, title, description, status, created_at, updated_at in rows
+    ]
+
+
+def measure(hydrate, rows: list, repeat: int) -> dict:
+    best = min(timed(hydrate, rows) for _ in range(repeat))
+
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    tasks = hydrate(rows)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    objects_bytes = current - baseline - sys.getsizeof(tasks)
+
+    return {
+        "ns_per_row": round(best / len(rows) * 1e9),
+        "total_ms": round(best * 1000, 1),
+        "bytes_per_task": round(objects_bytes / len(rows), 1),
+    }
+
+
+def timed(hydrate, rows: list) -> float:
+    started = time.perf_counter()
+    hydrate(rows)
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = build_rows(args.rows)
+    report = {
+        "rows": args.rows,
+        "legacy": measure(hydrate_legacy, rows, args.repeat),
+        "validated": measure(hydrate_validated, rows, args.repeat),
+        "trusted": measure(hydrate_trusted, rows, args.repeat),
+    }
+    report["speedup_vs_legacy"] = round(report["legacy"]["ns_per_row"] / report["trusted"]["ns_per_row"], 2)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
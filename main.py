@@ -1,12 +1,25 @@
+import asyncio
 import logging
-from contextlib import asynccontextmanager
-from fastapi import FastAPI
-from fastapi.responses import RedirectResponse
-
-from src.core.logging.config import setup_logging
+from contextlib import asynccontextmanager, suppress
+from fastapi import Depends, FastAPI
+from fastapi.responses import RedirectResponse, Response
+
+from src.core.logging.config import (
+    LOG_RATE_LIMIT_SUMMARY_INTERVAL_SECONDS, rate_limit_filter, setup_logging, start_logging, stop_logging
+)
+from src.core.logging.rate_limit import run_rate_limit_summaries
+from src.core.metrics.http import MetricsMiddleware, track_in_flight
+from src.core.metrics.registry import CONTENT_TYPE, REGISTRY
 from src.task.api.exeption_handlers import EXCEPTION_HANDLERS
 from src.task.api.rest import router as task_router
-from src.core.database.config import init_database, close_database
+from src.core.database.config import (
+    DB_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS, engine, init_database, close_database, primary_session_maker, replicas
+)
+from src.core.database.pool import pool_status
+from src.core.database.replicas import run_replica_health_checks
+from src.core.database.slow_queries import DB_SLOW_QUERY_ENDPOINTS_ENABLED, slow_queries
+from src.task.infrastructure.db.counters import COUNTERS_RECONCILE_INTERVAL, run_counters_reconciliation
+from src.task.infrastructure.cache.config import suggest_cache, task_cache
 
 setup_logging()
 logger = logging.getLogger(__name__)
@@ -14,22 +27,46 @@ logger = logging.getLogger(__name__)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    start_logging()
     logger.info("Запуск приложения Task Manager")
     try:
         await init_database()
         logger.info("База данных инициализирована")
     except Exception as e:
-        logger.error(f"Ошибка инициализации БД: {e}")
+        logger.error("Ошибка инициализации БД: %s", e)
         raise
 
+    background = []
+    if COUNTERS_RECONCILE_INTERVAL > 0:
+        background.append(asyncio.create_task(
+            run_counters_reconciliation(primary_session_maker, COUNTERS_RECONCILE_INTERVAL)
+        ))
+    if LOG_RATE_LIMIT_SUMMARY_INTERVAL_SECONDS > 0:
+        background.append(asyncio.create_task(
+            run_rate_limit_summaries(rate_limit_filter, LOG_RATE_LIMIT_SUMMARY_INTERVAL_SECONDS)
+        ))
+    if replicas:
+        await replicas.check()
+        background.append(asyncio.create_task(
+            run_replica_health_checks(replicas, DB_REPLICA_HEALTH_CHECK_INTERVAL_SECONDS)
+        ))
+
     yield
 
     logger.info("Остановка приложения Task Manager")
+    for task in background:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
     try:
         await close_database()
         logger.info("Соединения с БД закрыты")
     except Exception as e:
-        logger.error(f"Ошибка закрытия БД: {e}")
+        logger.error("Ошибка закрытия БД: %s", e)
+
+    rate_limit_filter.emit_summaries()
+    stop_logging()
 
 
 def create_app() -> FastAPI:
@@ -39,8 +76,10 @@ def create_app() -> FastAPI:
         version="1.0.0",
         docs_url="/docs",
         redoc_url="/redoc",
-        lifespan=lifespan
+        lifespan=lifespan,
+        dependencies=[Depends(track_in_flight)]
     )
+    app.add_middleware(MetricsMiddleware)
 
     for exception_class, handler in EXCEPTION_HANDLERS.items():
         app.add_exception_handler(exception_class, handler)
@@ -55,6 +94,27 @@ def create_app() -> FastAPI:
     async def health_check():
         return {"status": "healthy", "message": "Task Manager API is running"}
 
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        return Response(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+    @app.get("/internal/cache", include_in_schema=False)
+    async def cache_stats():
+        return {"tasks": task_cache.stats(), "suggest": suggest_cache.stats()}
+
+    @app.get("/internal/pool", include_in_schema=False)
+    async def pool_stats():
+        return {"primary": pool_status(engine.pool), "replicas": replicas.status()}
+
+    if DB_SLOW_QUERY_ENDPOINTS_ENABLED:
+        @app.get("/internal/slow-queries", include_in_schema=False)
+        async def slow_query_log():
+            return slow_queries.snapshot()
+
+        @app.delete("/internal/slow-queries", include_in_schema=False, status_code=204)
+        async def clear_slow_query_log():
+            slow_queries.clear()
+
     return app
 
 
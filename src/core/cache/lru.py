@@ -0,0 +1,119 @@
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+MISSING = object()
+
+_NEGATIVE_ENTRY_SIZE = sys.getsizeof(None)
+
+
+class LRUTTLCache:
+    """In-process LRU-кэш с TTL и ограничением суммарного размера в байтах.
+
+    Хранит и отрицательные записи (None): ключ известен как отсутствующий.
+    Рассчитан на один event loop, поэтому блокировок нет.
+    """
+
+    def __init__(
+            self,
+            max_bytes: int,
+            ttl: float,
+            negative_ttl: float,
+            sizeof: Callable[[Any], int] = sys.getsizeof,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float, int]]" = OrderedDict()
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._sizeof = sizeof
+        self._clock = clock
+        self._size = 0
+        self._version = 0
+
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def version(self) -> int:
+        """Растет при каждой инвалидации; см. if_version в set()"""
+        return self._version
+
+    def get(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return MISSING
+
+        value, expires_at, _ = entry
+        if expires_at <= self._clock():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return MISSING
+
+        self._entries.move_to_end(key)
+        if value is None:
+            self.negative_hits += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, if_version: Optional[int] = None) -> bool:
+        # Значение, прочитанное до инвалидации, могло устареть — не кладем его
+        if if_version is not None and if_version != self._version:
+            return False
+
+        size = _NEGATIVE_ENTRY_SIZE if value is None else self._sizeof(value)
+        if size > self._max_bytes:
+            return False
+
+        if key in self._entries:
+            self._remove(key)
+
+        ttl = self._negative_ttl if value is None else self._ttl
+        self._entries[key] = (value, self._clock() + ttl, size)
+        self._size += size
+
+        while self._size > self._max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+        return True
+
+    def invalidate(self, key: Hashable) -> None:
+        self._version += 1
+        self.invalidations += 1
+        if key in self._entries:
+            self._remove(key)
+
+    def clear(self) -> None:
+        self._version += 1
+        self._entries.clear()
+        self._size = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "entries": len(self._entries),
+            "size_bytes": self._size,
+            "max_bytes": self._max_bytes,
+        }
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, size = self._entries.pop(key)
+        self._size -= size
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,51 @@
+import time
+from typing import Any, Dict
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.core.metrics.registry import HistogramValue
+
+# Границы корзин ожидания выдачи соединения, в секундах
+CHECKOUT_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class ObservedAsyncPool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool, который считает ожидающих выдачи соединения и время ожидания.
+
+    Пул работает в одном event loop: выдача свободного соединения не уступает управление,
+    поэтому снаружи внутри _do_get видны только те, кто действительно ждет —
+    освобождения соединения или открытия нового.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.waiters = 0
+        self.timeouts = 0
+        self.checkout_wait = HistogramValue(CHECKOUT_WAIT_BUCKETS)
+
+    def _do_get(self):
+        self.waiters += 1
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            self.waiters -= 1
+            self.checkout_wait.observe(time.perf_counter() - started)
+
+
+def pool_status(pool: Any) -> Dict[str, Any]:
+    status = {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+    if isinstance(pool, ObservedAsyncPool):
+        status["waiters"] = pool.waiters
+        status["timeouts"] = pool.timeouts
+        status["checkout_wait_seconds"] = pool.checkout_wait.snapshot()
+    return status
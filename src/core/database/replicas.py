@@ -0,0 +1,136 @@
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+from src.core.database.pool import pool_status
+
+logger = logging.getLogger(__name__)
+
+# Опция выполнения, которой репозиторий помечает запросы, допустимые на реплике
+READ_ONLY = {"read_only": True}
+
+# На primary (не в recovery) и у догнавшей реплики отставание нулевое
+_LAG_QUERY = text(
+    "SELECT CASE"
+    " WHEN NOT pg_is_in_recovery() THEN 0"
+    " WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0"
+    " ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)"
+    " END"
+)
+
+
+class Replica:
+
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.healthy = False
+        self.lag: Optional[float] = None
+        self.error: Optional[str] = None
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "url": self.engine.url.render_as_string(hide_password=True),
+            "healthy": self.healthy,
+            "lag_seconds": self.lag,
+            "error": self.error,
+            "pool": pool_status(self.engine.pool),
+        }
+
+
+class ReplicaSet:
+    """Реплики для чтения: выдает их по кругу, пропуская недоступные и отставшие.
+
+    Состояние обновляет check(); до первой проверки реплика считается недоступной.
+    """
+
+    def __init__(self, engines: List[AsyncEngine], max_lag: float, check_timeout: float = 2.0):
+        self._replicas = [Replica(engine) for engine in engines]
+        self._max_lag = max_lag
+        self._check_timeout = check_timeout
+        self._next = 0
+
+    def __bool__(self) -> bool:
+        return bool(self._replicas)
+
+    def pick(self) -> Optional[AsyncEngine]:
+        for _ in range(len(self._replicas)):
+            replica = self._replicas[self._next]
+            self._next = (self._next + 1) % len(self._replicas)
+            if replica.healthy and replica.lag is not None and replica.lag <= self._max_lag:
+                return replica.engine
+        return None
+
+    async def check(self) -> None:
+        await asyncio.gather(*(self._check_one(replica) for replica in self._replicas))
+
+    async def _check_one(self, replica: Replica) -> None:
+        try:
+            replica.lag = float(await asyncio.wait_for(self._measure_lag(replica.engine), self._check_timeout))
+            replica.healthy = True
+            replica.error = None
+            if replica.lag > self._max_lag:
+                logger.warning("Реплика %s отстает на %.1f с, чтение идет с primary", replica.engine.url.host, replica.lag)
+        except Exception as e:
+            if replica.healthy:
+                logger.error("Реплика %s недоступна: %s", replica.engine.url.host, e)
+            replica.healthy = False
+            replica.error = str(e) or type(e).__name__
+
+    async def _measure_lag(self, engine: AsyncEngine) -> float:
+        async with engine.connect() as conn:
+            return await conn.scalar(_LAG_QUERY)
+
+    def status(self) -> List[Dict[str, Any]]:
+        return [replica.status() for replica in self._replicas]
+
+    async def dispose(self) -> None:
+        for replica in self._replicas:
+            await replica.engine.dispose()
+
+
+async def run_replica_health_checks(replicas: ReplicaSet, interval: float) -> None:
+    """Проверяет реплики каждые interval секунд, пока задачу не отменят"""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await replicas.check()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Ошибка проверки реплик: %s", e)
+
+
+class RoutingSession(Session):
+    """Session, которая отправляет помеченные READ_ONLY запросы на реплику, а остальное — на primary.
+
+    Любой запрос без пометки закрепляет сессию (а с ней и запрос API) за primary:
+    чтения после записи видят записанное. Реплика выбирается один раз на сессию,
+    чтобы чтения одного запроса не расходились между репликами с разным отставанием.
+    """
+
+    def __init__(self, *args: Any, replicas: Optional[ReplicaSet] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._replicas = replicas
+        self._replica: Optional[AsyncEngine] = None
+        self._pinned_to_primary = not replicas
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        primary = super().get_bind(mapper, clause=clause, **kwargs)
+        if self._pinned_to_primary:
+            return primary
+
+        if clause is None or not clause.get_execution_options().get("read_only"):
+            self._pinned_to_primary = True
+            return primary
+
+        if self._replica is None:
+            self._replica = self._replicas.pick()
+            if self._replica is None:
+                # Годных реплик нет: вся сессия читает с primary
+                self._pinned_to_primary = True
+                return primary
+        return self._replica.sync_engine
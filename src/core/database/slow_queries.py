@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import os
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+logger = logging.getLogger(__name__)
+
+# Отрицательный порог выключает запись
+DB_SLOW_QUERY_THRESHOLD_MS = float(os.getenv("DB_SLOW_QUERY_THRESHOLD_MS", "200"))
+DB_SLOW_QUERY_MAX_STATEMENTS = int(os.getenv("DB_SLOW_QUERY_MAX_STATEMENTS", "200"))
+# EXPLAIN ANALYZE выполняет запрос еще раз, поэтому включается явно
+DB_SLOW_QUERY_EXPLAIN = os.getenv("DB_SLOW_QUERY_EXPLAIN", "false").lower() == "true"
+# /internal/slow-queries отдает текст запросов и планы без авторизации, поэтому включается явно
+DB_SLOW_QUERY_ENDPOINTS_ENABLED = os.getenv("DB_SLOW_QUERY_ENDPOINTS_ENABLED", "false").lower() == "true"
+
+_EXPLAIN_OPTION = "slow_query_explain"
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_PLACEHOLDER = re.compile(r"\$\d+")
+_NUMBER = re.compile(r"(?<![\w$.])-?\d+(?:\.\d+)?\b")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+# Повторно выполнять можно только чтение: без DML в CTE и без блокировок строк
+_EXPLAINABLE = re.compile(r"^\s*(SELECT|WITH)\b", re.IGNORECASE)
+_MODIFYING = re.compile(
+    r"\b(INSERT|UPDATE|DELETE|MERGE|FOR\s+(NO\s+KEY\s+UPDATE|UPDATE|SHARE|KEY\s+SHARE))\b", re.IGNORECASE
+)
+
+
+def normalize_statement(statement: str) -> str:
+    """Форма запроса без значений: литералы и плейсхолдеры — ?, списки значений — (...)"""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _VALUE_LIST.sub("(...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def is_explainable(statement: str) -> bool:
+    return bool(_EXPLAINABLE.match(statement)) and not _MODIFYING.search(statement)
+
+
+@dataclass
+class SlowQuery:
+    database: str
+    statement: str
+    calls: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    last_seen: float = 0.0
+    plan: Optional[List[str]] = None
+    plan_error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "database": self.database,
+            "statement": self.statement,
+            "calls": self.calls,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "mean_ms": round(self.total_seconds / self.calls * 1000, 3),
+            "max_ms": round(self.max_seconds * 1000, 3),
+            "last_seen": self.last_seen,
+            "plan": self.plan,
+            "plan_error": self.plan_error,
+        }
+
+
+class SlowQueryRecorder:
+    """Копит медленные запросы по форме в ограниченном LRU: редкие формы вытесняются частыми.
+
+    Быстрые запросы обходятся вычитанием и сравнением; нормализация и учет — только
+    для тех, кто превысил порог. План EXPLAIN (ANALYZE, BUFFERS) снимается один раз
+    на форму, в фоне и на отдельном соединении того же engine.
+    """
+
+    def __init__(self, threshold_ms: float, max_statements: int, explain: bool):
+        self.threshold = threshold_ms / 1000
+        self.max_statements = max_statements
+        self.explain = explain
+        self.evictions = 0
+        self._entries: "OrderedDict[Tuple[str, str], SlowQuery]" = OrderedDict()
+        self._explain_tasks: Set[asyncio.Task] = set()
+
+    def instrument(self, engine: AsyncEngine, database: str) -> None:
+        if self.threshold < 0:
+            return
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if context is not None:
+                context._slow_query_started = time.perf_counter()
+
+        @event.listens_for(engine.sync_engine, "after_cursor_execute")
+        def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            if context is None:
+                return
+            elapsed = time.perf_counter() - context._slow_query_started
+            if elapsed < self.threshold or context.execution_options.get(_EXPLAIN_OPTION):
+                return
+            entry = self.record(database, statement, elapsed)
+            if self.explain and entry.calls == 1 and not executemany and is_explainable(statement):
+                self._schedule_explain(engine, entry, statement, parameters)
+
+    def record(self, database: str, statement: str, elapsed: float) -> SlowQuery:
+        normalized = normalize_statement(statement)
+        key = (database, normalized)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._entries[key] = SlowQuery(database=database, statement=normalized)
+            while len(self._entries) > self.max_statements:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        else:
+            self._entries.move_to_end(key)
+
+        entry.calls += 1
+        entry.total_seconds += elapsed
+        entry.max_seconds = max(entry.max_seconds, elapsed)
+        entry.last_seen = time.time()
+        return entry
+
+    def _schedule_explain(self, engine: AsyncEngine, entry: SlowQuery, statement: str, parameters: Any) -> None:
+        try:
+            task = asyncio.get_running_loop().create_task(self._capture_plan(engine, entry, statement, parameters))
+        except RuntimeError:
+            return
+        self._explain_tasks.add(task)
+        task.add_done_callback(self._explain_tasks.discard)
+
+    async def _capture_plan(self, engine: AsyncEngine, entry: SlowQuery, statement: str, parameters: Any) -> None:
+        try:
+            async with engine.connect() as conn:
+                conn = await conn.execution_options(**{_EXPLAIN_OPTION: True})
+                result = await conn.exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS) {statement}", parameters)
+                entry.plan = [line for (line,) in result]
+                await conn.rollback()
+        except Exception as e:
+            entry.plan_error = str(e) or type(e).__name__
+            logger.warning("Не удалось снять план медленного запроса: %s", e)
+
+    def snapshot(self) -> Dict[str, Any]:
+        statements = sorted(self._entries.values(), key=lambda entry: entry.total_seconds, reverse=True)
+        return {
+            "threshold_ms": self.threshold * 1000,
+            "max_statements": self.max_statements,
+            "explain": self.explain,
+            "evictions": self.evictions,
+            "statements": [entry.to_dict() for entry in statements],
+        }
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.evictions = 0
+
+
+slow_queries = SlowQueryRecorder(DB_SLOW_QUERY_THRESHOLD_MS, DB_SLOW_QUERY_MAX_STATEMENTS, DB_SLOW_QUERY_EXPLAIN)
@@ -1,11 +1,36 @@
 import logging
 import logging.config
 import os
+import queue
 import sys
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from src.core.logging.queue import BoundedQueueHandler, DrainingQueueListener
+from src.core.logging.rate_limit import CallSiteRateLimitFilter, parse_rate_limits
+
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+LOG_QUEUE_POLICY = os.getenv("LOG_QUEUE_POLICY", "drop").lower()
+LOG_QUEUE_BLOCK_TIMEOUT_SECONDS = float(os.getenv("LOG_QUEUE_BLOCK_TIMEOUT_SECONDS", "1"))
+# Предел на место вызова: "логгер=записей в секунду:запас" через запятую, root — корневой логгер
+LOG_RATE_LIMITS = os.getenv("LOG_RATE_LIMITS", "src.task=10:50")
+# Записи этого уровня и выше проходят без ограничения
+LOG_RATE_LIMIT_EXEMPT_LEVEL = logging.getLevelName(os.getenv("LOG_RATE_LIMIT_EXEMPT_LEVEL", "ERROR").upper())
+LOG_RATE_LIMIT_SUMMARY_INTERVAL_SECONDS = float(os.getenv("LOG_RATE_LIMIT_SUMMARY_INTERVAL_SECONDS", "60"))
+
+# Настоящие обработчики висят на этом логгере, в него никто не пишет: его обработчики
+# забирает QueueListener, а остальные логгеры пишут только в очередь
+_SINK_LOGGER = "src.core.logging.sink"
+
+_listener: Optional[DrainingQueueListener] = None
+
+rate_limit_filter = CallSiteRateLimitFilter(parse_rate_limits(LOG_RATE_LIMITS), LOG_RATE_LIMIT_EXEMPT_LEVEL)
 
 
 def setup_logging() -> None:
+    global _listener
+    stop_logging()
+    _listener = None
+
     log_level = os.getenv("LOG_LEVEL", "INFO").upper()
     environment = os.getenv("ENVIRONMENT", "development")
     is_docker = os.getenv("DOCKER_ENV", "false").lower() == "true"
@@ -49,6 +74,8 @@ def setup_logging() -> None:
             }
         }
 
+    log_queue: queue.Queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+
     logging_config: Dict[str, Any] = {
         "version": 1,
         "disable_existing_loggers": False,
@@ -66,36 +93,50 @@ def setup_logging() -> None:
                 "format": "%(asctime)s %(name)s %(levelname)s %(funcName)s %(lineno)d %(message)s"
             }
         },
-        "handlers": handlers_config,
+        "handlers": {
+            **handlers_config,
+            "queue": {
+                "()": BoundedQueueHandler,
+                "log_queue": log_queue,
+                "policy": LOG_QUEUE_POLICY,
+                "block_timeout": LOG_QUEUE_BLOCK_TIMEOUT_SECONDS,
+                "filters": [rate_limit_filter]
+            }
+        },
         "loggers": {
+            _SINK_LOGGER: {
+                "level": "DEBUG",
+                "handlers": handlers,
+                "propagate": False
+            },
             "": {
                 "level": log_level,
-                "handlers": handlers,
+                "handlers": ["queue"],
                 "propagate": False
             },
             "src.task": {
                 "level": log_level,
-                "handlers": handlers,
+                "handlers": ["queue"],
                 "propagate": False
             },
             "src.core": {
                 "level": log_level,
-                "handlers": handlers,
+                "handlers": ["queue"],
                 "propagate": False
             },
             "sqlalchemy.engine": {
                 "level": "INFO" if os.getenv("SQL_ECHO", "false").lower() == "true" else "WARNING",
-                "handlers": handlers,
+                "handlers": ["queue"],
                 "propagate": False
             },
             "uvicorn": {
                 "level": "INFO",
-                "handlers": handlers,
+                "handlers": ["queue"],
                 "propagate": False
             },
             "fastapi": {
                 "level": "INFO",
-                "handlers": handlers,
+                "handlers": ["queue"],
                 "propagate": False
             }
         }
@@ -106,5 +147,29 @@ def setup_logging() -> None:
 
     logging.config.dictConfig(logging_config)
 
+    # Форматирование и запись в файлы идут в потоке слушателя, а не в event loop
+    _listener = DrainingQueueListener(
+        log_queue,
+        *logging.getLogger(_SINK_LOGGER).handlers,
+        respect_handler_level=True
+    )
+    _listener.start()
+
     logger = logging.getLogger(__name__)
-    logger.info(f"Логгирование настроено. Уровень: {log_level}, Среда: {environment}, Docker: {is_docker}")
+    logger.info("Логгирование настроено. Уровень: %s, Среда: %s, Docker: %s", log_level, environment, is_docker)
+
+
+def start_logging() -> None:
+    """Запускает поток записи логов, если он остановлен: lifespan может подниматься повторно"""
+    if _listener is not None and _listener._thread is None:
+        _listener.start()
+
+
+def stop_logging() -> None:
+    """Дописывает накопленные в очереди записи и останавливает поток записи логов"""
+    if _listener is None or _listener._thread is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.flush()
+
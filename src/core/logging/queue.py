@@ -0,0 +1,50 @@
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+from src.core.metrics.registry import REGISTRY
+
+DROPPED_RECORDS = REGISTRY.counter(
+    "log_records_dropped_total",
+    "Записи лога, не попавшие в очередь обработчиков",
+    ["logger"]
+)
+
+
+class QueuePolicy:
+    DROP = "drop"
+    BLOCK = "block"
+
+
+class BoundedQueueHandler(QueueHandler):
+    """QueueHandler поверх ограниченной очереди.
+
+    При переполнении policy=drop выбрасывает запись сразу, policy=block ждет место
+    не дольше block_timeout и только потом выбрасывает. Выброшенные записи считаются
+    в dropped и в метрике log_records_dropped_total.
+    """
+
+    def __init__(self, log_queue: queue.Queue, policy: str = QueuePolicy.DROP, block_timeout: float = 1.0):
+        super().__init__(log_queue)
+        if policy not in (QueuePolicy.DROP, QueuePolicy.BLOCK):
+            raise ValueError(f"Неизвестная политика очереди логов: {policy}")
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            if self.policy == QueuePolicy.BLOCK:
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+            DROPPED_RECORDS.labels(record.name).inc()
+
+
+class DrainingQueueListener(QueueListener):
+    """QueueListener, который при остановке дожидается места под маркер конца и разбирает очередь до него"""
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)
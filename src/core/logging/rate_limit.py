@@ -0,0 +1,123 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from src.core.metrics.registry import REGISTRY
+
+SUPPRESSED_RECORDS = REGISTRY.counter(
+    "log_records_suppressed_total",
+    "Записи лога, отброшенные ограничением частоты места вызова",
+    ["logger"]
+)
+
+# Пометка итоговых записей о подавленных: сами они ограничению не подлежат
+SUMMARY_ATTR = "rate_limit_summary"
+
+_CallSite = Tuple[str, int]
+
+
+def parse_rate_limits(spec: str) -> Dict[str, Tuple[float, float]]:
+    """Разбирает "src.task=10:50,root=100:500" в {логгер: (записей в секунду, запас)}"""
+    limits = {}
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, _, values = item.partition("=")
+        rate, _, burst = values.partition(":")
+        name = name.strip()
+        limits["" if name == "root" else name] = (float(rate), float(burst or rate))
+    return limits
+
+
+class _Bucket:
+    __slots__ = ("tokens", "updated", "suppressed", "logger", "level", "msg")
+
+    def __init__(self, burst: float, now: float):
+        self.tokens = burst
+        self.updated = now
+        self.suppressed = 0
+        self.logger = ""
+        self.level = logging.NOTSET
+        self.msg = ""
+
+
+class CallSiteRateLimitFilter(logging.Filter):
+    """Token bucket на каждое место вызова логгера (файл и строка).
+
+    Предел берется по самому длинному префиксу имени логгера из limits, логгеры без
+    предела проходят без учета. Записи уровня exempt_level и выше не ограничиваются:
+    ошибки во время инцидента не должны превращаться в счетчик. Отброшенные записи считаются по месту вызова;
+    emit_summaries пишет по ним "подавлено N похожих сообщений" от имени того же логгера.
+    Фильтр стоит на QueueHandler, поэтому отброшенная запись не форматируется и не
+    занимает место в очереди.
+    """
+
+    def __init__(self, limits: Dict[str, Tuple[float, float]], exempt_level: int = logging.ERROR):
+        super().__init__()
+        self.limits = limits
+        self.exempt_level = exempt_level
+        self._limit_by_logger: Dict[str, Optional[Tuple[float, float]]] = {}
+        self._buckets: Dict[_CallSite, _Bucket] = {}
+        self._lock = threading.Lock()
+
+    def _limit_for(self, name: str) -> Optional[Tuple[float, float]]:
+        try:
+            return self._limit_by_logger[name]
+        except KeyError:
+            pass
+        limit = self.limits.get("")
+        for prefix, value in sorted(self.limits.items(), key=lambda item: len(item[0])):
+            if prefix and (name == prefix or name.startswith(prefix + ".")):
+                limit = value
+        self._limit_by_logger[name] = limit
+        return limit
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= self.exempt_level:
+            return True
+        limit = self._limit_for(record.name)
+        if limit is None or getattr(record, SUMMARY_ATTR, False):
+            return True
+        rate, burst = limit
+        site = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(site)
+            if bucket is None:
+                bucket = self._buckets[site] = _Bucket(burst, now)
+            else:
+                bucket.tokens = min(burst, bucket.tokens + (now - bucket.updated) * rate)
+                bucket.updated = now
+            if bucket.tokens >= 1:
+                bucket.tokens -= 1
+                return True
+            bucket.suppressed += 1
+            bucket.logger = record.name
+            bucket.level = record.levelno
+            bucket.msg = str(record.msg)
+        SUPPRESSED_RECORDS.labels(record.name).inc()
+        return False
+
+    def emit_summaries(self) -> int:
+        """Пишет итог по каждому месту вызова с подавленными записями и обнуляет счет"""
+        pending: List[Tuple[str, int, int, str]] = []
+        with self._lock:
+            for bucket in self._buckets.values():
+                if bucket.suppressed:
+                    pending.append((bucket.logger, bucket.level, bucket.suppressed, bucket.msg))
+                    bucket.suppressed = 0
+        for name, level, suppressed, msg in pending:
+            logging.getLogger(name).log(
+                level, "Подавлено %d похожих сообщений: %s", suppressed, msg, extra={SUMMARY_ATTR: True}
+            )
+        return len(pending)
+
+
+async def run_rate_limit_summaries(rate_limit_filter: CallSiteRateLimitFilter, interval: float) -> None:
+    """Пишет итоги подавленных записей каждые interval секунд, пока задачу не отменят"""
+    while True:
+        await asyncio.sleep(interval)
+        rate_limit_filter.emit_summaries()
@@ -0,0 +1,76 @@
+import time
+from typing import Dict
+
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.metrics.registry import REGISTRY
+
+REQUEST_DURATION = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "Время обработки HTTP-запроса",
+    ["method", "handler", "status"]
+)
+REQUESTS_IN_FLIGHT = REGISTRY.gauge(
+    "http_requests_in_flight",
+    "Запросы, которые сейчас обрабатывает маршрут",
+    ["method", "handler"]
+)
+
+# Запросы без подходящего маршрута не должны плодить метки по каждому пути
+UNMATCHED_HANDLER = "unmatched"
+
+_STATUS_LABELS: Dict[int, str] = {}
+
+
+def _status_label(status: int) -> str:
+    label = _STATUS_LABELS.get(status)
+    if label is None:
+        label = _STATUS_LABELS[status] = str(status)
+    return label
+
+
+class MetricsMiddleware:
+    """ASGI-middleware: время запроса по обработчику маршрута, методу и коду ответа.
+
+    Маршрут роутер кладет в scope["route"], и известен он только после ответа, поэтому
+    метки выбираются по завершении запроса. Метка handler — имя маршрута (имя функции
+    эндпоинта): шаблон пути в scope["route"] у включенных роутеров идет без префикса.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            REQUEST_DURATION.labels(
+                scope["method"],
+                route.name if route is not None else UNMATCHED_HANDLER,
+                _status_label(status)
+            ).observe(time.perf_counter() - started)
+
+
+async def track_in_flight(request: Request):
+    """Зависимость уровня приложения: держит gauge маршрута, пока работает обработчик"""
+    in_flight = REQUESTS_IN_FLIGHT.labels(request.method, request.scope["route"].name)
+    in_flight.inc()
+    try:
+        yield
+    finally:
+        in_flight.dec()
@@ -0,0 +1,54 @@
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from src.core.metrics.registry import REGISTRY
+
+SQL_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+STATEMENT_DURATION = REGISTRY.histogram(
+    "db_statement_duration_seconds",
+    "Время выполнения SQL-запроса драйвером",
+    ["database", "operation"],
+    buckets=SQL_BUCKETS
+)
+STATEMENT_ERRORS = REGISTRY.counter(
+    "db_statement_errors_total",
+    "SQL-запросы, завершившиеся ошибкой",
+    ["database"]
+)
+
+OPERATIONS = ("select", "insert", "update", "delete", "text")
+
+
+def _operation(context) -> str:
+    if context.isinsert:
+        return "insert"
+    if context.isupdate:
+        return "update"
+    if context.isdelete:
+        return "delete"
+    if context.is_text:
+        return "text"
+    return "select"
+
+
+def instrument_engine(engine: Engine, database: str) -> None:
+    """Вешает на engine события, которые замеряют каждый запрос. Для AsyncEngine передайте sync_engine"""
+    durations = {operation: STATEMENT_DURATION.labels(database, operation) for operation in OPERATIONS}
+    errors = STATEMENT_ERRORS.labels(database)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._metrics_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            durations[_operation(context)].observe(time.perf_counter() - context._metrics_started)
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        errors.inc()
@@ -1,15 +1,42 @@
-from typing import Annotated
+from datetime import datetime
+from typing import Annotated, Optional
 
-from fastapi import Depends
+from fastapi import Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.database.config import get_async_session
 from src.task.application.interface.task_repository import TaskRepository
+from src.task.domain.entities import TaskStatus
+from src.task.domain.queries import TaskFilter
+from src.task.infrastructure.cache.config import TASK_CACHE_ENABLED, suggest_cache, task_cache
+from src.task.infrastructure.cache.repository import CachedTaskRepository
 from src.task.infrastructure.db.repository import DatabaseTaskRepository
 
 
 def get_task_repository(session: AsyncSession = Depends(get_async_session)) -> TaskRepository:
-    return DatabaseTaskRepository(session)
+    repository = DatabaseTaskRepository(session)
+    if TASK_CACHE_ENABLED:
+        return CachedTaskRepository(repository, task_cache, suggest_cache)
+    return repository
 
 
 TaskRepositoryDepend = Annotated[TaskRepository, Depends(get_task_repository)]
+
+
+def get_task_filter(
+        status: Optional[TaskStatus] = Query(None, description="Фильтр по статусу"),
+        created_from: Optional[datetime] = Query(None, description="Создана не раньше"),
+        created_to: Optional[datetime] = Query(None, description="Создана раньше"),
+        updated_from: Optional[datetime] = Query(None, description="Обновлена не раньше"),
+        updated_to: Optional[datetime] = Query(None, description="Обновлена раньше"),
+) -> TaskFilter:
+    return TaskFilter(
+        status=status,
+        created_from=created_from,
+        created_to=created_to,
+        updated_from=updated_from,
+        updated_to=updated_to
+    )
+
+
+TaskFilterDepend = Annotated[TaskFilter, Depends(get_task_filter)]
@@ -0,0 +1,32 @@
+import hashlib
+from datetime import datetime
+
+from src.task.domain.queries import TaskPage
+
+
+def _digest(*parts: str) -> str:
+    hasher = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\x1f")
+    return f'"{hasher.hexdigest()}"'
+
+
+def task_etag(task_id: str, updated_at: datetime) -> str:
+    return _digest(str(task_id), updated_at.isoformat())
+
+
+def page_etag(page: TaskPage, *extra: str) -> str:
+    parts = [*extra, page.next_cursor.encode() if page.next_cursor else ""]
+    for task in page.tasks:
+        parts.append(str(task.id))
+        parts.append(task.updated_at.isoformat())
+    return _digest(*parts)
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    # Для If-None-Match действует слабое сравнение: префикс W/ игнорируется
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
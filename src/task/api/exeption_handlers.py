@@ -1,9 +1,12 @@
 import logging
+from functools import wraps
+from typing import Awaitable, Callable, Optional
 
 from fastapi import HTTPException, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 
+from src.core.metrics.registry import REGISTRY
 from src.task.domain.exeptions.tasks_exeptions import (
     TaskAlreadyExistsError,
     TaskBusinessRuleViolationError,
@@ -15,9 +18,15 @@ from src.task.domain.exeptions.tasks_exeptions import (
 
 logger = logging.getLogger(__name__)
 
+HANDLED_ERRORS = REGISTRY.counter(
+    "task_errors_total",
+    "Ошибки, обработанные обработчиками исключений API, по error_code",
+    ["error_code"]
+)
+
 
 async def task_not_found_handler(request: Request, exc: TaskNotFoundError) -> JSONResponse:
-    logger.warning(f"Task not found: {exc.task_id}")
+    logger.warning("Task not found: %s", exc.task_id)
     return JSONResponse(
         status_code=status.HTTP_404_NOT_FOUND,
         content={
@@ -29,7 +38,7 @@ async def task_not_found_handler(request: Request, exc: TaskNotFoundError) -> JS
 
 
 async def task_validation_handler(request: Request, exc: TaskValidationError) -> JSONResponse:
-    logger.warning(f"Task validation error: {exc.message}")
+    logger.warning("Task validation error: %s", exc.message)
     return JSONResponse(
         status_code=status.HTTP_400_BAD_REQUEST,
         content={
@@ -40,7 +49,7 @@ async def task_validation_handler(request: Request, exc: TaskValidationError) ->
 
 
 async def task_status_transition_handler(request: Request, exc: TaskStatusTransitionError) -> JSONResponse:
-    logger.warning(f"Invalid status transition: {exc.from_status} -> {exc.to_status}")
+    logger.warning("Invalid status transition: %s -> %s", exc.from_status, exc.to_status)
     return JSONResponse(
         status_code=status.HTTP_400_BAD_REQUEST,
         content={
@@ -53,7 +62,7 @@ async def task_status_transition_handler(request: Request, exc: TaskStatusTransi
 
 
 async def task_already_exists_handler(request: Request, exc: TaskAlreadyExistsError) -> JSONResponse:
-    logger.warning(f"Task already exists: {exc.task_id}")
+    logger.warning("Task already exists: %s", exc.task_id)
     return JSONResponse(
         status_code=status.HTTP_409_CONFLICT,
         content={
@@ -65,7 +74,7 @@ async def task_already_exists_handler(request: Request, exc: TaskAlreadyExistsEr
 
 
 async def task_business_rule_handler(request: Request, exc: TaskBusinessRuleViolationError) -> JSONResponse:
-    logger.warning(f"Business rule violation: {exc.message}")
+    logger.warning("Business rule violation: %s", exc.message)
     return JSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
@@ -76,7 +85,7 @@ async def task_business_rule_handler(request: Request, exc: TaskBusinessRuleViol
 
 
 async def generic_task_domain_handler(request: Request, exc: TaskDomainError) -> JSONResponse:
-    logger.error(f"Domain error: {exc.message}")
+    logger.error("Domain error: %s", exc.message)
     return JSONResponse(
         status_code=status.HTTP_400_BAD_REQUEST,
         content={
@@ -112,7 +121,7 @@ def _serialize_validation_errors(errors: list) -> list:
 
 
 async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
-    logger.warning(f"Validation error: {exc}")
+    logger.warning("Validation error: %s", exc)
 
     serialized_errors = _serialize_validation_errors(exc.errors())
 
@@ -137,7 +146,7 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
 
 
 async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-    logger.error(f"Unexpected error: {exc}", exc_info=True)
+    logger.error("Unexpected error: %s", exc, exc_info=True)
     return JSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
@@ -147,14 +156,27 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
     )
 
 
+def _counted(
+        handler: Callable[[Request, Exception], Awaitable[JSONResponse]],
+        error_code: Optional[str] = None
+) -> Callable[[Request, Exception], Awaitable[JSONResponse]]:
+    # error_code доменных ошибок берется из исключения, для остальных он фиксирован
+    @wraps(handler)
+    async def counted_handler(request: Request, exc: Exception) -> JSONResponse:
+        HANDLED_ERRORS.labels(error_code or exc.error_code).inc()
+        return await handler(request, exc)
+
+    return counted_handler
+
+
 EXCEPTION_HANDLERS = {
-    TaskNotFoundError: task_not_found_handler,
-    TaskValidationError: task_validation_handler,
-    TaskStatusTransitionError: task_status_transition_handler,
-    TaskAlreadyExistsError: task_already_exists_handler,
-    TaskBusinessRuleViolationError: task_business_rule_handler,
-    TaskDomainError: generic_task_domain_handler,
-    RequestValidationError: validation_exception_handler,
-    HTTPException: http_exception_handler,
-    Exception: generic_exception_handler,
+    TaskNotFoundError: _counted(task_not_found_handler),
+    TaskValidationError: _counted(task_validation_handler),
+    TaskStatusTransitionError: _counted(task_status_transition_handler),
+    TaskAlreadyExistsError: _counted(task_already_exists_handler),
+    TaskBusinessRuleViolationError: _counted(task_business_rule_handler),
+    TaskDomainError: _counted(generic_task_domain_handler),
+    RequestValidationError: _counted(validation_exception_handler, "VALIDATION_ERROR"),
+    HTTPException: _counted(http_exception_handler, "HTTP_ERROR"),
+    Exception: _counted(generic_exception_handler, "INTERNAL_SERVER_ERROR"),
 }
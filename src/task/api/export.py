@@ -0,0 +1,53 @@
+import csv
+import io
+import json
+from enum import Enum
+from typing import Any, AsyncIterator, Sequence
+
+EXPORT_CHUNK_SIZE = 1000
+EXPORT_FIELDS = ("id", "title", "description", "status", "created_at", "updated_at")
+
+
+class ExportFormat(Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+def _row_values(row: Sequence[Any]) -> list:
+    task_id, title, description, status, created_at, updated_at = row
+    return [str(task_id), title, description, status, created_at.isoformat(), updated_at.isoformat()]
+
+
+async def encode_ndjson(chunks: AsyncIterator[Sequence[Sequence[Any]]]) -> AsyncIterator[bytes]:
+    async for rows in chunks:
+        lines = [
+            json.dumps(dict(zip(EXPORT_FIELDS, _row_values(row))), ensure_ascii=False)
+            for row in rows
+        ]
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+async def encode_csv(chunks: AsyncIterator[Sequence[Sequence[Any]]]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(EXPORT_FIELDS)
+    yield buffer.getvalue().encode("utf-8")
+
+    async for rows in chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(_row_values(row) for row in rows)
+        yield buffer.getvalue().encode("utf-8")
+
+
+EXPORT_ENCODERS = {
+    ExportFormat.NDJSON: encode_ndjson,
+    ExportFormat.CSV: encode_csv,
+}
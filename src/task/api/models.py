@@ -1,10 +1,17 @@
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List, Union
+from uuid import UUID
 from pydantic import BaseModel, Field, validator
 
-from src.task.domain.entities import TaskStatus
+from src.task.application.use_case.bulk_change_status import BulkStatusChangeResult
+from src.task.application.use_case.bulk_create_tasks import BulkCreateItemResult
+from src.task.domain.entities import TaskStatistics, TaskStatus
+from src.task.domain.queries import TaskCountMode, TaskPage, TaskSearchPage, TaskTitleSuggestion
 from src.task.infrastructure.db.models import Task
 
+MAX_BULK_SIZE = 10000
+MAX_BULK_STATUS_SIZE = 1000
+
 
 class TaskCreateRequest(BaseModel):
     title: str = Field(..., min_length=1, max_length=200, description="Название задачи")
@@ -96,7 +103,9 @@ class TaskResponse(BaseModel):
 
 class TaskListResponse(BaseModel):
     tasks: List[TaskResponse] = Field(..., description="Список задач")
-    total: int = Field(..., description="Общее количество задач")
+    total: Optional[int] = Field(..., description="Количество задач под фильтром; null, если не запрашивалось")
+    total_mode: str = Field(TaskCountMode.EXACT.value, description="Как получено total: exact, estimated или none")
+    next_cursor: Optional[str] = Field(None, description="Курсор следующей страницы, если она есть")
 
     @classmethod
     def from_domain_list(cls, tasks: List[Task]) -> 'TaskListResponse':
@@ -105,6 +114,15 @@ class TaskListResponse(BaseModel):
             total=len(tasks)
         )
 
+    @classmethod
+    def from_domain_page(cls, page: Union[TaskPage, TaskSearchPage]) -> 'TaskListResponse':
+        return cls(
+            tasks=[TaskResponse.from_domain(task) for task in page.tasks],
+            total=page.total.value,
+            total_mode=page.total.mode.value,
+            next_cursor=page.next_cursor.encode() if page.next_cursor else None
+        )
+
     class Config:
         schema_extra = {
             "example": {
@@ -118,7 +136,140 @@ class TaskListResponse(BaseModel):
                         "updated_at": "2023-12-01T10:00:00Z"
                     }
                 ],
-                "total": 1
+                "total": 1,
+                "total_mode": "exact",
+                "next_cursor": None
+            }
+        }
+
+
+class TaskBulkItem(BaseModel):
+    title: str = Field(..., description="Название задачи")
+    description: str = Field("", description="Описание задачи")
+
+
+class TaskBulkCreateRequest(BaseModel):
+    tasks: List[TaskBulkItem] = Field(
+        ..., min_length=1, max_length=MAX_BULK_SIZE, description="Создаваемые задачи"
+    )
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "tasks": [
+                    {"title": "Изучить FastAPI", "description": "Основы FastAPI"},
+                    {"title": "Изучить SQLAlchemy"}
+                ]
+            }
+        }
+
+
+class TaskBulkItemResult(BaseModel):
+    index: int = Field(..., description="Позиция задачи в запросе")
+    success: bool = Field(..., description="Создана ли задача")
+    task: Optional[TaskResponse] = Field(None, description="Созданная задача")
+    error: Optional[str] = Field(None, description="Сообщение об ошибке")
+    error_code: Optional[str] = Field(None, description="Код ошибки")
+
+
+class TaskBulkCreateResponse(BaseModel):
+    results: List[TaskBulkItemResult] = Field(..., description="Результаты по каждой задаче в порядке запроса")
+    created: int = Field(..., description="Количество созданных задач")
+    failed: int = Field(..., description="Количество отклоненных задач")
+
+    @classmethod
+    def from_results(cls, results: List[BulkCreateItemResult]) -> 'TaskBulkCreateResponse':
+        items = [
+            TaskBulkItemResult(
+                index=result.index,
+                success=result.task is not None,
+                task=TaskResponse.from_domain(result.task) if result.task else None,
+                error=result.error.message if result.error else None,
+                error_code=result.error.error_code if result.error else None
+            )
+            for result in results
+        ]
+        created = sum(1 for item in items if item.success)
+        return cls(results=items, created=created, failed=len(items) - created)
+
+
+class TaskBulkStatusRequest(BaseModel):
+    ids: List[UUID] = Field(
+        ..., min_length=1, max_length=MAX_BULK_STATUS_SIZE, description="Идентификаторы задач"
+    )
+    status: str = Field(..., description="Новый статус задач")
+
+    @validator('status')
+    def validate_status(cls, v):
+        valid_statuses = [status.value for status in TaskStatus]
+        if v not in valid_statuses:
+            raise ValueError(f'Неверный статус. Допустимые: {valid_statuses}')
+        return v
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "ids": ["123e4567-e89b-12d3-a456-426614174000"],
+                "status": "завершено"
+            }
+        }
+
+
+class TaskStatusRejection(BaseModel):
+    id: str = Field(..., description="Идентификатор задачи")
+    error: str = Field(..., description="Причина отказа")
+    error_code: str = Field(..., description="Код ошибки")
+
+
+class TaskBulkStatusResponse(BaseModel):
+    updated: List[str] = Field(..., description="Задачи, получившие новый статус")
+    rejected: List[TaskStatusRejection] = Field(..., description="Задачи, статус которых не изменен")
+
+    @classmethod
+    def from_result(cls, result: BulkStatusChangeResult) -> 'TaskBulkStatusResponse':
+        return cls(
+            updated=result.updated,
+            rejected=[
+                TaskStatusRejection(id=item.task_id, error=item.error.message, error_code=item.error.error_code)
+                for item in result.rejected
+            ]
+        )
+
+
+class TaskTitleSuggestionResponse(BaseModel):
+    title: str = Field(..., description="Название задачи")
+    score: float = Field(..., description="Похожесть на введенный текст, от 0 до 1")
+
+
+class TaskSuggestResponse(BaseModel):
+    suggestions: List[TaskTitleSuggestionResponse] = Field(..., description="Подсказки, самые похожие первыми")
+
+    @classmethod
+    def from_domain_list(cls, suggestions: List[TaskTitleSuggestion]) -> 'TaskSuggestResponse':
+        return cls(
+            suggestions=[
+                TaskTitleSuggestionResponse(title=suggestion.title, score=round(suggestion.score, 4))
+                for suggestion in suggestions
+            ]
+        )
+
+
+class TaskStatisticsResponse(BaseModel):
+    total: int = Field(..., description="Общее количество задач")
+    by_status: Dict[str, int] = Field(..., description="Количество задач по статусам")
+
+    @classmethod
+    def from_domain(cls, statistics: TaskStatistics) -> 'TaskStatisticsResponse':
+        return cls(
+            total=statistics.total,
+            by_status={status.value: count for status, count in statistics.by_status.items()}
+        )
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "total": 42,
+                "by_status": {"создано": 20, "в работе": 15, "завершено": 7}
             }
         }
 
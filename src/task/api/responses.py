@@ -0,0 +1,48 @@
+import os
+from dataclasses import dataclass
+from typing import List, Mapping, Optional, Union
+
+from fastapi.responses import Response
+from pydantic import TypeAdapter
+
+from src.task.domain.entities import Task
+from src.task.domain.queries import TaskPage, TaskSearchPage
+
+# Включается явно: пока флаг выключен, списки отдаются через response_model как раньше
+FAST_JSON_ENABLED = os.getenv("FAST_JSON_RESPONSES_ENABLED", "false").lower() == "true"
+
+
+@dataclass(frozen=True)
+class _TaskListPayload:
+    # Поля и их порядок совпадают с TaskListResponse, а поля Task — с TaskResponse
+    tasks: List[Task]
+    total: Optional[int]
+    total_mode: str
+    next_cursor: Optional[str]
+
+
+_TASK_LIST_ADAPTER = TypeAdapter(_TaskListPayload)
+
+
+class TaskListJSONResponse(Response):
+    """Сериализует страницу доменных Task прямо в JSON-байты через pydantic-core.
+
+    Не строит TaskResponse на каждую задачу и не проходит повторную валидацию
+    по response_model: FastAPI отдает готовый Response как есть. Схема OpenAPI
+    по-прежнему берется из response_model маршрута, а тело ответа с ней совпадает.
+    """
+    media_type = "application/json"
+
+    def __init__(
+            self,
+            page: Union[TaskPage, TaskSearchPage],
+            status_code: int = 200,
+            headers: Optional[Mapping[str, str]] = None
+    ):
+        content = _TASK_LIST_ADAPTER.dump_json(_TaskListPayload(
+            tasks=page.tasks,
+            total=page.total.value,
+            total_mode=page.total.mode.value,
+            next_cursor=page.next_cursor.encode() if page.next_cursor else None
+        ))
+        super().__init__(content=content, status_code=status_code, headers=headers)
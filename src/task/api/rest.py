@@ -1,23 +1,48 @@
 import logging
+from typing import Optional, Union
 from uuid import UUID
 
-from fastapi import APIRouter, status
-from fastapi.responses import Response
+from fastapi import APIRouter, Header, Query, status
+from fastapi.responses import Response, StreamingResponse
 
-from .dependencies import TaskRepositoryDepend
+from .dependencies import TaskFilterDepend, TaskRepositoryDepend
+from .etag import etag_matches, page_etag, task_etag
+from .export import EXPORT_CHUNK_SIZE, EXPORT_ENCODERS, EXPORT_MEDIA_TYPES, ExportFormat
+from .responses import FAST_JSON_ENABLED, TaskListJSONResponse
 from .models import (
     TaskCreateRequest, TaskUpdateRequest, TaskResponse,
-    TaskListResponse, ErrorResponse
+    TaskListResponse, ErrorResponse, TaskBulkCreateRequest, TaskBulkCreateResponse,
+    TaskBulkStatusRequest, TaskBulkStatusResponse, TaskSuggestResponse, TaskStatisticsResponse
 )
+from ..application.use_case.bulk_change_status import BulkChangeStatusUseCase
+from ..application.use_case.bulk_create_tasks import BulkCreateTasksUseCase
 from ..application.use_case.create_task import CreateTaskUseCase
 from ..application.use_case.delete_task import DeleteTaskUseCase
-from ..application.use_case.get_all_tasks import GetAllTasksUseCase
 from ..application.use_case.get_task import GetTaskUseCase
+from ..application.use_case.get_task_statistics import GetTaskStatisticsUseCase
+from ..application.use_case.get_task_version import GetTaskVersionUseCase
+from ..application.use_case.list_tasks import ListTasksUseCase
+from ..application.use_case.search_tasks import SearchTasksUseCase
+from ..application.use_case.suggest_task_titles import SuggestTaskTitlesUseCase
 from ..application.use_case.update_task import UpdateTaskUseCase
+from ..domain.queries import (
+    DEFAULT_PAGE_LIMIT, DEFAULT_SUGGEST_LIMIT, MAX_PAGE_LIMIT, MAX_SEARCH_TEXT_LENGTH, MAX_SUGGEST_LIMIT,
+    SortDirection, TaskCountMode, TaskCursor, TaskListQuery, TaskSearchCursor, TaskSearchQuery, TaskSortField,
+    TaskTitleSuggestQuery
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
+CACHE_CONTROL = "no-cache"
+
+
+def _not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    )
+
 
 @router.post(
     "",
@@ -43,42 +68,242 @@ async def create_task(
     return TaskResponse.from_domain(task)
 
 
+@router.post(
+    "/bulk",
+    response_model=TaskBulkCreateResponse,
+    summary="Пакетное создание задач",
+    description="Создает до 10000 задач за один запрос. Каждая задача проверяется по правилам домена, "
+                "корректные записываются одной пачкой; результат возвращается по каждой позиции",
+    responses={
+        200: {"description": "Пачка обработана"},
+        400: {"model": ErrorResponse, "description": "Не удалось записать пачку"}
+    }
+)
+async def bulk_create_tasks(
+        bulk_data: TaskBulkCreateRequest,
+        task_repository: TaskRepositoryDepend
+) -> TaskBulkCreateResponse:
+    use_case = BulkCreateTasksUseCase(task_repository)
+    results = await use_case.execute(
+        [(item.title, item.description) for item in bulk_data.tasks]
+    )
+    return TaskBulkCreateResponse.from_results(results)
+
+
+@router.patch(
+    "/status",
+    response_model=TaskBulkStatusResponse,
+    summary="Пакетная смена статуса",
+    description="Переводит до 1000 задач в указанный статус одним запросом к БД. "
+                "Задачи, которые не найдены или не допускают такой переход, возвращаются в rejected",
+    responses={
+        200: {"description": "Смена статуса выполнена"},
+        400: {"model": ErrorResponse, "description": "Некорректные данные"}
+    }
+)
+async def bulk_change_status(
+        status_data: TaskBulkStatusRequest,
+        task_repository: TaskRepositoryDepend
+) -> TaskBulkStatusResponse:
+    use_case = BulkChangeStatusUseCase(task_repository)
+    result = await use_case.execute(
+        task_ids=[str(task_id) for task_id in status_data.ids],
+        status=status_data.status
+    )
+    return TaskBulkStatusResponse.from_result(result)
+
+
 @router.get(
     "",
     response_model=TaskListResponse,
     summary="Получение списка задач",
-    description="Возвращает список всех задач с возможностью фильтрации по статусу",
+    description="Возвращает страницу задач с фильтрацией по статусу и датам и сортировкой "
+                "по created_at или updated_at. Диапазоны дат полуоткрытые: [from, to). "
+                "Для получения следующей страницы передайте next_cursor из предыдущего ответа "
+                "вместе с теми же параметрами фильтрации и сортировки. "
+                "Без фильтров по датам total всегда точный и берется из счетчиков; "
+                "с ними режим задает параметр count, а total_mode сообщает, как получено число",
     responses={
         200: {"description": "Список задач успешно получен"},
-        400: {"model": ErrorResponse, "description": "Некорректные параметры фильтрации"}
+        304: {"description": "Страница не изменилась с момента выдачи ETag"},
+        400: {"model": ErrorResponse, "description": "Некорректные параметры фильтрации или пагинации"}
     }
 )
 async def get_tasks(
         task_repository: TaskRepositoryDepend,
-) -> TaskListResponse:
-    use_case = GetAllTasksUseCase(task_repository)
-    tasks = await use_case.execute()
+        task_filter: TaskFilterDepend,
+        response: Response,
+        limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT, description="Размер страницы"),
+        cursor: Optional[str] = Query(None, description="Курсор, полученный в next_cursor"),
+        sort_by: TaskSortField = Query(TaskSortField.CREATED_AT, description="Поле сортировки"),
+        order: SortDirection = Query(SortDirection.DESC, description="Направление сортировки"),
+        count: TaskCountMode = Query(
+            TaskCountMode.ESTIMATED,
+            description="Подсчет total: exact — точный COUNT, estimated — оценка планировщика, none — без подсчета"
+        ),
+        if_none_match: Optional[str] = Header(None, description="ETag ранее полученной страницы"),
+) -> Union[TaskListResponse, Response]:
+    query = TaskListQuery(
+        limit=limit,
+        cursor=TaskCursor.decode(cursor) if cursor else None,
+        filter=task_filter,
+        sort_field=sort_by,
+        direction=order,
+        count_mode=count
+    )
+    use_case = ListTasksUseCase(task_repository)
+    page = await use_case.execute(query)
+
+    etag = page_etag(page, page.total.mode.value, str(page.total.value))
+    if if_none_match and etag_matches(if_none_match, etag):
+        return _not_modified(etag)
+
+    if FAST_JSON_ENABLED:
+        return TaskListJSONResponse(page, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return TaskListResponse.from_domain_page(page)
 
-    return TaskListResponse.from_domain_list(tasks)
+
+@router.get(
+    "/stats",
+    response_model=TaskStatisticsResponse,
+    summary="Статистика задач",
+    description="Возвращает число задач всего и по статусам. Значения берутся из счетчиков, "
+                "которые обновляются в той же транзакции, что и сами задачи",
+    responses={
+        200: {"description": "Статистика получена"}
+    }
+)
+async def get_task_statistics(
+        task_repository: TaskRepositoryDepend
+) -> TaskStatisticsResponse:
+    use_case = GetTaskStatisticsUseCase(task_repository)
+    statistics = await use_case.execute()
+
+    return TaskStatisticsResponse.from_domain(statistics)
+
+
+@router.get(
+    "/search",
+    response_model=TaskListResponse,
+    summary="Полнотекстовый поиск задач",
+    description="Ищет задачи по словам в названии и описании с учетом словоформ. "
+                "Поддерживает синтаксис веб-поиска: \"точная фраза\", OR, -исключение. "
+                "Результаты упорядочены по релевантности; совпадения в названии весят больше. "
+                "Для следующей страницы передайте next_cursor вместе с тем же q и фильтрами",
+    responses={
+        200: {"description": "Результаты поиска"},
+        400: {"model": ErrorResponse, "description": "Некорректный запрос, фильтр или курсор"}
+    }
+)
+async def search_tasks(
+        task_repository: TaskRepositoryDepend,
+        task_filter: TaskFilterDepend,
+        q: str = Query(..., min_length=1, max_length=MAX_SEARCH_TEXT_LENGTH, description="Поисковый запрос"),
+        limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=MAX_PAGE_LIMIT, description="Размер страницы"),
+        cursor: Optional[str] = Query(None, description="Курсор, полученный в next_cursor"),
+) -> Union[TaskListResponse, Response]:
+    query = TaskSearchQuery(
+        text=q,
+        limit=limit,
+        cursor=TaskSearchCursor.decode(cursor) if cursor else None,
+        filter=task_filter
+    )
+    use_case = SearchTasksUseCase(task_repository)
+    page = await use_case.execute(query)
+
+    if FAST_JSON_ENABLED:
+        return TaskListJSONResponse(page)
+    return TaskListResponse.from_domain_page(page)
+
+
+@router.get(
+    "/suggest",
+    response_model=TaskSuggestResponse,
+    summary="Подсказки названий задач",
+    description="Возвращает названия задач, похожие на введенный текст, для автодополнения. "
+                "Устойчив к опечаткам и недописанным словам. "
+                f"Возвращает не больше {MAX_SUGGEST_LIMIT} подсказок",
+    responses={
+        200: {"description": "Подсказки получены"},
+        400: {"model": ErrorResponse, "description": "Некорректный текст запроса"}
+    }
+)
+async def suggest_task_titles(
+        task_repository: TaskRepositoryDepend,
+        q: str = Query(..., min_length=1, max_length=MAX_SEARCH_TEXT_LENGTH, description="Введенный текст"),
+        limit: int = Query(DEFAULT_SUGGEST_LIMIT, ge=1, le=MAX_SUGGEST_LIMIT, description="Число подсказок"),
+) -> TaskSuggestResponse:
+    use_case = SuggestTaskTitlesUseCase(task_repository)
+    suggestions = await use_case.execute(TaskTitleSuggestQuery(text=q, limit=limit))
+
+    return TaskSuggestResponse.from_domain_list(suggestions)
+
+
+@router.get(
+    "/export",
+    response_class=StreamingResponse,
+    summary="Выгрузка задач",
+    description="Потоково выгружает все задачи, подходящие под фильтр, в формате NDJSON или CSV. "
+                "Строки читаются серверным курсором и отдаются пачками, "
+                "поэтому потребление памяти не зависит от размера таблицы",
+    responses={
+        200: {
+            "description": "Поток задач",
+            "content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}
+        },
+        400: {"model": ErrorResponse, "description": "Некорректные параметры фильтрации"}
+    }
+)
+async def export_tasks(
+        task_repository: TaskRepositoryDepend,
+        task_filter: TaskFilterDepend,
+        export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format", description="Формат выгрузки"),
+) -> StreamingResponse:
+    chunks = task_repository.stream_rows(task_filter, chunk_size=EXPORT_CHUNK_SIZE)
+    encoder = EXPORT_ENCODERS[export_format]
+
+    return StreamingResponse(
+        encoder(chunks),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="tasks.{export_format.value}"'}
+    )
 
 
 @router.get(
     "/{task_id}",
     response_model=TaskResponse,
     summary="Получение задачи по ID",
-    description="Возвращает задачу с указанным идентификатором",
+    description="Возвращает задачу с указанным идентификатором. "
+                "Поддерживает условный запрос через If-None-Match",
     responses={
         200: {"description": "Задача найдена"},
+        304: {"description": "Задача не изменилась с момента выдачи ETag"},
         404: {"model": ErrorResponse, "description": "Задача не найдена"},
         400: {"model": ErrorResponse, "description": "Некорректный ID задачи"}
     }
 )
 async def get_task(
         task_id: UUID,
-        task_repository: TaskRepositoryDepend
-) -> TaskResponse:
+        task_repository: TaskRepositoryDepend,
+        response: Response,
+        if_none_match: Optional[str] = Header(None, description="ETag ранее полученной версии задачи"),
+) -> Union[TaskResponse, Response]:
+    if if_none_match:
+        # Сверяем только updated_at, не загружая и не сериализуя задачу
+        version = await GetTaskVersionUseCase(task_repository).execute(str(task_id))
+        if version is not None:
+            etag = task_etag(str(task_id), version)
+            if etag_matches(if_none_match, etag):
+                return _not_modified(etag)
+
     use_case = GetTaskUseCase(task_repository)
     task = await use_case.execute(str(task_id))
+
+    response.headers["ETag"] = task_etag(task.id, task.updated_at)
+    response.headers["Cache-Control"] = CACHE_CONTROL
     return TaskResponse.from_domain(task)
 
 
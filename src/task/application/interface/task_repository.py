@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, AsyncIterator, List, Optional, Sequence
 
-from src.task.domain.entities import Task
+from src.task.domain.entities import Task, TaskStatistics, TaskStatus, TaskStatusChange
+from src.task.domain.queries import (
+    TaskCount, TaskCountMode, TaskFilter, TaskListQuery, TaskPage, TaskSearchPage, TaskSearchQuery, TaskTitleSuggestion,
+    TaskTitleSuggestQuery
+)
 
 
 class TaskRepository(ABC):
@@ -10,22 +15,77 @@ class TaskRepository(ABC):
     async def create(self, task: Task) -> Task:
         pass
 
+    @abstractmethod
+    async def create_many(self, tasks: List[Task]) -> List[Task]:
+        pass
+
     @abstractmethod
     async def get_by_id(self, task_id: str) -> Optional[Task]:
         pass
 
+    @abstractmethod
+    async def get_version(self, task_id: str) -> Optional[datetime]:
+        """updated_at задачи без загрузки остальных полей"""
+        pass
+
     @abstractmethod
     async def get_all(self) -> List[Task]:
         pass
 
     @abstractmethod
-    async def update(self, task: Task) -> Task:
+    async def get_page(self, query: TaskListQuery) -> TaskPage:
+        pass
+
+    @abstractmethod
+    async def count(self, task_filter: TaskFilter, mode: TaskCountMode) -> TaskCount:
+        """Число задач под фильтром: точное, оценка планировщика или ничего"""
         pass
 
     @abstractmethod
-    async def delete(self, task_id: str) -> bool:
+    async def search(self, query: TaskSearchQuery) -> TaskSearchPage:
+        """Полнотекстовый поиск по title и description, самые релевантные первыми"""
+        pass
+
+    @abstractmethod
+    async def suggest_titles(self, query: TaskTitleSuggestQuery) -> List[TaskTitleSuggestion]:
+        """Различные названия задач, похожие на введенный текст, самые похожие первыми"""
+        pass
+
+    @abstractmethod
+    def stream_rows(self, task_filter: TaskFilter, chunk_size: int) -> AsyncIterator[Sequence[Any]]:
+        """Пачки строк (id, title, description, status, created_at, updated_at) без построения сущностей"""
+        pass
+
+    @abstractmethod
+    async def update_fields(
+            self,
+            task_id: str,
+            updated_at: datetime,
+            title: Optional[str] = None,
+            description: Optional[str] = None,
+            status: Optional[TaskStatus] = None
+    ) -> Task:
+        """Обновляет переданные поля и возвращает новую версию задачи.
+        Бросает TaskNotFoundError или TaskStatusTransitionError"""
+        pass
+
+    @abstractmethod
+    async def change_status_many(
+            self, task_ids: List[str], new_status: TaskStatus, updated_at: datetime
+    ) -> List[TaskStatusChange]:
+        """Меняет статус найденных задач, если переход допустим; отсутствующие id в результат не попадают"""
+        pass
+
+    @abstractmethod
+    async def delete_returning(self, task_id: str) -> Optional[Task]:
+        """Удаляет задачу, если правила домена это позволяют, и возвращает удаленную строку"""
         pass
 
     @abstractmethod
     async def exists(self, task_id: str) -> bool:
         pass
+
+    @abstractmethod
+    async def get_statistics(self) -> TaskStatistics:
+        """Число задач всего и по статусам; стоимость не зависит от размера таблицы"""
+        pass
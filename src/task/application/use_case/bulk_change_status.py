@@ -0,0 +1,63 @@
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List
+
+from src.task.application.interface.task_repository import TaskRepository
+from src.task.domain.entities import TaskStatus
+from src.task.domain.exeptions.tasks_exeptions import (
+    TaskDomainError,
+    TaskNotFoundError,
+    TaskStatusTransitionError,
+    TaskValidationError,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RejectedStatusChange:
+    task_id: str
+    error: TaskDomainError
+
+
+@dataclass(frozen=True)
+class BulkStatusChangeResult:
+    updated: List[str] = field(default_factory=list)
+    rejected: List[RejectedStatusChange] = field(default_factory=list)
+
+
+class BulkChangeStatusUseCase:
+
+    def __init__(self, task_repository: TaskRepository):
+        self._repository = task_repository
+
+    async def execute(self, task_ids: List[str], status: str) -> BulkStatusChangeResult:
+        try:
+            new_status = TaskStatus(status)
+        except ValueError:
+            valid_statuses = [s.value for s in TaskStatus]
+            raise TaskValidationError(f"Неверный статус: {status}. Допустимые: {valid_statuses}")
+
+        unique_ids = list(dict.fromkeys(task_ids))
+
+        try:
+            changes = await self._repository.change_status_many(unique_ids, new_status, datetime.utcnow())
+        except Exception as e:
+            logger.error("Неожиданная ошибка при пакетной смене статуса: %s", e)
+            raise TaskValidationError(f"Не удалось изменить статус задач: {str(e)}")
+
+        found = {change.task_id: change for change in changes}
+        result = BulkStatusChangeResult()
+
+        for task_id in unique_ids:
+            change = found.get(task_id)
+            if change is None:
+                result.rejected.append(RejectedStatusChange(task_id, TaskNotFoundError(task_id)))
+            elif not change.applied:
+                error = TaskStatusTransitionError(change.from_status.value, new_status.value)
+                result.rejected.append(RejectedStatusChange(task_id, error))
+            else:
+                result.updated.append(task_id)
+
+        return result
@@ -0,0 +1,47 @@
+import logging
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+from src.task.application.interface.task_repository import TaskRepository
+from src.task.domain.entities import Task
+from src.task.domain.exeptions.tasks_exeptions import TaskDomainError, TaskValidationError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BulkCreateItemResult:
+    index: int
+    task: Optional[Task] = None
+    error: Optional[TaskDomainError] = None
+
+
+class BulkCreateTasksUseCase:
+
+    def __init__(self, task_repository: TaskRepository):
+        self._repository = task_repository
+
+    async def execute(self, items: List[Tuple[str, str]]) -> List[BulkCreateItemResult]:
+        results: List[Optional[BulkCreateItemResult]] = [None] * len(items)
+        valid_indexes = []
+        valid_tasks = []
+
+        for index, (title, description) in enumerate(items):
+            try:
+                valid_tasks.append(Task.create(title=title, description=description))
+                valid_indexes.append(index)
+            except TaskValidationError as e:
+                results[index] = BulkCreateItemResult(index=index, error=e)
+            except ValueError as e:
+                results[index] = BulkCreateItemResult(index=index, error=TaskValidationError(str(e)))
+
+        try:
+            created_tasks = await self._repository.create_many(valid_tasks)
+        except Exception as e:
+            logger.error("Неожиданная ошибка при пакетном создании задач: %s", e)
+            raise TaskValidationError(f"Не удалось создать задачи: {str(e)}")
+
+        for index, task in zip(valid_indexes, created_tasks):
+            results[index] = BulkCreateItemResult(index=index, task=task)
+
+        return results
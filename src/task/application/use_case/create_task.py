@@ -23,5 +23,5 @@ class CreateTaskUseCase:
         except TaskValidationError:
             raise
         except Exception as e:
-            logger.error(f"Неожиданная ошибка при создании задачи: {e}")
+            logger.error("Неожиданная ошибка при создании задачи: %s", e)
             raise TaskValidationError(f"Не удалось создать задачу: {str(e)}")
@@ -13,15 +13,13 @@ class DeleteTaskUseCase:
 
     async def execute(self, task_id: str) -> bool:
 
-        task = await self._repository.get_by_id(task_id)
-        if not task:
-            raise TaskNotFoundError(task_id)
+        # Правило can_be_deleted проверяется в самом DELETE; второй запрос
+        # нужен только чтобы отличить отсутствующую задачу от запрещенного удаления
+        deleted_task = await self._repository.delete_returning(task_id)
+        if deleted_task:
+            return True
 
-        if not task.can_be_deleted():
+        if await self._repository.exists(task_id):
             raise TaskBusinessRuleViolationError(f"Задача с ID {task_id} не может быть удалена")
 
-        deleted = await self._repository.delete(task_id)
-
-        if not deleted:
-            raise TaskBusinessRuleViolationError(f"Не удалось удалить задачу с ID {task_id}")
-        return deleted
+        raise TaskNotFoundError(task_id)
@@ -15,7 +15,7 @@ class GetTaskUseCase:
     async def execute(self, task_id: str) -> Task:
         task = await self._repository.get_by_id(task_id)
         if not task:
-            logger.warning(f"Задача не найдена: {task_id}")
+            logger.warning("Задача не найдена: %s", task_id)
             raise TaskNotFoundError(task_id)
 
         return task
@@ -0,0 +1,16 @@
+import logging
+
+from src.task.application.interface.task_repository import TaskRepository
+from src.task.domain.entities import TaskStatistics
+
+logger = logging.getLogger(__name__)
+
+
+class GetTaskStatisticsUseCase:
+
+    def __init__(self, task_repository: TaskRepository):
+        self._repository = task_repository
+
+    async def execute(self) -> TaskStatistics:
+        statistics = await self._repository.get_statistics()
+        return statistics
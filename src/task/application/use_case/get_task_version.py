@@ -0,0 +1,17 @@
+import logging
+from datetime import datetime
+from typing import Optional
+
+from src.task.application.interface.task_repository import TaskRepository
+
+logger = logging.getLogger(__name__)
+
+
+class GetTaskVersionUseCase:
+
+    def __init__(self, task_repository: TaskRepository):
+        self._repository = task_repository
+
+    async def execute(self, task_id: str) -> Optional[datetime]:
+        version = await self._repository.get_version(task_id)
+        return version
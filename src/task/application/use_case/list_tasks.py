@@ -0,0 +1,22 @@
+import logging
+from dataclasses import replace
+
+from src.task.application.interface.task_repository import TaskRepository
+from src.task.domain.queries import TaskCountMode, TaskListQuery, TaskPage
+
+logger = logging.getLogger(__name__)
+
+
+class ListTasksUseCase:
+
+    def __init__(self, task_repository: TaskRepository):
+        self._repository = task_repository
+
+    async def execute(self, query: TaskListQuery) -> TaskPage:
+        page = await self._repository.get_page(query)
+
+        if query.count_mode != TaskCountMode.NONE:
+            total = await self._repository.count(query.filter, query.count_mode)
+            page = replace(page, total=total)
+
+        return page
@@ -0,0 +1,16 @@
+import logging
+
+from src.task.application.interface.task_repository import TaskRepository
+from src.task.domain.queries import TaskSearchPage, TaskSearchQuery
+
+logger = logging.getLogger(__name__)
+
+
+class SearchTasksUseCase:
+
+    def __init__(self, task_repository: TaskRepository):
+        self._repository = task_repository
+
+    async def execute(self, query: TaskSearchQuery) -> TaskSearchPage:
+        page = await self._repository.search(query)
+        return page
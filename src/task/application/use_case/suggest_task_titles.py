@@ -0,0 +1,17 @@
+import logging
+from typing import List
+
+from src.task.application.interface.task_repository import TaskRepository
+from src.task.domain.queries import TaskTitleSuggestion, TaskTitleSuggestQuery
+
+logger = logging.getLogger(__name__)
+
+
+class SuggestTaskTitlesUseCase:
+
+    def __init__(self, task_repository: TaskRepository):
+        self._repository = task_repository
+
+    async def execute(self, query: TaskTitleSuggestQuery) -> List[TaskTitleSuggestion]:
+        suggestions = await self._repository.suggest_titles(query)
+        return suggestions
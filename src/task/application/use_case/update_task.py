@@ -1,4 +1,5 @@
 import logging
+from datetime import datetime
 from typing import Optional
 
 from src.task.application.interface.task_repository import TaskRepository
@@ -21,42 +22,46 @@ class UpdateTaskUseCase:
             status: Optional[str] = None
     ) -> Task:
 
-        existing_task = await self._repository.get_by_id(task_id)
-        if not existing_task:
-            logger.warning(f"Задача не найдена для обновления: {task_id}")
-            raise TaskNotFoundError(task_id)
-
-        updated_task = existing_task
+        if title is None and description is None and status is None:
+            existing_task = await self._repository.get_by_id(task_id)
+            if not existing_task:
+                logger.warning("Задача не найдена для обновления: %s", task_id)
+                raise TaskNotFoundError(task_id)
+            return existing_task
 
         try:
-            if title is not None:
-                updated_task = updated_task.update_title(title)
-
-            if description is not None:
-                updated_task = updated_task.update_description(description)
-
+            new_status = None
             if status is not None:
                 try:
                     new_status = TaskStatus(status)
+                except ValueError:
+                    valid_statuses = [s.value for s in TaskStatus]
+                    raise TaskValidationError(f"Неверный статус: {status}. Допустимые: {valid_statuses}")
 
-                    existing_task.validate_transition_to(new_status)
-
-                    updated_task = updated_task.change_status(new_status)
-
-                except ValueError as e:
-                    if "is not a valid" in str(e):
-                        valid_statuses = [s.value for s in TaskStatus]
-                        raise TaskValidationError(f"Неверный статус: {status}. Допустимые: {valid_statuses}")
-                    raise
-                except TaskStatusTransitionError:
-                    raise
+            if title is not None:
+                title = title.strip()
+                Task.validate_title(title)
 
-            saved_task = await self._repository.update(updated_task)
+            if description is not None:
+                description = description.strip()
+                Task.validate_description(description)
+
+            # Проверка перехода статуса выполняется в том же UPDATE, что и запись
+            saved_task = await self._repository.update_fields(
+                task_id,
+                updated_at=datetime.utcnow(),
+                title=title,
+                description=description,
+                status=new_status
+            )
 
             return saved_task
 
+        except TaskNotFoundError:
+            logger.warning("Задача не найдена для обновления: %s", task_id)
+            raise
         except (TaskValidationError, TaskStatusTransitionError):
             raise
         except Exception as e:
-            logger.error(f"Неожиданная ошибка при обновлении задачи {task_id}: {e}")
+            logger.error("Неожиданная ошибка при обновлении задачи %s: %s", task_id, e)
             raise TaskValidationError(f"Не удалось обновить задачу: {str(e)}")
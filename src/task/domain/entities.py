@@ -1,7 +1,8 @@
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
 from enum import Enum
+from typing import Dict, List
 
 from src.task.domain.exeptions.tasks_exeptions import TaskStatusTransitionError, TaskValidationError
 
@@ -12,7 +13,16 @@ class TaskStatus(Enum):
     COMPLETED = "завершено"
 
 
-@dataclass(frozen=True)
+STATUS_TRANSITIONS = {
+    TaskStatus.CREATED: [TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED],
+    TaskStatus.IN_PROGRESS: [TaskStatus.COMPLETED, TaskStatus.CREATED],
+    TaskStatus.COMPLETED: [TaskStatus.IN_PROGRESS]
+}
+
+DELETABLE_STATUSES = frozenset(TaskStatus)
+
+
+@dataclass(frozen=True, slots=True)
 class Task:
     id: str
     title: str
@@ -25,15 +35,46 @@ class Task:
         self._validate()
 
     def _validate(self):
-        if not self.title or not self.title.strip():
+        self.validate_title(self.title)
+        self.validate_description(self.description)
+
+    @staticmethod
+    def validate_title(title: str) -> None:
+        if not title or not title.strip():
             raise TaskValidationError("Название задачи не может быть пустым")
 
-        if len(self.title.strip()) > 200:
+        if len(title.strip()) > 200:
             raise TaskValidationError("Название задачи не может превышать 200 символов")
 
-        if len(self.description) > 1000:
+    @staticmethod
+    def validate_description(description: str) -> None:
+        if len(description) > 1000:
             raise TaskValidationError("Описание задачи не может превышать 1000 символов")
 
+    @classmethod
+    def from_trusted(
+            cls,
+            id: str,
+            title: str,
+            description: str,
+            status: TaskStatus,
+            created_at: datetime,
+            updated_at: datetime
+    ) -> 'Task':
+        """Собирает задачу из уже проверенных данных (строк БД) без повторной валидации.
+
+        Поля пишутся напрямую через дескрипторы слотов, минуя __init__ и frozen __setattr__.
+        """
+        task = object.__new__(cls)
+        set_id, set_title, set_description, set_status, set_created_at, set_updated_at = _TASK_SLOT_SETTERS
+        set_id(task, id)
+        set_title(task, title)
+        set_description(task, description)
+        set_status(task, status)
+        set_created_at(task, created_at)
+        set_updated_at(task, updated_at)
+        return task
+
     @classmethod
     def create(cls, title: str, description: str) -> 'Task':
         if not title or not title.strip():
@@ -91,19 +132,13 @@ class Task:
         return self.status == TaskStatus.COMPLETED
 
     def can_be_deleted(self) -> bool:
-        return True
+        return self.status in DELETABLE_STATUSES
 
     def get_status_display(self) -> str:
         return self.status.value
 
     def validate_transition_to(self, new_status: TaskStatus) -> bool:
-        transitions = {
-            TaskStatus.CREATED: [TaskStatus.IN_PROGRESS, TaskStatus.COMPLETED],
-            TaskStatus.IN_PROGRESS: [TaskStatus.COMPLETED, TaskStatus.CREATED],
-            TaskStatus.COMPLETED: [TaskStatus.IN_PROGRESS]
-        }
-
-        allowed_statuses = transitions.get(self.status, [])
+        allowed_statuses = STATUS_TRANSITIONS.get(self.status, [])
         is_valid = new_status in allowed_statuses or new_status == self.status
 
         if not is_valid:
@@ -111,5 +146,28 @@ class Task:
 
         return True
 
+    @staticmethod
+    def allowed_source_statuses(new_status: TaskStatus) -> List[TaskStatus]:
+        return [
+            status for status in TaskStatus
+            if status == new_status or new_status in STATUS_TRANSITIONS.get(status, [])
+        ]
+
     def __str__(self) -> str:
         return f"Task(id={self.id[:8]}..., title='{self.title}', status={self.status.value})"
+
+
+_TASK_SLOT_SETTERS = tuple(getattr(Task, field.name).__set__ for field in fields(Task))
+
+
+@dataclass(frozen=True)
+class TaskStatusChange:
+    task_id: str
+    from_status: TaskStatus
+    applied: bool
+
+
+@dataclass(frozen=True)
+class TaskStatistics:
+    total: int
+    by_status: Dict[TaskStatus, int]
@@ -0,0 +1,220 @@
+import base64
+import binascii
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import List, Optional
+
+from src.task.domain.entities import Task, TaskStatus
+from src.task.domain.exeptions.tasks_exeptions import TaskValidationError
+
+DEFAULT_PAGE_LIMIT = 50
+MAX_PAGE_LIMIT = 500
+
+MAX_SEARCH_TEXT_LENGTH = 200
+
+DEFAULT_SUGGEST_LIMIT = 10
+MAX_SUGGEST_LIMIT = 20
+
+
+class TaskSortField(Enum):
+    CREATED_AT = "created_at"
+    UPDATED_AT = "updated_at"
+
+
+class SortDirection(Enum):
+    ASC = "asc"
+    DESC = "desc"
+
+
+class TaskCountMode(Enum):
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
+def _encode_cursor(payload: dict) -> str:
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(value: str) -> dict:
+    padded = value + "=" * (-len(value) % 4)
+    return json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+
+
+def _to_naive_utc(value: Optional[datetime]) -> Optional[datetime]:
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+@dataclass(frozen=True)
+class TaskFilter:
+    status: Optional[TaskStatus] = None
+    created_from: Optional[datetime] = None
+    created_to: Optional[datetime] = None
+    updated_from: Optional[datetime] = None
+    updated_to: Optional[datetime] = None
+
+    def __post_init__(self):
+        for name in ("created_from", "created_to", "updated_from", "updated_to"):
+            object.__setattr__(self, name, _to_naive_utc(getattr(self, name)))
+        self._validate()
+
+    @property
+    def has_date_range(self) -> bool:
+        return any((self.created_from, self.created_to, self.updated_from, self.updated_to))
+
+    def _validate(self):
+        if self.created_from and self.created_to and self.created_from > self.created_to:
+            raise TaskValidationError("Начало диапазона created_at позже его конца")
+
+        if self.updated_from and self.updated_to and self.updated_from > self.updated_to:
+            raise TaskValidationError("Начало диапазона updated_at позже его конца")
+
+
+@dataclass(frozen=True)
+class TaskCursor:
+    """Позиция в ленте задач: значение поля сортировки и id последней выданной задачи"""
+    sort_field: TaskSortField
+    direction: SortDirection
+    value: datetime
+    id: str
+
+    @classmethod
+    def from_task(cls, task: Task, sort_field: TaskSortField, direction: SortDirection) -> 'TaskCursor':
+        return cls(
+            sort_field=sort_field,
+            direction=direction,
+            value=getattr(task, sort_field.value),
+            id=str(task.id)
+        )
+
+    def encode(self) -> str:
+        return _encode_cursor({
+            "sort": self.sort_field.value,
+            "order": self.direction.value,
+            "value": self.value.isoformat(),
+            "id": self.id
+        })
+
+    @classmethod
+    def decode(cls, value: str) -> 'TaskCursor':
+        try:
+            payload = _decode_cursor(value)
+            return cls(
+                sort_field=TaskSortField(payload["sort"]),
+                direction=SortDirection(payload["order"]),
+                value=datetime.fromisoformat(payload["value"]),
+                id=str(uuid.UUID(payload["id"]))
+            )
+        except (ValueError, KeyError, TypeError, binascii.Error):
+            raise TaskValidationError("Некорректный курсор пагинации")
+
+
+@dataclass(frozen=True)
+class TaskListQuery:
+    limit: int = DEFAULT_PAGE_LIMIT
+    cursor: Optional[TaskCursor] = None
+    filter: TaskFilter = field(default_factory=TaskFilter)
+    sort_field: TaskSortField = TaskSortField.CREATED_AT
+    direction: SortDirection = SortDirection.DESC
+    count_mode: TaskCountMode = TaskCountMode.NONE
+
+    def __post_init__(self):
+        if self.cursor and (self.cursor.sort_field, self.cursor.direction) != (self.sort_field, self.direction):
+            raise TaskValidationError("Курсор пагинации получен для другой сортировки")
+
+
+@dataclass(frozen=True)
+class TaskCount:
+    """Число задач под фильтром и способ, которым оно получено.
+
+    Может оказаться точнее запрошенного: если счетчики позволяют дать точное
+    число так же дешево, как оценку, mode будет EXACT.
+    """
+    value: Optional[int]
+    mode: TaskCountMode
+
+    @classmethod
+    def none(cls) -> 'TaskCount':
+        return cls(value=None, mode=TaskCountMode.NONE)
+
+
+@dataclass(frozen=True)
+class TaskPage:
+    tasks: List[Task]
+    next_cursor: Optional[TaskCursor] = None
+    total: TaskCount = field(default_factory=TaskCount.none)
+
+
+@dataclass(frozen=True)
+class TaskSearchCursor:
+    """Позиция в результатах поиска: релевантность и id последней выданной задачи"""
+    rank: float
+    id: str
+
+    def encode(self) -> str:
+        return _encode_cursor({"rank": self.rank, "id": self.id})
+
+    @classmethod
+    def decode(cls, value: str) -> 'TaskSearchCursor':
+        try:
+            payload = _decode_cursor(value)
+            return cls(rank=float(payload["rank"]), id=str(uuid.UUID(payload["id"])))
+        except (ValueError, KeyError, TypeError, binascii.Error):
+            raise TaskValidationError("Некорректный курсор пагинации")
+
+
+@dataclass(frozen=True)
+class TaskSearchQuery:
+    text: str
+    limit: int = DEFAULT_PAGE_LIMIT
+    cursor: Optional[TaskSearchCursor] = None
+    filter: TaskFilter = field(default_factory=TaskFilter)
+
+    def __post_init__(self):
+        text = " ".join(self.text.split())
+        if not text:
+            raise TaskValidationError("Поисковый запрос не может быть пустым")
+        if len(text) > MAX_SEARCH_TEXT_LENGTH:
+            raise TaskValidationError(
+                f"Поисковый запрос не может быть длиннее {MAX_SEARCH_TEXT_LENGTH} символов"
+            )
+        object.__setattr__(self, "text", text)
+
+
+@dataclass(frozen=True)
+class TaskSearchPage:
+    tasks: List[Task]
+    next_cursor: Optional[TaskSearchCursor] = None
+    total: TaskCount = field(default_factory=TaskCount.none)
+
+
+@dataclass(frozen=True)
+class TaskTitleSuggestQuery:
+    text: str
+    limit: int = DEFAULT_SUGGEST_LIMIT
+
+    def __post_init__(self):
+        # Регистр и лишние пробелы на похожесть не влияют, а нормализованный
+        # текст дает больше попаданий в кэш подсказок
+        text = " ".join(self.text.split()).lower()
+        if not text:
+            raise TaskValidationError("Текст для подсказки не может быть пустым")
+        if len(text) > MAX_SEARCH_TEXT_LENGTH:
+            raise TaskValidationError(
+                f"Текст для подсказки не может быть длиннее {MAX_SEARCH_TEXT_LENGTH} символов"
+            )
+        if not 1 <= self.limit <= MAX_SUGGEST_LIMIT:
+            raise TaskValidationError(f"Число подсказок должно быть от 1 до {MAX_SUGGEST_LIMIT}")
+        object.__setattr__(self, "text", text)
+
+
+@dataclass(frozen=True)
+class TaskTitleSuggestion:
+    title: str
+    score: float
@@ -0,0 +1,22 @@
+import os
+
+from src.core.cache.lru import LRUTTLCache
+from src.task.infrastructure.cache.repository import suggestions_size, task_size
+
+TASK_CACHE_ENABLED = os.getenv("TASK_CACHE_ENABLED", "true").lower() == "true"
+
+task_cache = LRUTTLCache(
+    max_bytes=int(os.getenv("TASK_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+    ttl=float(os.getenv("TASK_CACHE_TTL_SECONDS", "10")),
+    negative_ttl=float(os.getenv("TASK_CACHE_NEGATIVE_TTL_SECONDS", "2")),
+    sizeof=task_size
+)
+
+# Подсказки меняются вместе с любыми названиями, поэтому живут секунды:
+# этого хватает, чтобы серия одинаковых запросов при наборе текста шла мимо БД
+suggest_cache = LRUTTLCache(
+    max_bytes=int(os.getenv("TASK_SUGGEST_CACHE_MAX_BYTES", str(4 * 1024 * 1024))),
+    ttl=float(os.getenv("TASK_SUGGEST_CACHE_TTL_SECONDS", "2")),
+    negative_ttl=float(os.getenv("TASK_SUGGEST_CACHE_TTL_SECONDS", "2")),
+    sizeof=suggestions_size
+)
@@ -0,0 +1,137 @@
+import logging
+import sys
+from datetime import datetime
+from typing import Any, AsyncIterator, List, Optional, Sequence
+
+from src.core.cache.lru import MISSING, LRUTTLCache
+from src.task.application.interface.task_repository import TaskRepository
+from src.task.domain.entities import Task, TaskStatistics, TaskStatus, TaskStatusChange
+from src.task.domain.queries import (
+    TaskCount, TaskCountMode, TaskFilter, TaskListQuery, TaskPage, TaskSearchPage, TaskSearchQuery, TaskTitleSuggestion,
+    TaskTitleSuggestQuery
+)
+
+logger = logging.getLogger(__name__)
+
+
+def task_size(task: Task) -> int:
+    return sys.getsizeof(task) + sum(
+        sys.getsizeof(value)
+        for value in (task.id, task.title, task.description, task.created_at, task.updated_at)
+    )
+
+
+def suggestions_size(suggestions: List[TaskTitleSuggestion]) -> int:
+    return sys.getsizeof(suggestions) + sum(
+        sys.getsizeof(suggestion) + sys.getsizeof(suggestion.title) for suggestion in suggestions
+    )
+
+
+class CachedTaskRepository(TaskRepository):
+    """Кэширует get_by_id поверх другого репозитория и сбрасывает ключи при записи.
+
+    Подсказки названий кэшируются отдельно и без инвалидации: их нельзя привязать
+    к одной задаче, поэтому свежесть обеспечивает только короткий TTL.
+    """
+
+    def __init__(
+            self,
+            repository: TaskRepository,
+            cache: LRUTTLCache,
+            suggest_cache: Optional[LRUTTLCache] = None
+    ):
+        self._repository = repository
+        self._cache = cache
+        self._suggest_cache = suggest_cache
+
+    async def get_by_id(self, task_id: str) -> Optional[Task]:
+        key = str(task_id)
+        cached = self._cache.get(key)
+        if cached is not MISSING:
+            return cached
+
+        version = self._cache.version
+        task = await self._repository.get_by_id(task_id)
+        self._cache.set(key, task, if_version=version)
+        return task
+
+    async def get_version(self, task_id: str) -> Optional[datetime]:
+        cached = self._cache.get(str(task_id))
+        if cached is not MISSING:
+            return cached.updated_at if cached is not None else None
+        return await self._repository.get_version(task_id)
+
+    async def create(self, task: Task) -> Task:
+        self._cache.invalidate(str(task.id))
+        created_task = await self._repository.create(task)
+        self._cache.set(str(created_task.id), created_task)
+        return created_task
+
+    async def create_many(self, tasks: List[Task]) -> List[Task]:
+        for task in tasks:
+            self._cache.invalidate(str(task.id))
+        return await self._repository.create_many(tasks)
+
+    async def get_all(self) -> List[Task]:
+        return await self._repository.get_all()
+
+    async def get_page(self, query: TaskListQuery) -> TaskPage:
+        return await self._repository.get_page(query)
+
+    async def count(self, task_filter: TaskFilter, mode: TaskCountMode) -> TaskCount:
+        return await self._repository.count(task_filter, mode)
+
+    async def search(self, query: TaskSearchQuery) -> TaskSearchPage:
+        return await self._repository.search(query)
+
+    async def suggest_titles(self, query: TaskTitleSuggestQuery) -> List[TaskTitleSuggestion]:
+        if self._suggest_cache is None:
+            return await self._repository.suggest_titles(query)
+
+        key = (query.text, query.limit)
+        cached = self._suggest_cache.get(key)
+        if cached is not MISSING:
+            return cached
+
+        suggestions = await self._repository.suggest_titles(query)
+        self._suggest_cache.set(key, suggestions)
+        return suggestions
+
+    def stream_rows(self, task_filter: TaskFilter, chunk_size: int) -> AsyncIterator[Sequence[Any]]:
+        return self._repository.stream_rows(task_filter, chunk_size)
+
+    async def update_fields(
+            self,
+            task_id: str,
+            updated_at: datetime,
+            title: Optional[str] = None,
+            description: Optional[str] = None,
+            status: Optional[TaskStatus] = None
+    ) -> Task:
+        try:
+            return await self._repository.update_fields(
+                task_id, updated_at, title=title, description=description, status=status
+            )
+        finally:
+            self._cache.invalidate(str(task_id))
+
+    async def change_status_many(
+            self, task_ids: List[str], new_status: TaskStatus, updated_at: datetime
+    ) -> List[TaskStatusChange]:
+        try:
+            return await self._repository.change_status_many(task_ids, new_status, updated_at)
+        finally:
+            for task_id in task_ids:
+                self._cache.invalidate(str(task_id))
+
+    async def delete_returning(self, task_id: str) -> Optional[Task]:
+        try:
+            return await self._repository.delete_returning(task_id)
+        finally:
+            self._cache.invalidate(str(task_id))
+
+    async def exists(self, task_id: str) -> bool:
+        return await self._repository.exists(task_id)
+
+    async def get_statistics(self) -> TaskStatistics:
+        return await self._repository.get_statistics()
@@ -0,0 +1,98 @@
+import asyncio
+import logging
+import os
+from typing import Dict
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from .models import Task as DBTask, TaskCounter as DBTaskCounter
+
+logger = logging.getLogger(__name__)
+
+COUNTERS_RECONCILE_INTERVAL = float(os.getenv("TASK_COUNTERS_RECONCILE_INTERVAL_SECONDS", "3600"))
+
+# Поправки пишутся в один шард: итог все равно считается суммой по шардам
+_CORRECTION_SHARD = 0
+
+# Ключ pg_advisory_lock для сверки счетчиков: "tasks" в ASCII
+_RECONCILE_LOCK_KEY = 0x7461736B73
+
+
+async def reconcile_task_counters(session_maker: async_sessionmaker[AsyncSession]) -> Dict[str, int]:
+    """Сверяет счетчики с COUNT(*) по tasks и дописывает разницу. Возвращает поправки по статусам.
+
+    Оба подсчета делаются в одном снимке REPEATABLE READ, поэтому разница не зависит
+    от параллельных записей: их триггеры применят свои изменения сами. Поправка
+    прибавляется к счетчику, а не перезаписывает его, так что блокировать запись
+    в tasks на время полного подсчета не нужно.
+
+    Сверки разных процессов идут по очереди под сессионной advisory-блокировкой,
+    взятой до начала снимка: иначе две сверки посчитали бы одну и ту же разницу
+    и прибавили ее дважды.
+    """
+    async with session_maker() as lock_session:
+        lock = await lock_session.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+        await lock.execute(select(func.pg_advisory_lock(_RECONCILE_LOCK_KEY)))
+        try:
+            return await _reconcile(session_maker)
+        finally:
+            await lock.execute(select(func.pg_advisory_unlock(_RECONCILE_LOCK_KEY)))
+
+
+async def _reconcile(session_maker: async_sessionmaker[AsyncSession]) -> Dict[str, int]:
+    async with session_maker() as session:
+        await session.connection(
+            execution_options={"isolation_level": "REPEATABLE READ", "postgresql_readonly": True}
+        )
+        actual = {
+            status: int(count)
+            for status, count in await session.execute(select(DBTask.status, func.count()).group_by(DBTask.status))
+        }
+        counted = {
+            status: int(count)
+            for status, count in await session.execute(
+                select(DBTaskCounter.status, func.sum(DBTaskCounter.count)).group_by(DBTaskCounter.status)
+            )
+        }
+        await session.commit()
+
+    corrections = {
+        status: actual.get(status, 0) - counted.get(status, 0)
+        for status in sorted(actual.keys() | counted.keys())
+        if actual.get(status, 0) != counted.get(status, 0)
+    }
+    if not corrections:
+        return corrections
+
+    async with session_maker() as session:
+        stmt = insert(DBTaskCounter).values([
+            {"status": status, "shard": _CORRECTION_SHARD, "count": delta}
+            for status, delta in corrections.items()
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DBTaskCounter.status, DBTaskCounter.shard],
+            set_={"count": DBTaskCounter.count + stmt.excluded.count}
+        )
+        await session.execute(stmt)
+        await session.commit()
+
+    return corrections
+
+
+async def run_counters_reconciliation(session_maker: async_sessionmaker[AsyncSession], interval: float) -> None:
+    """Сверяет счетчики сразу и затем каждые interval секунд, пока задачу не отменят"""
+    while True:
+        try:
+            corrections = await reconcile_task_counters(session_maker)
+            if corrections:
+                logger.warning("Счетчики задач расходились с таблицей, внесены поправки: %s", corrections)
+            else:
+                logger.debug("Счетчики задач совпадают с таблицей")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Ошибка сверки счетчиков задач: %s", e)
+
+        await asyncio.sleep(interval)
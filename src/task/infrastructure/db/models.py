@@ -1,12 +1,22 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Column, String, Text, DateTime, Index
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import DDL, BigInteger, Column, Computed, SmallInteger, String, Text, DateTime, Index, event
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import deferred
 
 Base = declarative_base()
 
+# Русская конфигурация дает стемминг ("задачи" находит "задача"), simple — точные
+# совпадения слов, которые русский словарь не знает: коды, имена, латиница
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('russian'::regconfig, title), 'A') || "
+    "setweight(to_tsvector('russian'::regconfig, description), 'B') || "
+    "setweight(to_tsvector('simple'::regconfig, title), 'C') || "
+    "setweight(to_tsvector('simple'::regconfig, description), 'D')"
+)
+
 
 class Task(Base):
     __tablename__ = 'tasks'
@@ -22,13 +32,92 @@ class Task(Base):
     status = Column(String(20), nullable=False, default='создано')
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    # Нужен только в WHERE поиска, поэтому при загрузке задачи не читается
+    search_vector = deferred(Column(TSVECTOR, Computed(SEARCH_VECTOR_EXPRESSION, persisted=True)))
 
     __table_args__ = (
-        Index('idx_tasks_status', 'status'),
-        Index('idx_tasks_created_at', 'created_at'),
-        Index('idx_tasks_updated_at', 'updated_at'),
+        # Каждое сочетание фильтра по статусу и сортировки списка обслуживается
+        # своим индексом; btree читается в обе стороны, так что asc/desc не важны
+        Index('idx_tasks_created_at_id', 'created_at', 'id'),
+        Index('idx_tasks_updated_at_id', 'updated_at', 'id'),
+        Index('idx_tasks_status_created_at_id', 'status', 'created_at', 'id'),
+        Index('idx_tasks_status_updated_at_id', 'status', 'updated_at', 'id'),
         Index('idx_tasks_title', 'title'),
+        Index('idx_tasks_search_vector', 'search_vector', postgresql_using='gin'),
+        # Подсказки названий: word_similarity и оператор <% из pg_trgm
+        Index(
+            'idx_tasks_title_trgm', 'title',
+            postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}
+        ),
     )
 
     def __repr__(self) -> str:
         return f"<Task(id={self.id}, title='{self.title}', status='{self.status}')>"
+
+
+# Число строк-счетчиков на статус: параллельные транзакции пишут в разные
+# строки и не ждут друг друга на блокировке одной горячей строки
+TASK_COUNTER_SHARDS = 16
+
+
+class TaskCounter(Base):
+    """Шардированные счетчики задач по статусам, поддерживаются триггерами на tasks.
+
+    Итог по статусу — сумма по всем шардам; отдельный шард может быть отрицательным.
+    """
+    __tablename__ = 'task_counters'
+
+    status = Column(String(20), primary_key=True)
+    shard = Column(SmallInteger, primary_key=True)
+    count = Column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<TaskCounter(status='{self.status}', shard={self.shard}, count={self.count})>"
+
+
+# Триггеры уровня оператора с таблицами переходов: один UPSERT на статус за
+# оператор, поэтому пакетные INSERT, COPY и UPDATE ... WHERE id = ANY(...) не
+# платят за каждую строку. Строки счетчиков обновляются в порядке статусов,
+# чтобы две транзакции на одном шарде не взаимоблокировались.
+# %% в тексте DDL — экранированный оператор %
+_COUNTER_DELTAS = {
+    "insert": "SELECT status, 1 AS delta FROM new_rows",
+    "delete": "SELECT status, -1 AS delta FROM old_rows",
+    "update": "SELECT status, 1 AS delta FROM new_rows UNION ALL SELECT status, -1 AS delta FROM old_rows",
+}
+
+_COUNTER_TRANSITIONS = {
+    "insert": "REFERENCING NEW TABLE AS new_rows",
+    "delete": "REFERENCING OLD TABLE AS old_rows",
+    "update": "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows",
+}
+
+for _operation, _deltas in _COUNTER_DELTAS.items():
+    event.listen(Base.metadata, "after_create", DDL(f"""
+CREATE OR REPLACE FUNCTION task_counters_on_{_operation}() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO task_counters (status, shard, count)
+    SELECT deltas.status, pg_backend_pid() %% {TASK_COUNTER_SHARDS}, sum(deltas.delta)
+    FROM ({_deltas}) AS deltas
+    GROUP BY deltas.status
+    HAVING sum(deltas.delta) <> 0
+    ORDER BY deltas.status
+    ON CONFLICT (status, shard) DO UPDATE SET count = task_counters.count + EXCLUDED.count;
+    RETURN NULL;
+END
+$$"""))
+    event.listen(Base.metadata, "after_create", DDL(f"""
+CREATE OR REPLACE TRIGGER task_counters_{_operation} AFTER {_operation.upper()} ON tasks
+{_COUNTER_TRANSITIONS[_operation]}
+FOR EACH STATEMENT EXECUTE FUNCTION task_counters_on_{_operation}()"""))
+
+event.listen(Base.metadata, "after_create", DDL("""
+CREATE OR REPLACE FUNCTION task_counters_on_truncate() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    DELETE FROM task_counters;
+    RETURN NULL;
+END
+$$"""))
+event.listen(Base.metadata, "after_create", DDL("""
+CREATE OR REPLACE TRIGGER task_counters_truncate AFTER TRUNCATE ON tasks
+FOR EACH STATEMENT EXECUTE FUNCTION task_counters_on_truncate()"""))
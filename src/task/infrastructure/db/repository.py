@@ -1,16 +1,47 @@
+import json
 import logging
 import uuid
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, AsyncIterator, List, Optional, Sequence
 
-from sqlalchemy import select, update, delete
+from sqlalchemy import (
+    Float, Select, String, any_, bindparam, func, insert, literal, select, text, true, update, delete, tuple_
+)
+from sqlalchemy.dialects.postgresql import ARRAY, REGCONFIG, UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .models import Task as DBTask
+from src.core.database.replicas import READ_ONLY
+from .models import Task as DBTask, TaskCounter as DBTaskCounter
 from ...application.interface.task_repository import TaskRepository
-from ...domain.entities import Task, TaskStatus
+from ...domain.entities import DELETABLE_STATUSES, Task, TaskStatistics, TaskStatus, TaskStatusChange
+from ...domain.exeptions.tasks_exeptions import TaskNotFoundError, TaskStatusTransitionError
+from ...domain.queries import (
+    SortDirection, TaskCount, TaskCountMode, TaskCursor, TaskFilter, TaskListQuery, TaskPage, TaskSearchCursor, TaskSearchPage,
+    TaskSearchQuery, TaskSortField, TaskTitleSuggestion, TaskTitleSuggestQuery
+)
 
 logger = logging.getLogger(__name__)
 
+_TASK_COLUMNS = (
+    DBTask.id,
+    DBTask.title,
+    DBTask.description,
+    DBTask.status,
+    DBTask.created_at,
+    DBTask.updated_at,
+)
+
+# Строки БД уже прошли валидацию при записи: статус берется из словаря, а не через TaskStatus(value)
+_STATUS_BY_VALUE = {status.value: status for status in TaskStatus}
+
+# Выше этого размера пачка пишется через COPY, а не через INSERT ... VALUES
+COPY_THRESHOLD = 1000
+
+_SORT_COLUMNS = {
+    TaskSortField.CREATED_AT: DBTask.created_at,
+    TaskSortField.UPDATED_AT: DBTask.updated_at,
+}
+
 
 class DatabaseTaskRepository(TaskRepository):
 
@@ -20,120 +51,371 @@ class DatabaseTaskRepository(TaskRepository):
 
     async def create(self, task: Task) -> Task:
         try:
-            db_task = DBTask(
-                id=uuid.UUID(task.id) if isinstance(task.id, str) else task.id,
-                title=task.title,
-                description=task.description,
-                status=task.status.value,
-                created_at=task.created_at,
-                updated_at=task.updated_at
-            )
+            # id и метки времени сгенерированы в Task.create, перечитывать строку после
+            # вставки незачем: пишем Core INSERT и возвращаем ту же сущность
+            await self._session.execute(insert(DBTask.__table__).values(**self._domain_to_row(task)))
+            await self._session.commit()
+
+            self._logger.info("Создана задача в БД: %s - '%s'", task.id, task.title)
+            return task
+
+        except Exception as e:
+            await self._session.rollback()
+            self._logger.error("Ошибка создания задачи в БД %s: %s", task.id, e)
+            raise
+
+    async def create_many(self, tasks: List[Task]) -> List[Task]:
+        if not tasks:
+            return []
+
+        try:
+            rows = [self._domain_to_row(task) for task in tasks]
+
+            if len(rows) >= COPY_THRESHOLD and self._session.bind.dialect.driver == "asyncpg":
+                await self._copy_rows(rows)
+                created = tasks
+            else:
+                # executemany с RETURNING SQLAlchemy отправляет как многострочные
+                # INSERT ... VALUES, разбитые на пачки по лимиту параметров драйвера
+                stmt = insert(DBTask.__table__).returning(*_TASK_COLUMNS, sort_by_parameter_order=True)
+                result = await self._session.execute(stmt, rows)
+                created = self._rows_to_domain(result.all())
 
-            self._session.add(db_task)
             await self._session.commit()
-            await self._session.refresh(db_task)
 
-            self._logger.info(f"Создана задача в БД: {task.id} - '{task.title}'")
-            return self._db_to_domain(db_task)
+            self._logger.info("Создано %s задач в БД одной пачкой", len(created))
+            return created
 
         except Exception as e:
             await self._session.rollback()
-            self._logger.error(f"Ошибка создания задачи в БД {task.id}: {e}")
+            self._logger.error("Ошибка пакетного создания %s задач в БД: %s", len(tasks), e)
             raise
 
+    async def _copy_rows(self, rows: List[dict]) -> None:
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        columns = [column.name for column in _TASK_COLUMNS]
+
+        await raw_connection.driver_connection.copy_records_to_table(
+            DBTask.__tablename__,
+            records=[tuple(row[column] for column in columns) for row in rows],
+            columns=columns
+        )
+
     async def get_by_id(self, task_id: str) -> Optional[Task]:
         try:
             uid = uuid.UUID(task_id) if isinstance(task_id, str) else task_id
-            stmt = select(DBTask).where(DBTask.id == uid)
+            stmt = select(*_TASK_COLUMNS).where(DBTask.id == uid).execution_options(**READ_ONLY)
             result = await self._session.execute(stmt)
-            db_task = result.scalar_one_or_none()
+            row = result.one_or_none()
 
-            if db_task:
-                self._logger.debug(f"Найдена задача в БД: {task_id}")
-                return self._db_to_domain(db_task)
+            if row:
+                self._logger.debug("Найдена задача в БД: %s", task_id)
+                return self._row_to_domain(row)
 
-            self._logger.debug(f"Задача не найдена в БД: {task_id}")
+            self._logger.debug("Задача не найдена в БД: %s", task_id)
             return None
 
         except Exception as e:
-            self._logger.error(f"Ошибка получения задачи из БД {task_id}: {e}")
+            self._logger.error("Ошибка получения задачи из БД %s: %s", task_id, e)
+            raise
+
+    async def get_version(self, task_id: str) -> Optional[datetime]:
+        try:
+            uid = uuid.UUID(task_id) if isinstance(task_id, str) else task_id
+            stmt = select(DBTask.updated_at).where(DBTask.id == uid).execution_options(**READ_ONLY)
+            return await self._session.scalar(stmt)
+
+        except Exception as e:
+            self._logger.error("Ошибка получения версии задачи из БД %s: %s", task_id, e)
             raise
 
     async def get_all(self) -> List[Task]:
         try:
-            stmt = select(DBTask).order_by(DBTask.created_at.desc())
+            stmt = select(*_TASK_COLUMNS).order_by(DBTask.created_at.desc()).execution_options(**READ_ONLY)
             result = await self._session.execute(stmt)
-            db_tasks = result.scalars().all()
 
-            tasks = [self._db_to_domain(db_task) for db_task in db_tasks]
-            self._logger.debug(f"Получено {len(tasks)} задач из БД")
+            tasks = self._rows_to_domain(result.all())
+            self._logger.debug("Получено %s задач из БД", len(tasks))
             return tasks
 
         except Exception as e:
-            self._logger.error(f"Ошибка получения всех задач из БД: {e}")
+            self._logger.error("Ошибка получения всех задач из БД: %s", e)
             raise
 
-    async def update(self, task: Task) -> Task:
+    async def get_page(self, query: TaskListQuery) -> TaskPage:
         try:
-            uid = uuid.UUID(task.id) if isinstance(task.id, str) else task.id
-            stmt = update(DBTask).where(DBTask.id == uid).values(
-                title=task.title,
-                description=task.description,
-                status=task.status.value,
-                updated_at=task.updated_at
+            stmt = self._build_page_query(query)
+            result = await self._session.execute(stmt)
+            rows = result.all()
+
+            tasks = self._rows_to_domain(rows[:query.limit])
+            next_cursor = None
+            if len(rows) > query.limit:
+                next_cursor = TaskCursor.from_task(tasks[-1], query.sort_field, query.direction)
+
+            self._logger.debug("Получена страница из %s задач из БД", len(tasks))
+            return TaskPage(tasks=tasks, next_cursor=next_cursor)
+
+        except Exception as e:
+            self._logger.error("Ошибка получения страницы задач из БД: %s", e)
+            raise
+
+    async def stream_rows(self, task_filter: TaskFilter, chunk_size: int) -> AsyncIterator[Sequence[Any]]:
+        try:
+            stmt = (
+                self._apply_filter(select(*_TASK_COLUMNS), task_filter)
+                .order_by(DBTask.created_at, DBTask.id)
+                .execution_options(yield_per=chunk_size, **READ_ONLY)
             )
+            result = await self._session.stream(stmt)
+
+            exported = 0
+            async for rows in result.partitions(chunk_size):
+                exported += len(rows)
+                yield rows
+
+            self._logger.info("Выгружено %s задач из БД", exported)
+
+        except Exception as e:
+            self._logger.error("Ошибка потоковой выгрузки задач из БД: %s", e)
+            raise
+
+    async def count(self, task_filter: TaskFilter, mode: TaskCountMode) -> TaskCount:
+        try:
+            if mode == TaskCountMode.NONE:
+                return TaskCount.none()
 
+            # Без диапазонов дат точное число дают счетчики по статусам за O(1)
+            if not task_filter.has_date_range:
+                statistics = await self.get_statistics()
+                value = statistics.by_status[task_filter.status] if task_filter.status else statistics.total
+                return TaskCount(value=value, mode=TaskCountMode.EXACT)
+
+            stmt = self._apply_filter(select(func.count()).select_from(DBTask), task_filter)
+            stmt = stmt.execution_options(**READ_ONLY)
+            if mode == TaskCountMode.EXACT:
+                return TaskCount(value=await self._session.scalar(stmt), mode=TaskCountMode.EXACT)
+
+            return TaskCount(value=await self._estimate_rows(task_filter), mode=TaskCountMode.ESTIMATED)
+
+        except Exception as e:
+            self._logger.error("Ошибка подсчета задач (%s): %s", mode.value, e)
+            raise
+
+    async def _estimate_rows(self, task_filter: TaskFilter) -> int:
+        # Оценка планировщика по статистике таблицы (reltuples и гистограммы столбцов):
+        # запрос только планируется, таблица не читается
+        stmt = self._apply_filter(select(DBTask.id), task_filter)
+        compiled = stmt.compile(self._session.bind, compile_kwargs={"literal_binds": True})
+        plan = await self._session.scalar(text(f"EXPLAIN (FORMAT JSON) {compiled}").execution_options(**READ_ONLY))
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    async def search(self, query: TaskSearchQuery) -> TaskSearchPage:
+        try:
+            result = await self._session.execute(self._build_search_query(query))
+            rows = result.all()
+
+            tasks = self._rows_to_domain(rows[:query.limit])
+            next_cursor = None
+            if len(rows) > query.limit:
+                last = rows[query.limit - 1]
+                next_cursor = TaskSearchCursor(rank=last.rank, id=str(last.id))
+
+            self._logger.debug("Найдено %s задач по запросу '%s'", len(tasks), query.text)
+            return TaskSearchPage(tasks=tasks, next_cursor=next_cursor)
+
+        except Exception as e:
+            self._logger.error("Ошибка полнотекстового поиска задач '%s': %s", query.text, e)
+            raise
+
+    def _build_search_query(self, query: TaskSearchQuery) -> Select:
+        search_text = literal(query.text, String)
+        # MATERIALIZED не дает планировщику подставить выражение в запрос: иначе
+        # в generic-плане prepared statement tsquery разбирается заново для каждой строки
+        ts_query = select(
+            func.websearch_to_tsquery(literal("russian").cast(REGCONFIG), search_text)
+            .op("||")(func.websearch_to_tsquery(literal("simple").cast(REGCONFIG), search_text))
+            .label("query")
+        ).cte("ts_query").prefix_with("MATERIALIZED", dialect="postgresql")
+        rank = func.ts_rank(DBTask.search_vector, ts_query.c.query, 32).label("rank")
+
+        # Отбор идет по GIN-индексу, сортируется только найденное;
+        # rank считается один раз во внутреннем запросе
+        matches = self._apply_filter(
+            select(*_TASK_COLUMNS, rank)
+            .join_from(DBTask, ts_query, true())
+            .where(DBTask.search_vector.op("@@")(ts_query.c.query)),
+            query.filter
+        ).subquery("matches")
+
+        stmt = select(matches)
+        if query.cursor:
+            stmt = stmt.where(
+                tuple_(matches.c.rank, matches.c.id)
+                < tuple_(literal(query.cursor.rank, Float), literal(uuid.UUID(query.cursor.id), PG_UUID))
+            )
+
+        return (
+            stmt.order_by(matches.c.rank.desc(), matches.c.id.desc())
+            .limit(query.limit + 1)
+            .execution_options(**READ_ONLY)
+        )
+
+    async def suggest_titles(self, query: TaskTitleSuggestQuery) -> List[TaskTitleSuggestion]:
+        try:
+            search_text = literal(query.text, String)
+            # word_similarity сравнивает текст с самым похожим фрагментом названия,
+            # поэтому недописанное слово и опечатка находят задачу; <% отбирает
+            # кандидатов по триграммному индексу с порогом pg_trgm.word_similarity_threshold
+            score = func.word_similarity(search_text, DBTask.title).label("score")
+            stmt = (
+                select(DBTask.title, score)
+                .where(search_text.op("<%")(DBTask.title))
+                .distinct()
+                .order_by(score.desc(), DBTask.title)
+                .limit(query.limit)
+                .execution_options(**READ_ONLY)
+            )
             result = await self._session.execute(stmt)
 
-            if result.rowcount == 0:
-                raise ValueError(f"Задача с ID {task.id} не найдена для обновления")
+            suggestions = [TaskTitleSuggestion(title=row.title, score=row.score) for row in result]
+            self._logger.debug("Найдено %s подсказок для '%s'", len(suggestions), query.text)
+            return suggestions
+
+        except Exception as e:
+            self._logger.error("Ошибка получения подсказок названий для '%s': %s", query.text, e)
+            raise
+
+    async def update_fields(
+            self,
+            task_id: str,
+            updated_at: datetime,
+            title: Optional[str] = None,
+            description: Optional[str] = None,
+            status: Optional[TaskStatus] = None
+    ) -> Task:
+        try:
+            uid = uuid.UUID(task_id) if isinstance(task_id, str) else task_id
+            values = {"updated_at": updated_at}
+            if title is not None:
+                values["title"] = title
+            if description is not None:
+                values["description"] = description
+
+            stmt = update(DBTask.__table__).where(DBTask.id == uid)
+            if status is not None:
+                values["status"] = status.value
+                allowed_from = [s.value for s in Task.allowed_source_statuses(status)]
+                stmt = stmt.where(DBTask.status.in_(allowed_from))
+
+            result = await self._session.execute(stmt.values(**values).returning(*_TASK_COLUMNS))
+            row = result.one_or_none()
+
+            if row is None:
+                # Строка не обновлена: выясняем, отсутствует ли задача или запрещен переход
+                current_status = await self._session.scalar(select(DBTask.status).where(DBTask.id == uid))
+                await self._session.rollback()
+                if current_status is None:
+                    raise TaskNotFoundError(str(task_id))
+                raise TaskStatusTransitionError(current_status, status.value)
 
             await self._session.commit()
 
-            updated_task = await self.get_by_id(task.id)
-            if not updated_task:
-                raise ValueError(f"Не удалось получить обновленную задачу {task.id}")
+            self._logger.info("Обновлена задача в БД: %s - '%s'", task_id, row.title)
+            return self._row_to_domain(row)
+
+        except (TaskNotFoundError, TaskStatusTransitionError):
+            raise
+        except Exception as e:
+            await self._session.rollback()
+            self._logger.error("Ошибка обновления задачи в БД %s: %s", task_id, e)
+            raise
+
+    async def change_status_many(
+            self, task_ids: List[str], new_status: TaskStatus, updated_at: datetime
+    ) -> List[TaskStatusChange]:
+        try:
+            ids = bindparam("ids", [uuid.UUID(task_id) for task_id in task_ids], type_=ARRAY(PG_UUID(as_uuid=True)))
+            allowed_from = bindparam(
+                "allowed_from",
+                [status.value for status in Task.allowed_source_statuses(new_status)],
+                type_=ARRAY(String)
+            )
+
+            # Один запрос: блокируем найденные строки, обновляем те, чей текущий
+            # статус допускает переход, и возвращаем исходный статус каждой строки
+            target = (
+                select(DBTask.id, DBTask.status)
+                .where(DBTask.id == any_(ids))
+                .with_for_update()
+                .cte("target")
+            )
+            changed = (
+                update(DBTask)
+                .where(DBTask.id == target.c.id, target.c.status == any_(allowed_from))
+                .values(status=new_status.value, updated_at=updated_at)
+                .returning(DBTask.id)
+                .cte("changed")
+            )
+            stmt = (
+                select(target.c.id, target.c.status, changed.c.id.is_not(None).label("applied"))
+                .select_from(target.outerjoin(changed, changed.c.id == target.c.id))
+            )
+
+            result = await self._session.execute(stmt)
+            changes = [
+                TaskStatusChange(task_id=str(row.id), from_status=TaskStatus(row.status), applied=row.applied)
+                for row in result
+            ]
+            await self._session.commit()
 
-            self._logger.info(f"Обновлена задача в БД: {task.id} - '{task.title}'")
-            return updated_task
+            applied = sum(1 for change in changes if change.applied)
+            self._logger.info("Статус '%s' установлен для %s из %s задач в БД", new_status.value, applied, len(task_ids))
+            return changes
 
         except Exception as e:
             await self._session.rollback()
-            self._logger.error(f"Ошибка обновления задачи в БД {task.id}: {e}")
+            self._logger.error("Ошибка пакетной смены статуса в БД: %s", e)
             raise
 
-    async def delete(self, task_id: str) -> bool:
+    async def delete_returning(self, task_id: str) -> Optional[Task]:
         try:
             uid = uuid.UUID(task_id) if isinstance(task_id, str) else task_id
-            stmt = delete(DBTask).where(DBTask.id == uid)
-            result = await self._session.execute(stmt)
+            stmt = delete(DBTask.__table__).where(DBTask.id == uid)
+            if DELETABLE_STATUSES != frozenset(TaskStatus):
+                stmt = stmt.where(DBTask.status.in_([status.value for status in DELETABLE_STATUSES]))
+
+            result = await self._session.execute(stmt.returning(*_TASK_COLUMNS))
+            row = result.one_or_none()
             await self._session.commit()
 
-            success = result.rowcount > 0
-            if success:
-                self._logger.info(f"Удалена задача из БД: {task_id}")
-            else:
-                self._logger.warning(f"Попытка удалить несуществующую задачу: {task_id}")
+            if row is None:
+                self._logger.debug("Задача не удалена из БД: %s", task_id)
+                return None
 
-            return success
+            self._logger.info("Удалена задача из БД: %s", task_id)
+            return self._row_to_domain(row)
 
         except Exception as e:
             await self._session.rollback()
-            self._logger.error(f"Ошибка удаления задачи из БД {task_id}: {e}")
+            self._logger.error("Ошибка удаления задачи из БД %s: %s", task_id, e)
             raise
 
     async def exists(self, task_id: str) -> bool:
         try:
             uid = uuid.UUID(task_id) if isinstance(task_id, str) else task_id
-            stmt = select(DBTask.id).where(DBTask.id == uid)
+            stmt = select(DBTask.id).where(DBTask.id == uid).execution_options(**READ_ONLY)
             result = await self._session.execute(stmt)
             exists = result.scalar_one_or_none() is not None
 
-            self._logger.debug(f"Проверка существования задачи {task_id}: {exists}")
+            self._logger.debug("Проверка существования задачи %s: %s", task_id, exists)
             return exists
 
         except Exception as e:
-            self._logger.error(f"Ошибка проверки существования задачи {task_id}: {e}")
+            self._logger.error("Ошибка проверки существования задачи %s: %s", task_id, e)
             return False
 
     async def find_by_numeric_id(self, numeric_id: int) -> Optional[Task]:
@@ -141,80 +423,102 @@ class DatabaseTaskRepository(TaskRepository):
 
     async def get_by_status(self, status: str) -> List[Task]:
         try:
-            stmt = select(DBTask).where(DBTask.status == status).order_by(DBTask.created_at.desc())
+            stmt = (
+                select(*_TASK_COLUMNS)
+                .where(DBTask.status == status)
+                .order_by(DBTask.created_at.desc())
+                .execution_options(**READ_ONLY)
+            )
             result = await self._session.execute(stmt)
-            db_tasks = result.scalars().all()
 
-            tasks = [self._db_to_domain(db_task) for db_task in db_tasks]
-            self._logger.debug(f"Получено {len(tasks)} задач со статусом '{status}' из БД")
+            tasks = self._rows_to_domain(result.all())
+            self._logger.debug("Получено %s задач со статусом '%s' из БД", len(tasks), status)
             return tasks
 
         except Exception as e:
-            self._logger.error(f"Ошибка получения задач по статусу '{status}' из БД: {e}")
+            self._logger.error("Ошибка получения задач по статусу '%s' из БД: %s", status, e)
             raise
 
-    def _db_to_domain(self, db_task: DBTask) -> Task:
-        try:
-            return Task(
-                id=str(db_task.id),
-                title=db_task.title,
-                description=db_task.description,
-                status=TaskStatus(db_task.status),
-                created_at=db_task.created_at,
-                updated_at=db_task.updated_at
-            )
-        except Exception as e:
-            self._logger.error(f"Ошибка конвертации DBTask в Task (ID: {db_task.id}): {e}")
-            raise
-
-    def _domain_to_db(self, task: Task) -> DBTask:
-        try:
-            return DBTask(
-                id=uuid.UUID(task.id) if isinstance(task.id, str) else task.id,
-                title=task.title,
-                description=task.description,
-                status=task.status.value,
-                created_at=task.created_at,
-                updated_at=task.updated_at
-            )
-        except Exception as e:
-            self._logger.error(f"Ошибка конвертации Task в DBTask (ID: {task.id}): {e}")
-            raise
+    def _apply_filter(self, stmt: Select, task_filter: TaskFilter) -> Select:
+        if task_filter.status is not None:
+            stmt = stmt.where(DBTask.status == task_filter.status.value)
+        if task_filter.created_from is not None:
+            stmt = stmt.where(DBTask.created_at >= task_filter.created_from)
+        if task_filter.created_to is not None:
+            stmt = stmt.where(DBTask.created_at < task_filter.created_to)
+        if task_filter.updated_from is not None:
+            stmt = stmt.where(DBTask.updated_at >= task_filter.updated_from)
+        if task_filter.updated_to is not None:
+            stmt = stmt.where(DBTask.updated_at < task_filter.updated_to)
+        return stmt
+
+    def _build_page_query(self, query: TaskListQuery) -> Select:
+        sort_column = _SORT_COLUMNS[query.sort_field]
+        descending = query.direction == SortDirection.DESC
+
+        stmt = self._apply_filter(select(*_TASK_COLUMNS), query.filter)
+
+        if query.cursor:
+            position = tuple_(sort_column, DBTask.id)
+            boundary = tuple_(query.cursor.value, uuid.UUID(query.cursor.id))
+            stmt = stmt.where(position < boundary if descending else position > boundary)
+
+        if descending:
+            stmt = stmt.order_by(sort_column.desc(), DBTask.id.desc())
+        else:
+            stmt = stmt.order_by(sort_column.asc(), DBTask.id.asc())
+
+        return stmt.limit(query.limit + 1).execution_options(**READ_ONLY)
+
+    def _row_to_domain(self, row) -> Task:
+        return Task.from_trusted(
+            id=str(row.id),
+            title=row.title,
+            description=row.description,
+            status=_STATUS_BY_VALUE[row.status],
+            created_at=row.created_at,
+            updated_at=row.updated_at
+        )
+
+    def _rows_to_domain(self, rows: Sequence[Any]) -> List[Task]:
+        # Строки из select(*_TASK_COLUMNS, ...): поля берутся по позиции, без ORM-сущностей и identity map
+        from_trusted = Task.from_trusted
+        return [
+            from_trusted(str(row[0]), row[1], row[2], _STATUS_BY_VALUE[row[3]], row[4], row[5])
+            for row in rows
+        ]
+
+    def _domain_to_row(self, task: Task) -> dict:
+        return {
+            "id": uuid.UUID(task.id) if isinstance(task.id, str) else task.id,
+            "title": task.title,
+            "description": task.description,
+            "status": task.status.value,
+            "created_at": task.created_at,
+            "updated_at": task.updated_at,
+        }
 
     async def get_count(self) -> int:
-        try:
-            from sqlalchemy import func
-            stmt = select(func.count(DBTask.id))
-            result = await self._session.execute(stmt)
-            count = result.scalar() or 0
-
-            self._logger.debug(f"Общее количество задач в БД: {count}")
-            return count
-
-        except Exception as e:
-            self._logger.error(f"Ошибка получения количества задач: {e}")
-            return 0
+        statistics = await self.get_statistics()
+        return statistics.total
 
-    async def get_statistics(self) -> dict:
+    async def get_statistics(self) -> TaskStatistics:
         try:
-            from sqlalchemy import func
-
-            total_stmt = select(func.count(DBTask.id))
-            total_result = await self._session.execute(total_stmt)
-            total = total_result.scalar() or 0
-
-            status_stmt = select(DBTask.status, func.count(DBTask.id)).group_by(DBTask.status)
-            status_result = await self._session.execute(status_stmt)
-            status_counts = dict(status_result.fetchall())
+            # Читается не больше TASK_COUNTER_SHARDS строк на статус, сколько бы ни было задач
+            stmt = (
+                select(DBTaskCounter.status, func.sum(DBTaskCounter.count))
+                .group_by(DBTaskCounter.status)
+                .execution_options(**READ_ONLY)
+            )
+            result = await self._session.execute(stmt)
+            counts = {status: int(count) for status, count in result}
 
-            statistics = {
-                "total": total,
-                "by_status": status_counts
-            }
+            by_status = {status: counts.get(status.value, 0) for status in TaskStatus}
+            statistics = TaskStatistics(total=sum(by_status.values()), by_status=by_status)
 
-            self._logger.debug(f"Статистика из БД: {statistics}")
+            self._logger.debug("Статистика из БД: %s", statistics)
             return statistics
 
         except Exception as e:
-            self._logger.error(f"Ошибка получения статистики из БД: {e}")
-            return {"total": 0, "by_status": {}}
+            self._logger.error("Ошибка получения статистики из БД: %s", e)
+            raise
@@ -1,8 +1,35 @@
 import pytest
 import asyncio
+import logging
+import os
+from unittest.mock import AsyncMock
 from fastapi.testclient import TestClient
+from sqlalchemy import make_url, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 from main import app
+from src.core.database.config import DATABASE_URL
+from src.task.api.dependencies import get_task_repository
+from src.task.infrastructure.db.models import Base
+
+# Интеграционные тесты пересоздают таблицы, поэтому работают в отдельной базе
+TEST_DATABASE_URL = os.getenv(
+    "TEST_DATABASE_URL",
+    make_url(DATABASE_URL).set(database=f"{make_url(DATABASE_URL).database}_test").render_as_string(hide_password=False)
+)
+
+
+class CollectHandler(logging.Handler):
+    """Складывает текст записей в messages"""
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
 
 
 @pytest.fixture(scope="session")
@@ -32,3 +59,42 @@ def sample_task_update_data():
         "description": "Обновленное описание",
         "status": "в работе"
     }
+
+
+@pytest.fixture
+def collect():
+    return CollectHandler()
+
+
+@pytest.fixture
+def repository():
+    """AsyncMock вместо репозитория задач в зависимостях приложения"""
+    repository = AsyncMock()
+    app.dependency_overrides[get_task_repository] = lambda: repository
+    yield repository
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+async def db_session_maker():
+    """Сессии к пустой тестовой базе со схемой и триггерами, как после init_database"""
+    url = make_url(TEST_DATABASE_URL)
+    admin = create_async_engine(DATABASE_URL, poolclass=NullPool, isolation_level="AUTOCOMMIT")
+    try:
+        async with admin.connect() as conn:
+            exists = await conn.scalar(text("SELECT 1 FROM pg_database WHERE datname = :name"), {"name": url.database})
+            if not exists:
+                await conn.execute(text(f'CREATE DATABASE "{url.database}"'))
+    except (OSError, DBAPIError) as e:
+        pytest.skip(f"PostgreSQL недоступен: {e}")
+    finally:
+        await admin.dispose()
+
+    engine = create_async_engine(url, poolclass=NullPool)
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
@@ -1,6 +1,49 @@
+import asyncio
+import dataclasses
+import logging
+import queue
+import uuid
+from datetime import datetime
+from unittest.mock import AsyncMock
+
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import func, insert, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+import main
+import src.task.api.rest as rest
 from main import app
+from src.core.cache.lru import MISSING, LRUTTLCache
+from src.core.database.config import connect_args
+from src.core.database.replicas import READ_ONLY, ReplicaSet, RoutingSession
+from src.core.database.slow_queries import SlowQueryRecorder, is_explainable, normalize_statement
+from src.core.logging.queue import DROPPED_RECORDS, BoundedQueueHandler, DrainingQueueListener
+from src.core.logging.rate_limit import CallSiteRateLimitFilter, parse_rate_limits
+from src.core.metrics.http import REQUEST_DURATION
+from src.core.metrics.registry import HistogramValue
+from src.task.api.etag import etag_matches, task_etag
+from src.task.api.exeption_handlers import HANDLED_ERRORS
+from src.task.api.export import encode_csv, encode_ndjson
+from src.task.api.models import TaskListResponse
+from src.task.api.responses import TaskListJSONResponse
+from src.task.application.use_case.bulk_change_status import BulkChangeStatusUseCase
+from src.task.application.use_case.bulk_create_tasks import BulkCreateTasksUseCase
+from src.task.application.use_case.delete_task import DeleteTaskUseCase
+from src.task.application.use_case.list_tasks import ListTasksUseCase
+from src.task.application.use_case.update_task import UpdateTaskUseCase
+from src.task.domain.entities import Task, TaskStatistics, TaskStatus, TaskStatusChange
+from src.task.domain.exeptions.tasks_exeptions import (
+    TaskBusinessRuleViolationError, TaskNotFoundError, TaskStatusTransitionError, TaskValidationError
+)
+from src.task.domain.queries import (
+    SortDirection, TaskCount, TaskCountMode, TaskCursor, TaskListQuery, TaskPage, TaskSearchCursor,
+    TaskSearchQuery, TaskSortField, TaskTitleSuggestion, TaskTitleSuggestQuery
+)
+from src.task.infrastructure.cache.repository import CachedTaskRepository
+from src.task.infrastructure.db.counters import reconcile_task_counters
+from src.task.infrastructure.db.models import Task as DBTask, TaskCounter as DBTaskCounter
+from src.task.infrastructure.db.repository import COPY_THRESHOLD, DatabaseTaskRepository
 
 
 def test_health():
@@ -283,3 +326,627 @@ def test_create_task_safe():
 
     except Exception as e:
         pytest.skip("Create task skipped due to async issues")
+
+
+def test_task_cursor_roundtrip():
+    cursor = TaskCursor(
+        sort_field=TaskSortField.UPDATED_AT,
+        direction=SortDirection.ASC,
+        value=datetime(2024, 1, 2, 3, 4, 5, 678),
+        id="123e4567-e89b-12d3-a456-426614174000"
+    )
+    assert TaskCursor.decode(cursor.encode()) == cursor
+
+
+def test_pagination_params_validation():
+    client = TestClient(app)
+
+    response = client.get("/api/tasks", params={"cursor": "не-курсор"})
+    assert response.status_code == 400
+    assert response.json()["error_code"] == "TASK_VALIDATION_ERROR"
+
+    response = client.get("/api/tasks", params={"limit": 0})
+    assert response.status_code == 422
+
+    response = client.get("/api/tasks", params={"limit": 100000})
+    assert response.status_code == 422
+
+
+def test_list_filter_params_validation():
+    client = TestClient(app)
+
+    response = client.get("/api/tasks", params={"status": "неверный_статус"})
+    assert response.status_code == 422
+
+    response = client.get("/api/tasks", params={"sort_by": "title"})
+    assert response.status_code == 422
+
+    response = client.get("/api/tasks", params={"created_from": "2024-02-01", "created_to": "2024-01-01"})
+    assert response.status_code == 400
+
+
+def test_cursor_must_match_sort():
+    cursor = TaskCursor(TaskSortField.CREATED_AT, SortDirection.DESC, datetime(2024, 1, 1), "123e4567-e89b-12d3-a456-426614174000")
+
+    with pytest.raises(TaskValidationError):
+        TaskListQuery(cursor=cursor, sort_field=TaskSortField.UPDATED_AT)
+
+
+def test_export_format_validation():
+    client = TestClient(app)
+
+    response = client.get("/api/tasks/export", params={"format": "xml"})
+    assert response.status_code == 422
+
+
+async def test_export_encoders():
+    row = ("123e4567-e89b-12d3-a456-426614174000", "Задача", 'с "кавычками",\nи переносом', "создано",
+           datetime(2024, 1, 1), datetime(2024, 1, 2))
+
+    async def chunks():
+        yield [row, row]
+
+    ndjson = b"".join([chunk async for chunk in encode_ndjson(chunks())]).decode("utf-8")
+    lines = ndjson.splitlines()
+    assert len(lines) == 2
+    assert '"title": "Задача"' in lines[0]
+
+    csv_text = b"".join([chunk async for chunk in encode_csv(chunks())]).decode("utf-8")
+    assert csv_text.startswith("id,title,description,status,created_at,updated_at")
+    assert csv_text.count("2024-01-02T00:00:00") == 2
+
+
+def test_bulk_create_validation():
+    client = TestClient(app)
+
+    response = client.post("/api/tasks/bulk", json={"tasks": []})
+    assert response.status_code == 422
+
+    response = client.post("/api/tasks/bulk", json={"tasks": [{"description": "без названия"}]})
+    assert response.status_code == 422
+
+
+async def test_bulk_create_use_case_reports_per_item_results():
+    repository = AsyncMock()
+    repository.create_many.side_effect = lambda tasks: tasks
+
+    results = await BulkCreateTasksUseCase(repository).execute(
+        [("Первая", ""), ("   ", ""), ("x" * 201, ""), ("Вторая", "описание")]
+    )
+
+    assert [result.index for result in results] == [0, 1, 2, 3]
+    assert [result.task is not None for result in results] == [True, False, False, True]
+    assert results[2].error.error_code == "TASK_VALIDATION_ERROR"
+    assert len(repository.create_many.call_args.args[0]) == 2
+
+
+def test_allowed_source_statuses_match_transitions():
+    for target in TaskStatus:
+        for source in TaskStatus:
+            task = Task.create("Задача", "").change_status(source)
+            try:
+                allowed = task.validate_transition_to(target)
+            except Exception:
+                allowed = False
+            assert (source in Task.allowed_source_statuses(target)) == allowed
+
+
+def test_bulk_status_validation():
+    client = TestClient(app)
+
+    response = client.patch("/api/tasks/status", json={"ids": [], "status": "завершено"})
+    assert response.status_code == 422
+
+    response = client.patch("/api/tasks/status", json={"ids": ["not-a-uuid"], "status": "завершено"})
+    assert response.status_code == 422
+
+    response = client.patch(
+        "/api/tasks/status", json={"ids": ["123e4567-e89b-12d3-a456-426614174000"], "status": "invalid"}
+    )
+    assert response.status_code == 422
+
+
+async def test_bulk_status_use_case_reports_rejections():
+    repository = AsyncMock()
+    repository.change_status_many.return_value = [
+        TaskStatusChange("a", TaskStatus.CREATED, True),
+        TaskStatusChange("b", TaskStatus.COMPLETED, False),
+    ]
+
+    result = await BulkChangeStatusUseCase(repository).execute(["a", "b", "c", "a"], "создано")
+
+    assert result.updated == ["a"]
+    assert [(item.task_id, item.error.error_code) for item in result.rejected] == [
+        ("b", "TASK_STATUS_TRANSITION_ERROR"),
+        ("c", "TASK_NOT_FOUND"),
+    ]
+    assert repository.change_status_many.call_args.args[0] == ["a", "b", "c"]
+
+
+
+async def status_counts(session_maker):
+    """Число задач по статусам: из таблицы tasks и из суммы шардов task_counters"""
+    async with session_maker() as session:
+        actual = dict((await session.execute(select(DBTask.status, func.count()).group_by(DBTask.status))).all())
+        counted = dict((await session.execute(
+            select(DBTaskCounter.status, func.sum(DBTaskCounter.count))
+            .group_by(DBTaskCounter.status)
+            .having(func.sum(DBTaskCounter.count) != 0)
+        )).all())
+    return actual, {status: int(count) for status, count in counted.items()}
+
+
+async def test_change_status_many_updates_only_allowed_rows(db_session_maker):
+    created, completed = Task.create("Новая", ""), Task.create("Готовая", "").change_status(TaskStatus.COMPLETED)
+    missing = "123e4567-e89b-12d3-a456-426614174000"
+    async with db_session_maker() as session:
+        await DatabaseTaskRepository(session).create_many([created, completed])
+
+    updated_at = datetime(2030, 1, 1)
+    async with db_session_maker() as session:
+        changes = await DatabaseTaskRepository(session).change_status_many(
+            [created.id, completed.id, missing], TaskStatus.CREATED, updated_at
+        )
+    assert sorted((change.task_id, change.from_status, change.applied) for change in changes) == sorted([
+        (created.id, TaskStatus.CREATED, True),
+        (completed.id, TaskStatus.COMPLETED, False),
+    ])
+
+    async with db_session_maker() as session:
+        rows = dict((await session.execute(select(DBTask.id, DBTask.updated_at))).all())
+    assert rows[uuid.UUID(created.id)] == updated_at
+    assert rows[uuid.UUID(completed.id)] == completed.updated_at
+
+    async with db_session_maker() as session:
+        changes = await DatabaseTaskRepository(session).change_status_many(
+            [created.id, completed.id], TaskStatus.IN_PROGRESS, updated_at
+        )
+    assert all(change.applied for change in changes)
+    actual, counted = await status_counts(db_session_maker)
+    assert actual == counted == {"в работе": 2}
+
+
+async def test_update_use_case_single_repository_call():
+    repository = AsyncMock()
+    repository.update_fields.return_value = Task.create("Новое", "")
+    use_case = UpdateTaskUseCase(repository)
+
+    await use_case.execute("task-id", title="  Новое  ", status="в работе")
+    repository.update_fields.assert_awaited_once()
+    repository.get_by_id.assert_not_awaited()
+    call = repository.update_fields.call_args
+    assert call.kwargs["title"] == "Новое"
+    assert call.kwargs["status"] == TaskStatus.IN_PROGRESS
+
+    with pytest.raises(TaskValidationError):
+        await use_case.execute("task-id", description="x" * 1001)
+
+    repository.update_fields.side_effect = TaskNotFoundError("task-id")
+    with pytest.raises(TaskNotFoundError):
+        await use_case.execute("task-id", title="Новое")
+
+
+
+async def test_update_fields_distinguishes_missing_task_and_forbidden_transition(db_session_maker):
+    task = Task.create("Задача", "Описание").change_status(TaskStatus.COMPLETED)
+    async with db_session_maker() as session:
+        await DatabaseTaskRepository(session).create(task)
+
+    updated_at = datetime(2030, 1, 1)
+    async with db_session_maker() as session:
+        updated = await DatabaseTaskRepository(session).update_fields(task.id, updated_at, title="Новое")
+    assert (updated.title, updated.description, updated.status, updated.updated_at) == (
+        "Новое", "Описание", TaskStatus.COMPLETED, updated_at
+    )
+
+    async with db_session_maker() as session:
+        with pytest.raises(TaskStatusTransitionError):
+            await DatabaseTaskRepository(session).update_fields(
+                task.id, datetime(2031, 1, 1), title="Не сохранится", status=TaskStatus.CREATED
+            )
+    async with db_session_maker() as session:
+        with pytest.raises(TaskNotFoundError):
+            await DatabaseTaskRepository(session).update_fields(
+                "123e4567-e89b-12d3-a456-426614174000", updated_at, status=TaskStatus.IN_PROGRESS
+            )
+
+    async with db_session_maker() as session:
+        assert await DatabaseTaskRepository(session).get_by_id(task.id) == updated
+        updated = await DatabaseTaskRepository(session).update_fields(task.id, updated_at, status=TaskStatus.IN_PROGRESS)
+    assert updated.status == TaskStatus.IN_PROGRESS
+    actual, counted = await status_counts(db_session_maker)
+    assert actual == counted == {"в работе": 1}
+
+
+async def test_delete_use_case_distinguishes_not_found_and_rule_violation():
+    repository = AsyncMock()
+    use_case = DeleteTaskUseCase(repository)
+
+    repository.delete_returning.return_value = Task.create("Задача", "")
+    assert await use_case.execute("task-id") is True
+    repository.exists.assert_not_awaited()
+
+    repository.delete_returning.return_value = None
+    repository.exists.return_value = True
+    with pytest.raises(TaskBusinessRuleViolationError):
+        await use_case.execute("task-id")
+
+    repository.exists.return_value = False
+    with pytest.raises(TaskNotFoundError):
+        await use_case.execute("task-id")
+
+
+def test_lru_ttl_cache_limits_and_expiry():
+    now = [0.0]
+    cache = LRUTTLCache(max_bytes=30, ttl=10, negative_ttl=1, sizeof=lambda value: 10, clock=lambda: now[0])
+
+    for key in ("a", "b", "c"):
+        cache.set(key, key.upper())
+    cache.get("a")
+    cache.set("d", "D")
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == "A"
+    assert cache.stats()["evictions"] == 1
+
+    cache.set("missing", None)
+    assert cache.get("missing") is None
+    now[0] = 2.0
+    assert cache.get("missing") is MISSING
+
+    version = cache.version
+    cache.invalidate("a")
+    assert cache.set("a", "stale", if_version=version) is False
+    assert cache.get("a") is MISSING
+
+
+async def test_cached_repository_hits_and_invalidation():
+    task = Task.create("Задача", "")
+    inner = AsyncMock()
+    inner.get_by_id.return_value = task
+    inner.update_fields.return_value = task
+    repository = CachedTaskRepository(inner, LRUTTLCache(max_bytes=1024 * 1024, ttl=60, negative_ttl=60))
+
+    assert await repository.get_by_id(task.id) == task
+    assert await repository.get_by_id(task.id) == task
+    assert inner.get_by_id.await_count == 1
+
+    await repository.update_fields(task.id, datetime.utcnow(), title="Новое")
+    await repository.get_by_id(task.id)
+    assert inner.get_by_id.await_count == 2
+
+    inner.get_by_id.return_value = None
+    assert await repository.get_by_id("missing") is None
+    assert await repository.get_by_id("missing") is None
+    assert inner.get_by_id.await_count == 3
+
+
+def test_etag_matching():
+    etag = task_etag("task-id", datetime(2024, 1, 1))
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag != task_etag("task-id", datetime(2024, 1, 2))
+    assert etag_matches(etag, etag)
+    assert etag_matches(f'"other", W/{etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"other"', etag)
+
+
+def test_conditional_get_task_returns_304(repository):
+    task = Task.create("Задача", "")
+    repository.get_by_id.return_value = task
+    repository.get_version.return_value = task.updated_at
+
+    client = TestClient(app)
+    response = client.get(f"/api/tasks/{task.id}")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = client.get(f"/api/tasks/{task.id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+    assert repository.get_by_id.await_count == 1
+
+
+def test_search_query_validation():
+    assert TaskSearchQuery(text="  починить   сервер ").text == "починить сервер"
+    with pytest.raises(TaskValidationError):
+        TaskSearchQuery(text="   ")
+
+    cursor = TaskSearchCursor(rank=0.0607927, id="123e4567-e89b-12d3-a456-426614174000")
+    assert TaskSearchCursor.decode(cursor.encode()) == cursor
+
+    client = TestClient(app)
+    assert client.get("/api/tasks/search").status_code == 422
+    assert client.get("/api/tasks/search", params={"q": "x" * 201}).status_code == 422
+    response = client.get("/api/tasks/search", params={"q": "сервер", "cursor": "не-курсор"})
+    assert response.status_code == 400
+
+
+async def test_title_suggestions_are_cached_by_normalized_text():
+    with pytest.raises(TaskValidationError):
+        TaskTitleSuggestQuery(text="сервер", limit=21)
+
+    inner = AsyncMock()
+    inner.suggest_titles.return_value = [TaskTitleSuggestion(title="Починить сервер", score=0.8)]
+    suggest_cache = LRUTTLCache(max_bytes=1024 * 1024, ttl=60, negative_ttl=60)
+    repository = CachedTaskRepository(inner, LRUTTLCache(max_bytes=1024, ttl=1, negative_ttl=1), suggest_cache)
+
+    first = await repository.suggest_titles(TaskTitleSuggestQuery(text="Серв"))
+    second = await repository.suggest_titles(TaskTitleSuggestQuery(text="  серв "))
+    assert first == second
+    assert inner.suggest_titles.await_count == 1
+
+    await repository.suggest_titles(TaskTitleSuggestQuery(text="серв", limit=5))
+    assert inner.suggest_titles.await_count == 2
+
+
+def test_task_stats_endpoint_reports_every_status(repository):
+    repository.get_statistics.return_value = TaskStatistics(
+        total=3,
+        by_status={TaskStatus.CREATED: 2, TaskStatus.IN_PROGRESS: 0, TaskStatus.COMPLETED: 1}
+    )
+
+    response = TestClient(app).get("/api/tasks/stats")
+    assert response.status_code == 200
+    assert response.json() == {"total": 3, "by_status": {"создано": 2, "в работе": 0, "завершено": 1}}
+
+
+
+async def test_counter_triggers_follow_every_write_path(db_session_maker):
+    async def assert_counters_match():
+        actual, counted = await status_counts(db_session_maker)
+        assert actual == counted
+        async with db_session_maker() as session:
+            statistics = await DatabaseTaskRepository(session).get_statistics()
+        assert statistics.total == sum(actual.values())
+        return actual
+
+    single = Task.create("Одна", "")
+    async with db_session_maker() as session:
+        await DatabaseTaskRepository(session).create(single)
+        await DatabaseTaskRepository(session).create_many([Task.create(f"Пачка {i}", "") for i in range(10)])
+        await DatabaseTaskRepository(session).create_many(
+            [Task.create(f"COPY {i}", "").change_status(TaskStatus.COMPLETED) for i in range(COPY_THRESHOLD)]
+        )
+    assert await assert_counters_match() == {"создано": 11, "завершено": COPY_THRESHOLD}
+
+    async with db_session_maker() as session:
+        ids = [str(task_id) for task_id in (await session.scalars(select(DBTask.id).limit(300))).all()]
+        await DatabaseTaskRepository(session).change_status_many(ids, TaskStatus.IN_PROGRESS, datetime(2030, 1, 1))
+    assert (await assert_counters_match())["в работе"] == 300
+
+    async with db_session_maker() as session:
+        await DatabaseTaskRepository(session).delete_returning(single.id)
+    assert sum((await assert_counters_match()).values()) == 10 + COPY_THRESHOLD
+
+    async with db_session_maker() as session:
+        await session.execute(text("TRUNCATE tasks"))
+        await session.commit()
+    assert await assert_counters_match() == {}
+
+
+
+async def test_concurrent_counter_reconciliation_corrects_once(db_session_maker):
+    async with db_session_maker() as session:
+        await DatabaseTaskRepository(session).create_many([Task.create(f"Задача {i}", "") for i in range(5)])
+        await session.execute(text("UPDATE task_counters SET count = count + 3 WHERE status = 'создано'"))
+        await session.execute(text("INSERT INTO task_counters VALUES ('завершено', 0, 2)"))
+        await session.commit()
+
+    results = await asyncio.gather(*(reconcile_task_counters(db_session_maker) for _ in range(3)))
+    assert sorted(results, key=len) == [{}, {}, {"завершено": -2, "создано": -3}]
+    actual, counted = await status_counts(db_session_maker)
+    assert actual == counted == {"создано": 5}
+
+
+async def test_list_use_case_counts_only_when_requested():
+    repository = AsyncMock()
+    repository.get_page.return_value = TaskPage(tasks=[])
+    repository.count.return_value = TaskCount(value=1200, mode=TaskCountMode.ESTIMATED)
+    use_case = ListTasksUseCase(repository)
+
+    page = await use_case.execute(TaskListQuery(count_mode=TaskCountMode.NONE))
+    assert page.total == TaskCount.none()
+    repository.count.assert_not_awaited()
+
+    page = await use_case.execute(TaskListQuery(count_mode=TaskCountMode.ESTIMATED))
+    assert page.total.value == 1200
+    assert page.total.mode == TaskCountMode.ESTIMATED
+
+
+def test_fast_list_response_matches_pydantic_model(monkeypatch, repository):
+    tasks = [Task.create("Задача \"в кавычках\"", "Описание\tс табом"), Task.create("Вторая", "")]
+    tasks[1] = dataclasses.replace(tasks[1], status=TaskStatus.IN_PROGRESS)
+    page = TaskPage(
+        tasks=tasks,
+        next_cursor=TaskCursor.from_task(tasks[1], TaskSortField.CREATED_AT, SortDirection.DESC),
+        total=TaskCount(value=2, mode=TaskCountMode.EXACT)
+    )
+    expected = TaskListResponse.from_domain_page(page).model_dump_json().encode()
+    assert TaskListJSONResponse(page).body == expected
+
+    schema_before = TestClient(app).get("/openapi.json").json()["paths"]["/api/tasks"]
+    repository.get_page.return_value = page
+    repository.count.return_value = page.total
+    monkeypatch.setattr(rest, "FAST_JSON_ENABLED", True)
+
+    response = TestClient(app).get("/api/tasks", params={"count": "exact"})
+    assert response.status_code == 200
+    assert response.content == expected
+    assert response.headers["etag"]
+    assert response.headers["content-type"] == "application/json"
+    assert TestClient(app).get("/openapi.json").json()["paths"]["/api/tasks"] == schema_before
+
+
+def test_trusted_task_hydration_skips_validation():
+    task = Task.create("Задача", "Описание")
+    trusted = Task.from_trusted(
+        task.id, task.title, task.description, task.status, task.created_at, task.updated_at
+    )
+    assert trusted == task
+    assert not hasattr(trusted, "__dict__")
+
+    with pytest.raises(TaskValidationError):
+        Task(task.id, "x" * 201, "", task.status, task.created_at, task.updated_at)
+    long_title = Task.from_trusted(task.id, "x" * 201, "", task.status, task.created_at, task.updated_at)
+    assert len(long_title.title) == 201
+
+
+def test_pool_settings_and_stats_endpoint():
+    assert connect_args(pgbouncer_mode=False, statement_cache_size=50) == {"prepared_statement_cache_size": 50}
+    pgbouncer = connect_args(pgbouncer_mode=True, statement_cache_size=50)
+    assert pgbouncer["statement_cache_size"] == 0 and pgbouncer["prepared_statement_cache_size"] == 0
+    assert pgbouncer["prepared_statement_name_func"]() != pgbouncer["prepared_statement_name_func"]()
+
+    histogram = HistogramValue((0.01, 0.1))
+    for value in (0.005, 0.05, 0.05, 3.0):
+        histogram.observe(value)
+    assert histogram.snapshot()["buckets"] == {"0.01": 1, "0.1": 3, "+Inf": 4}
+
+    response = TestClient(app).get("/internal/pool")
+    assert response.status_code == 200
+    primary = response.json()["primary"]
+    assert {"size", "checked_out", "overflow", "waiters", "checkout_wait_seconds"} <= primary.keys()
+
+
+def test_routing_session_sends_reads_to_replica_until_first_write():
+    primary = create_async_engine("postgresql+asyncpg://user@primary/db")
+    replica_engines = [create_async_engine(f"postgresql+asyncpg://user@replica{i}/db") for i in range(2)]
+    replicas = ReplicaSet(replica_engines, max_lag=5)
+    for replica in replicas._replicas:
+        replica.healthy, replica.lag = True, 0.0
+
+    read = select(DBTask.id).execution_options(**READ_ONLY)
+    first = RoutingSession(bind=primary.sync_engine, replicas=replicas)
+    second = RoutingSession(bind=primary.sync_engine, replicas=replicas)
+    assert first.get_bind(clause=read) is replica_engines[0].sync_engine
+    assert first.get_bind(clause=read) is replica_engines[0].sync_engine
+    assert second.get_bind(clause=read) is replica_engines[1].sync_engine
+
+    assert first.get_bind(clause=select(DBTask.id)) is primary.sync_engine
+    assert first.get_bind(clause=read) is primary.sync_engine
+    assert second.get_bind(clause=insert(DBTask)) is primary.sync_engine
+    assert second.get_bind(clause=read) is primary.sync_engine
+
+    replicas._replicas[0].lag = 30.0
+    replicas._replicas[1].healthy = False
+    lagging = RoutingSession(bind=primary.sync_engine, replicas=replicas)
+    assert lagging.get_bind(clause=read) is primary.sync_engine
+
+
+def test_metrics_endpoint_reports_routes_and_errors():
+    duration = REQUEST_DURATION.labels("GET", "search_tasks", "422")
+    errors = HANDLED_ERRORS.labels("VALIDATION_ERROR")
+    requests_before, errors_before = duration.count, errors.value
+
+    client = TestClient(app)
+    assert client.get("/api/tasks/search").status_code == 422
+    assert duration.count == requests_before + 1
+    assert errors.value == errors_before + 1
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE http_request_duration_seconds histogram" in response.text
+    assert 'http_request_duration_seconds_bucket{method="GET",handler="search_tasks",status="422",le="+Inf"}' in response.text
+    assert f'task_errors_total{{error_code="VALIDATION_ERROR"}} {errors.value}' in response.text
+    assert 'http_requests_in_flight{method="GET",handler="metrics"} 1' in response.text
+
+
+def test_slow_query_recorder_groups_by_statement_shape(monkeypatch):
+    assert normalize_statement(
+        "SELECT * FROM tasks\n WHERE id IN ($1, $2, $3) AND title = 'x''y' LIMIT 50"
+    ) == "SELECT * FROM tasks WHERE id IN (...) AND title = ? LIMIT ?"
+    assert normalize_statement("SELECT tasks_1.id FROM tasks AS tasks_1") == "SELECT tasks_1.id FROM tasks AS tasks_1"
+    assert is_explainable("WITH q AS (SELECT 1) SELECT * FROM q")
+    assert not is_explainable("WITH t AS (SELECT id FROM tasks FOR UPDATE) UPDATE tasks SET status = $1")
+    assert not is_explainable("DELETE FROM tasks WHERE id = $1")
+    for lock_clause in ("FOR UPDATE", "FOR NO KEY UPDATE", "FOR SHARE", "FOR KEY SHARE", "for  key\n share"):
+        assert not is_explainable(f"SELECT id FROM tasks WHERE id = $1 {lock_clause} SKIP LOCKED")
+
+    recorder = SlowQueryRecorder(threshold_ms=100, max_statements=2, explain=False)
+    recorder.record("primary", "SELECT * FROM tasks WHERE id = $1", 0.2)
+    recorder.record("primary", "SELECT *  FROM tasks WHERE id = $1", 0.4)
+    recorder.record("primary", "SELECT count(*) FROM tasks", 0.3)
+    recorder.record("primary", "SELECT * FROM tasks WHERE id = $1", 0.1)
+    recorder.record("primary", "SELECT * FROM task_counters", 1.0)
+
+    snapshot = recorder.snapshot()
+    assert snapshot["evictions"] == 1
+    by_statement = {entry["statement"]: entry for entry in snapshot["statements"]}
+    assert set(by_statement) == {"SELECT * FROM tasks WHERE id = ?", "SELECT * FROM task_counters"}
+    lookup = by_statement["SELECT * FROM tasks WHERE id = ?"]
+    assert lookup["calls"] == 3 and lookup["max_ms"] == 400.0 and lookup["total_ms"] == 700.0
+
+    assert TestClient(app).get("/internal/slow-queries").status_code == 404
+    monkeypatch.setattr(main, "DB_SLOW_QUERY_ENDPOINTS_ENABLED", True)
+    client = TestClient(main.create_app())
+    assert client.get("/internal/slow-queries").status_code == 200
+    assert client.delete("/internal/slow-queries").status_code == 204
+
+
+def test_bounded_log_queue_drops_on_overflow_and_drains_on_stop(collect):
+    log_queue = queue.Queue(maxsize=2)
+    handler = BoundedQueueHandler(log_queue, policy="drop")
+    logger = logging.getLogger("tests.bounded_log_queue")
+    logger.handlers = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    dropped = DROPPED_RECORDS.labels(logger.name)
+    dropped_before = dropped.value
+
+    for i in range(5):
+        logger.info("запись %s", i)
+    assert handler.dropped == 3
+    assert dropped.value == dropped_before + 3
+
+    listener = DrainingQueueListener(log_queue, collect)
+    listener.start()
+    listener.stop()
+    assert collect.messages == ["запись 0", "запись 1"]
+
+    with pytest.raises(ValueError):
+        BoundedQueueHandler(log_queue, policy="spill")
+
+
+def test_call_site_rate_limit_filter_suppresses_and_summarizes(collect):
+    assert parse_rate_limits("src.task=10:50, root=100,") == {"src.task": (10.0, 50.0), "": (100.0, 100.0)}
+
+    rate_limit = CallSiteRateLimitFilter({"tests.rate": (0.001, 2), "tests.rate.unlimited": (1000, 1000)})
+    collect.addFilter(rate_limit)
+    for name in ("tests.rate.scanner", "tests.rate.unlimited", "tests.other"):
+        logger = logging.getLogger(name)
+        logger.handlers = [collect]
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+
+    for i in range(5):
+        logging.getLogger("tests.rate.scanner").warning("Задача не найдена: %s", i)
+    logging.getLogger("tests.rate.scanner").warning("Другое место вызова")
+    for i in range(3):
+        logging.getLogger("tests.rate.unlimited").info("%s", i)
+        logging.getLogger("tests.other").info("%s", i)
+    assert collect.messages == [
+        "Задача не найдена: 0", "Задача не найдена: 1", "Другое место вызова", "0", "0", "1", "1", "2", "2"
+    ]
+
+    collect.messages.clear()
+    assert rate_limit.emit_summaries() == 1
+    assert collect.messages == ["Подавлено 3 похожих сообщений: Задача не найдена: %s"]
+    assert rate_limit.emit_summaries() == 0
+
+
+def test_call_site_rate_limit_filter_never_suppresses_errors():
+    rate_limit = CallSiteRateLimitFilter({"tests.rate_errors": (0.001, 1)})
+    records = [
+        logging.LogRecord("tests.rate_errors", level, __file__, 1, "Ошибка %s", (i,), None)
+        for i in range(100)
+        for level in (logging.ERROR, logging.CRITICAL)
+    ]
+    assert all(rate_limit.filter(record) for record in records)
+
+    warning = logging.LogRecord("tests.rate_errors", logging.WARNING, __file__, 1, "Предупреждение", (), None)
+    assert rate_limit.filter(warning)
+    assert not rate_limit.filter(warning)
+    assert rate_limit.emit_summaries() == 1